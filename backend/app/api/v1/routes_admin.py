@@ -1,15 +1,26 @@
 # app/api/v1/routes_admin.py
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
+from app.core.coherence import cache_coherence
+from app.core.profiling import profile_store
+from app.core.security import password_hasher
+from app.core.slow_query import TOP_ORDERINGS, slow_query_log
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.scholarship import Scholarship
 from app.models.application import Application
 from app.schemas.suitability import SuitabilityResult
 from app.services.application_service import evaluate_application_suitability
+from app.services.user_import_service import IMPORT_FORMATS, bulk_import_users, parse_user_rows
 from app.auth import service as auth_service
-from app.auth.schemas import UserAdminUpdate
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.schemas import UserAdminPage, UserAdminUpdate, UserImportReport, UserRead
 
 router = APIRouter(
     prefix="/admin",   # <-- keep this
@@ -19,7 +30,7 @@ router = APIRouter(
 @router.get("/summary")
 def admin_summary(
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
 ):
     total_scholarships = db.query(Scholarship).count()
     total_users = db.query(User).count()
@@ -43,20 +54,105 @@ def admin_summary(
     }
 
 
-@router.get("/users")
+@router.get("/metrics/hashing")
+def password_hashing_metrics(
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """Queue depth, rejections and latency of the password-hashing pool."""
+    return password_hasher.stats()
+
+
+@router.get("/slow-queries/top")
+def top_statements(
+    limit: int = Query(20, ge=1, le=200),
+    order_by: str = Query("total", description="total, max, calls or slow"),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """Statement shapes ranked by total time (or max/calls/slow count) in this worker, with plans."""
+    if order_by not in TOP_ORDERINGS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="order_by must be total, max, calls or slow")
+    return slow_query_log.top(limit, order_by)
+
+
+@router.get("/slow-queries/recent")
+def recent_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """Most recent statements over SLOW_QUERY_MS, newest first."""
+    return slow_query_log.recent_entries(limit)
+
+
+@router.get("/profiles")
+def list_profiles(
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """Captured request profiles, newest first (see app.core.profiling)."""
+    return profile_store.list()
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    media_type = "application/json" if path.name.endswith(".json") else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=path.name)
+
+
+@router.get("/users", response_model=UserAdminPage)
 def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    after_id: Optional[int] = Query(None, ge=0, description="Cursor from the previous page"),
+    role: Optional[UserRole] = None,
+    is_active: Optional[bool] = None,
+    email_prefix: Optional[str] = Query(None, min_length=1),
+    q: Optional[str] = Query(None, min_length=1, description="Search first/last name"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
 ):
-    return db.query(User).all()
+    return auth_service.list_users_page(
+        db,
+        limit=limit,
+        after_id=after_id,
+        role=role,
+        is_active=is_active,
+        email_prefix=email_prefix,
+        name=q,
+    )
+
+
+@router.post("/users/import", response_model=UserImportReport)
+async def import_users(
+    request: Request,
+    format: str = Query("csv", description="csv or ndjson"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """
+    Bulk-provision users from a raw CSV (header: email,password,first_name,last_name,role)
+    or NDJSON request body. Returns a per-row error report.
+    """
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="format must be csv or ndjson")
+    raw = await request.body()
+    try:
+        rows = parse_user_rows(raw.decode("utf-8-sig"), format)
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    # Hashing and inserts are blocking; keep them off the event loop.
+    return await run_in_threadpool(bulk_import_users, db, rows)
 
 
-@router.patch("/users/{user_id}")
+@router.patch("/users/{user_id}", response_model=UserRead)
 def update_user_admin(
     user_id: int,
     payload: UserAdminUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
 ):
     user = db.get(User, user_id)
     if not user:
@@ -72,8 +168,10 @@ def update_user_admin(
         user.is_active = payload.is_active
 
     db.add(user)
+    cache_coherence.record(db, "user", user.id)
     db.commit()
     db.refresh(user)
+    principal_cache.invalidate(user.id)
     return user
 
 
@@ -81,13 +179,15 @@ def update_user_admin(
 def delete_user_admin(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
 ):
     user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     db.delete(user)
+    cache_coherence.record(db, "user", user_id)
     db.commit()
+    principal_cache.invalidate(user_id)
     return {"detail": "User deleted"}
 
 
@@ -95,7 +195,7 @@ def delete_user_admin(
 def qualified_applicants_for_scholarship(
     scholarship_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
 ):
     """
     Returns suitability results for all applications to a scholarship.
@@ -1,8 +1,12 @@
 # app/api/v1/routes_applicant_profile.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.auth import service as auth_service
+from app.auth.principal_cache import Principal
+from app.auth.schemas import UserUpdate
+from app.core.conditional import conditional_response, weak_etag
+from app.core.serialization import model_response, schema_fields
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.applicant_profile import ApplicantProfileCreate, ApplicantProfileRead
@@ -11,9 +15,22 @@ from app.services import get_profile_for_user, upsert_applicant_profile
 router = APIRouter(prefix="/applicant/profile", tags=["applicant_profile"])
 
 
+def _profile_response(request: Request, profile) -> Response:
+    # updated_at is CURRENT_TIMESTAMP (whole seconds), so two saves in one second
+    # would share it; the row is loaded anyway, so tag its values instead.
+    etag = weak_etag(*(getattr(profile, name) for name in schema_fields(ApplicantProfileRead)))
+    return conditional_response(
+        request,
+        etag,
+        lambda: model_response(ApplicantProfileRead, profile),
+        last_modified=profile.updated_at,
+    )
+
+
 @router.get("/me", response_model=ApplicantProfileRead)
 def read_my_profile(
-    current_user: User = Depends(auth_service.require_roles(UserRole.APPLICANT)),
+    request: Request,
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.APPLICANT)),
     db: Session = Depends(get_db),
 ):
     profile = get_profile_for_user(db, current_user.id)
@@ -22,13 +39,14 @@ def read_my_profile(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Applicant profile not found",
         )
-    return profile
+    return _profile_response(request, profile)
 
 
 @router.get("/by-user/{user_id}", response_model=ApplicantProfileRead)
 def read_profile_for_user(
     user_id: int,
-    current_user: User = Depends(
+    request: Request,
+    current_user: Principal = Depends(
         auth_service.require_roles(UserRole.REVIEWER, UserRole.ENGR_ADMIN, UserRole.STEWARD)
     ),
     db: Session = Depends(get_db),
@@ -42,28 +60,24 @@ def read_profile_for_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Applicant profile not found",
         )
-    return profile
+    return _profile_response(request, profile)
 
 
 @router.put("/me", response_model=ApplicantProfileRead, status_code=status.HTTP_200_OK)
 def upsert_my_profile(
     payload: ApplicantProfileCreate,
-    current_user: User = Depends(auth_service.require_roles(UserRole.APPLICANT)),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.APPLICANT)),
     db: Session = Depends(get_db),
 ):
-    profile = upsert_applicant_profile(db, current_user, payload)
+    profile = upsert_applicant_profile(db, current_user.id, payload)
 
     # Update the user's name if provided during onboarding
-    updated_user = False
-    if payload.first_name is not None:
-        current_user.first_name = payload.first_name
-        updated_user = True
-    if payload.last_name is not None:
-        current_user.last_name = payload.last_name
-        updated_user = True
-    if updated_user:
-        db.add(current_user)
-        db.commit()
-        db.refresh(current_user)
+    if payload.first_name is not None or payload.last_name is not None:
+        user = db.get(User, current_user.id)
+        auth_service.update_user(
+            db,
+            user,
+            UserUpdate(first_name=payload.first_name, last_name=payload.last_name),
+        )
 
     return profile
@@ -2,27 +2,28 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.core.conditional import conditional_response, weak_etag
+from app.core.serialization import model_response, models_response, rows_response
 from app.database import get_db
 from app.schemas.application import ApplicationCreate, ApplicationRead, ApplicationStatusUpdate
 from app.schemas.suitability import SuitabilityResult
 from app.schemas.review import ReviewCreate, ReviewRead
 from app.services import (
     create_application,
-    list_applications_for_user,
     get_application,
     assign_reviewer,
-    list_applications_for_reviewer,
-    list_all_applications,
+    list_application_rows,
+    application_rows_version,
     upsert_review,
     list_reviews_for_application,
     list_reviews_for_reviewer,
+    reviews_version,
     update_application_status,
     evaluate_application_suitability,
-    create_notification,
- 
+    notify_user,
 )
 
 router = APIRouter(prefix="/applications", tags=["applications"])
@@ -54,19 +55,24 @@ def create_application_endpoint(
 @router.get("/by-user/{user_id}", response_model=List[ApplicationRead])
 def list_applications_for_user_endpoint(
     user_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     List all applications for a given user.
     (Handy later for applicant/reviewer views.)
     """
-    apps = list_applications_for_user(db, user_id)
-    return apps
+    return conditional_response(
+        request,
+        weak_etag(application_rows_version(db, user_id=user_id)),
+        lambda: rows_response(ApplicationRead, list_application_rows(db, user_id=user_id)),
+    )
 
 
 @router.get("/{application_id}", response_model=ApplicationRead)
 def get_application_endpoint(
     application_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -78,18 +84,27 @@ def get_application_endpoint(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found",
         )
-    return app_obj
+    return conditional_response(
+        request,
+        weak_etag(app_obj.id, app_obj.updated_at),
+        lambda: model_response(ApplicationRead, app_obj),
+        last_modified=app_obj.updated_at,
+    )
 
 @router.get("/", response_model=List[ApplicationRead])
 def list_all_applications_endpoint(
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     List all applications in the system.
     (In a full system, this would be restricted to ENGR Admins.)
     """
-    apps = list_all_applications(db)
-    return apps
+    return conditional_response(
+        request,
+        weak_etag(application_rows_version(db)),
+        lambda: rows_response(ApplicationRead, list_application_rows(db)),
+    )
 
 
 @router.post("/{application_id}/assign-reviewer/{reviewer_id}", response_model=ApplicationRead)
@@ -104,15 +119,10 @@ def assign_reviewer_endpoint(
     """
     try:
         app_obj = assign_reviewer(db, application_id, reviewer_id)
-        # Notify the reviewer they have a new assignment
+        # Notify the reviewer they have a new assignment (batched into a digest)
         if app_obj:
             message = f"You have been assigned to review application #{application_id}."
-            from app.schemas.notification import NotificationCreate
-
-            create_notification(
-                db,
-                payload=NotificationCreate(user_id=reviewer_id, message=message),
-            )
+            notify_user(db, reviewer_id, message, kind="review_assignment")
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -130,13 +140,17 @@ def assign_reviewer_endpoint(
 @router.get("/assigned/{reviewer_id}", response_model=List[ApplicationRead])
 def list_assigned_applications_for_reviewer_endpoint(
     reviewer_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     List all applications assigned to a specific reviewer.
     """
-    apps = list_applications_for_reviewer(db, reviewer_id)
-    return apps
+    return conditional_response(
+        request,
+        weak_etag(application_rows_version(db, reviewer_id=reviewer_id)),
+        lambda: rows_response(ApplicationRead, list_application_rows(db, reviewer_id=reviewer_id)),
+    )
 
 
 @router.get("/{application_id}/suitability", response_model=SuitabilityResult)
@@ -180,12 +194,17 @@ def create_or_update_review_endpoint(
 )
 def list_reviews_for_application_endpoint(
     application_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     List all reviews for a specific application.
     """
-    return list_reviews_for_application(db, application_id)
+    return conditional_response(
+        request,
+        weak_etag(reviews_version(db, application_id=application_id)),
+        lambda: models_response(ReviewRead, list_reviews_for_application(db, application_id)),
+    )
 
 
 @router.get(
@@ -194,12 +213,17 @@ def list_reviews_for_application_endpoint(
 )
 def list_reviews_for_reviewer_endpoint(
     reviewer_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     List all reviews submitted by a specific reviewer.
     """
-    return list_reviews_for_reviewer(db, reviewer_id)
+    return conditional_response(
+        request,
+        weak_etag(reviews_version(db, reviewer_id=reviewer_id)),
+        lambda: models_response(ReviewRead, list_reviews_for_reviewer(db, reviewer_id)),
+    )
 
 
 @router.patch(
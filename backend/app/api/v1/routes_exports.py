@@ -0,0 +1,70 @@
+# app/api/v1/routes_exports.py
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.auth import service as auth_service
+from app.auth.principal_cache import Principal
+from app.database import get_db
+from app.models.user import UserRole
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    EXPORT_MEDIA_TYPES,
+    applications_export_query,
+    reviews_export_query,
+    stream_export,
+    users_export_query,
+)
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+def _streaming_export(db: Session, stmt: Select, fmt: str, name: str) -> StreamingResponse:
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="format must be csv or ndjson",
+        )
+    return StreamingResponse(
+        stream_export(db, stmt, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/applications")
+def export_applications(
+    format: str = Query("csv", description="csv or ndjson"),
+    scholarship_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """
+    Stream applications joined with applicant profile, scholarship and review aggregates.
+    """
+    name = f"applications-{scholarship_id}" if scholarship_id is not None else "applications"
+    return _streaming_export(db, applications_export_query(scholarship_id), format, name)
+
+
+@router.get("/reviews")
+def export_reviews(
+    format: str = Query("csv", description="csv or ndjson"),
+    scholarship_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    name = f"reviews-{scholarship_id}" if scholarship_id is not None else "reviews"
+    return _streaming_export(db, reviews_export_query(scholarship_id), format, name)
+
+
+@router.get("/users")
+def export_users(
+    format: str = Query("csv", description="csv or ndjson"),
+    role: Optional[UserRole] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    return _streaming_export(db, users_export_query(role), format, "users")
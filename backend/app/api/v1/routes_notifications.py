@@ -1,27 +1,146 @@
 # app/api/v1/routes_notifications.py
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.auth import service as auth_service
+from app.auth.principal_cache import Principal
+from app.core.conditional import conditional_response, weak_etag
+from app.core.serialization import rows_response
 from app.database import get_db
-from app.schemas.notification import NotificationRead, NotificationCreate
+from app.models.user import UserRole
+from app.notifications.hub import load_backlog, notification_hub, stream_events
+from app.schemas.notification import (
+    NotificationBroadcast,
+    NotificationBroadcastResult,
+    NotificationMarkReadResult,
+    NotificationRead,
+    NotificationCreate,
+    NotificationUnreadCount,
+)
 from app.services import (
-    list_notifications_for_user,
     mark_notification_read,
     create_notification,
     list_unread_notifications_for_user,
+    broadcast_notification,
+    get_unread_count,
+    list_notification_page,
+    mark_notifications_read,
+    notification_inbox_version,
 )
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
+def inbox_owner(
+    user_id: int,
+    current_user: Principal = Depends(auth_service.get_current_principal),
+) -> Principal:
+    """The caller, if they may read and change `user_id`'s inbox: its owner or an admin."""
+    if current_user.id != user_id and current_user.role != UserRole.ENGR_ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions",
+        )
+    return current_user
+
+
 @router.get("/user/{user_id}", response_model=List[NotificationRead])
 def list_notifications_for_user_endpoint(
+    user_id: int,
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, description="Id of the last notification on the previous page"),
+    unread_only: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Newest first, one page at a time; pass the last id returned as `before_id`.
+    """
+    # The version is a couple of index seeks; a 304 never runs the page query.
+    version = notification_inbox_version(db, user_id)
+    return conditional_response(
+        request,
+        weak_etag(*version, limit, before_id, unread_only),
+        lambda: rows_response(
+            NotificationRead,
+            list_notification_page(db, user_id, limit=limit, before_id=before_id, unread_only=unread_only),
+        ),
+    )
+
+
+@router.get("/user/{user_id}/unread-count", response_model=NotificationUnreadCount)
+def unread_count_endpoint(
     user_id: int,
     db: Session = Depends(get_db),
+    current_user: Principal = Depends(inbox_owner),
 ):
-    return list_notifications_for_user(db, user_id)
+    return {"unread": get_unread_count(db, user_id)}
+
+
+@router.post("/user/{user_id}/mark-all-read", response_model=NotificationMarkReadResult)
+def mark_all_read_endpoint(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(inbox_owner),
+):
+    return {"updated": mark_notifications_read(db, user_id)}
+
+
+@router.post("/user/{user_id}/mark-read", response_model=NotificationMarkReadResult)
+def mark_read_endpoint(
+    user_id: int,
+    ids: List[int] = Query(..., description="Notification ids to mark read"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(inbox_owner),
+):
+    return {"updated": mark_notifications_read(db, user_id, ids)}
+
+
+@router.get("/stream")
+async def stream_notifications_endpoint(
+    request: Request,
+    last_event_id: Optional[int] = Query(None, description="Resume point when Last-Event-ID can't be sent"),
+    current_user: Principal = Depends(auth_service.get_stream_principal),
+    db: Session = Depends(get_db),
+):
+    """
+    Server-sent events for the current user's notifications. Sends
+    `notification` and `read` events plus a heartbeat comment; reconnecting
+    with Last-Event-ID replays anything missed.
+    """
+    header_id = request.headers.get("last-event-id", "")
+    resume_from = int(header_id) if header_id.isdigit() else last_event_id
+
+    # The stream outlives the request session, so use private sessions on its bind.
+    bind = db.get_bind()
+
+    def session_factory() -> Session:
+        return Session(bind=bind)
+
+    sub = notification_hub.subscribe(current_user.id)
+
+    def prepare():
+        with session_factory() as stream_db:
+            notification_hub.prime(stream_db)
+            if resume_from is None:
+                return []
+            return load_backlog(stream_db, current_user.id, resume_from)
+
+    try:
+        backlog = await run_in_threadpool(prepare)
+    except Exception:
+        notification_hub.unsubscribe(sub)
+        raise
+    notification_hub.ensure_poller(session_factory)
+    return StreamingResponse(
+        stream_events(sub, backlog, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/", response_model=NotificationRead, status_code=status.HTTP_201_CREATED)
@@ -34,6 +153,22 @@ def create_notification_endpoint(
     return notif
 
 
+@router.post(
+    "/broadcast",
+    response_model=NotificationBroadcastResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def broadcast_notification_endpoint(
+    payload: NotificationBroadcast,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN)),
+):
+    """
+    Notify every applicant of a scholarship, all reviewers, a role, or a list of users.
+    """
+    return {"count": broadcast_notification(db, payload)}
+
+
 @router.get("/user/{user_id}/unread", response_model=List[NotificationRead])
 def list_unread_notifications_for_user_endpoint(
     user_id: int,
@@ -1,19 +1,23 @@
 # app/api/v1/routes_scholarships.py
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.core.compression import precompressed_response
+from app.core.conditional import conditional_response, weak_etag
+from app.core.serialization import encode_rows, rows_response
 from app.database import get_db
 from app.schemas import ScholarshipCreate, ScholarshipRead, ScholarshipUpdate
 from app.schemas.suitability import SuitabilityResult
+from app.services.catalog_cache import scholarship_catalog
 from app.services import (
-    list_scholarships,
+    list_scholarship_rows,
+    scholarship_rows_version,
     create_scholarship,
     get_scholarship,
     update_scholarship,
     delete_scholarship,
-    search_scholarships as search_scholarships_service,
     evaluate_application_suitability,
     list_all_applications,
 )
@@ -22,21 +26,34 @@ router = APIRouter(tags=["scholarships"])
 
 
 @router.get("/scholarships/", response_model=List[ScholarshipRead])
-def get_scholarships(db: Session = Depends(get_db)):
-    return list_scholarships(db)
+def get_scholarships(request: Request, db: Session = Depends(get_db)):
+    # Cached as JSON plus ETag and per-encoding compressed bytes; see app.services.catalog_cache
+    def build():
+        etag = weak_etag(scholarship_rows_version(db))
+        return encode_rows(ScholarshipRead, list_scholarship_rows(db)), etag
+
+    entry = scholarship_catalog.get(build)
+    return conditional_response(
+        request,
+        entry.etag,
+        lambda: precompressed_response(entry.body, request.headers.get("accept-encoding"), entry.encoded),
+    )
 
 
 # 🔍 SIMPLE, SAFE SEARCH ENDPOINT
 @router.get("/scholarships/search", response_model=List[ScholarshipRead])
 def search_scholarships_endpoint(
+    request: Request,
     keyword: str = "",  # read from query: /scholarships/search?keyword=foo
     db: Session = Depends(get_db),
 ):
     # if keyword is empty, just return all scholarships
-    if not keyword.strip():
-        return list_scholarships(db)
-
-    return search_scholarships_service(db, keyword.strip())
+    keyword = keyword.strip() or None
+    return conditional_response(
+        request,
+        weak_etag(scholarship_rows_version(db, keyword)),
+        lambda: rows_response(ScholarshipRead, list_scholarship_rows(db, keyword)),
+    )
 
 
 @router.post(
@@ -0,0 +1,213 @@
+# app/auth/rate_limit.py
+"""
+Sliding-window rate limiting for the unauthenticated auth endpoints.
+
+Login and forgot-password are the cheapest requests for an attacker and the
+most expensive for us (bcrypt verify, DB lookup, SMTP). Routes call the
+limiter before doing any of that work and get a 429 with Retry-After back.
+
+Each key keeps only (window index, previous count, current count); the
+estimate is `previous * (1 - elapsed_fraction) + current`, the usual
+sliding-window-counter approximation. Stale keys are swept periodically.
+
+Backends (RATE_LIMIT_BACKEND):
+  memory  per-process counters (default)
+  sqlite  counters in the shared `rate_limit_counters` table, for several
+          workers on one database
+"""
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.rate_limit import RateLimitCounter
+
+
+def _parse_rule(value: str) -> tuple[int, float]:
+    """'5/60' -> (5 requests, 60 seconds)."""
+    count, _, seconds = value.partition("/")
+    return int(count), float(seconds or 60)
+
+
+def _retry_after(limit: int, window: float, now: float, prev: int, curr: int) -> float:
+    elapsed = now % window
+    if curr >= limit:
+        # Wait out this window, then until the carried-over weight drops below the limit.
+        wait = (window - elapsed) + window * max(0.0, 1 - limit / curr)
+    else:
+        # prev > 0 here: wait until prev * (1 - f) + curr < limit.
+        wait = (1 - (limit - curr) / prev) * window - elapsed
+    # Always positive, so callers can treat 0 as "allowed".
+    return max(wait, 0.001)
+
+
+class SlidingWindowCounter:
+    """In-memory sliding-window counter for one rule."""
+
+    def __init__(self, limit: int, window_seconds: float) -> None:
+        self.limit = limit
+        self.window = window_seconds
+        self._buckets: Dict[str, List[int]] = {}  # key -> [window_index, prev, curr]
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        """Record one attempt; returns 0 if allowed, else seconds until retry."""
+        now = time.time() if now is None else now
+        index = int(now // self.window)
+        fraction = (now % self.window) / self.window
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(index)
+                self._next_sweep = now + self.window
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket[0] < index - 1:
+                prev, curr = 0, 0
+            elif bucket[0] == index - 1:
+                prev, curr = bucket[2], 0
+            else:
+                prev, curr = bucket[1], bucket[2]
+
+            if prev * (1 - fraction) + curr >= self.limit:
+                return _retry_after(self.limit, self.window, now, prev, curr)
+            self._buckets[key] = [index, prev, curr + 1]
+            return 0.0
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def _sweep(self, index: int) -> None:
+        stale = [k for k, b in self._buckets.items() if b[0] < index - 1]
+        for k in stale:
+            del self._buckets[k]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteWindowCounter:
+    """Same algorithm, with counts in a shared table so all workers agree."""
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        window_seconds: float,
+        session_factory: Callable[[], Session],
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.window = window_seconds
+        self._session_factory = session_factory
+        self._next_sweep = 0.0
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        index = int(now // self.window)
+        fraction = (now % self.window) / self.window
+        full_key = self._key(key)
+        with self._session_factory() as db:
+            if now >= self._next_sweep:
+                db.execute(
+                    delete(RateLimitCounter).where(
+                        RateLimitCounter.key.like(f"{self.name}:%"),
+                        RateLimitCounter.window_index < index - 1,
+                    )
+                )
+                self._next_sweep = now + self.window
+            counts = dict(
+                db.execute(
+                    select(RateLimitCounter.window_index, RateLimitCounter.count).where(
+                        RateLimitCounter.key == full_key,
+                        RateLimitCounter.window_index >= index - 1,
+                    )
+                ).all()
+            )
+            prev, curr = counts.get(index - 1, 0), counts.get(index, 0)
+            if prev * (1 - fraction) + curr >= self.limit:
+                db.commit()
+                return _retry_after(self.limit, self.window, now, prev, curr)
+            stmt = sqlite_insert(RateLimitCounter).values(key=full_key, window_index=index, count=1)
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[RateLimitCounter.key, RateLimitCounter.window_index],
+                    set_={"count": RateLimitCounter.count + 1},
+                )
+            )
+            db.commit()
+            return 0.0
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._session_factory() as db:
+            if key is None:
+                condition = RateLimitCounter.key.like(f"{self.name}:%")
+            else:
+                condition = RateLimitCounter.key == self._key(key)
+            db.execute(delete(RateLimitCounter).where(condition))
+            db.commit()
+
+
+class AuthRateLimiter:
+    """Per-IP and per-email rules for login and forgot-password."""
+
+    def __init__(self, backend: str = "memory", session_factory: Optional[Callable[[], Session]] = None) -> None:
+        rules = {
+            "login_ip": os.getenv("LOGIN_RATE_LIMIT_PER_IP", "20/60"),
+            "login_email": os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "5/60"),
+            "forgot_ip": os.getenv("FORGOT_PASSWORD_RATE_LIMIT_PER_IP", "5/300"),
+            "forgot_email": os.getenv("FORGOT_PASSWORD_RATE_LIMIT_PER_EMAIL", "3/900"),
+        }
+        self.counters = {}
+        for name, rule in rules.items():
+            limit, window = _parse_rule(rule)
+            if backend == "sqlite":
+                if session_factory is None:
+                    from app.database import SessionLocal
+
+                    session_factory = SessionLocal
+                self.counters[name] = SQLiteWindowCounter(name, limit, window, session_factory)
+            else:
+                self.counters[name] = SlidingWindowCounter(limit, window)
+
+    def _enforce(self, checks: list[tuple[str, str]]) -> None:
+        for rule, key in checks:
+            retry_after = self.counters[rule].hit(key)
+            if retry_after:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many attempts, please try again later",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+
+    def check_login(self, request: Request, email: str) -> None:
+        self._enforce([("login_ip", client_ip(request)), ("login_email", email.lower())])
+
+    def login_succeeded(self, email: str) -> None:
+        self.counters["login_email"].reset(email.lower())
+
+    def check_forgot_password(self, request: Request, email: str) -> None:
+        self._enforce([("forgot_ip", client_ip(request)), ("forgot_email", email.lower())])
+
+    def reset(self) -> None:
+        for counter in self.counters.values():
+            counter.reset()
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+rate_limiter = AuthRateLimiter(backend=os.getenv("RATE_LIMIT_BACKEND", "memory"))
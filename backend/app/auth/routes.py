@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -14,20 +15,31 @@ from app.auth.schemas import (
     ForgotPasswordRequest,
 )
 from app.auth import service as auth_service
-from app.notifications import send_email_notification
+from app.auth.principal_cache import Principal
+from app.auth.rate_limit import rate_limiter
+from app.notifications import PRIORITY_HIGH, enqueue_email
 
 router = APIRouter()
 
 
+# register, login and change-password are async: they await bcrypt on the
+# hashing pool (app.core.hashing) and only take a threadpool thread for DB work.
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(user_in: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_in: UserCreate, db: Session = Depends(get_db)):
     """Register a new user; defaults to applicant role."""
-    return auth_service.create_user(db, user_in)
+    return await auth_service.create_user(db, user_in)
 
 
 @router.post("/login", response_model=Token)
-def login(user_in: UserLogin, db: Session = Depends(get_db)):
-    user = auth_service.authenticate_user(db, user_in.email, user_in.password)
+async def login(user_in: UserLogin, request: Request, db: Session = Depends(get_db)):
+    # Reject floods before authenticate_user spends a bcrypt verify on them.
+    await run_in_threadpool(rate_limiter.check_login, request, user_in.email)
+    user = await auth_service.authenticate_user(db, user_in.email, user_in.password)
+    return await run_in_threadpool(_login_response, db, user, user_in.email)
+
+
+def _login_response(db: Session, user: User, email: str) -> dict:
+    rate_limiter.login_succeeded(email)
     needs_profile = user.role == UserRole.APPLICANT and not applicant_profile_exists(db, user.id)
     tokens = auth_service.build_tokens(user)
     return {"token_type": "bearer", "needs_profile_setup": needs_profile, **tokens}
@@ -56,7 +68,7 @@ def read_current_user(current_user: User = Depends(auth_service.get_current_user
 
 
 @router.get("/require-admin")
-def admin_ping(current_user: User = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN))):
+def admin_ping(current_user: Principal = Depends(auth_service.require_roles(UserRole.ENGR_ADMIN))):
     """Example protected route showing role-based guard."""
     return {"message": f"Hello, {current_user.first_name or current_user.email}", "role": current_user.role}
 
@@ -72,21 +84,22 @@ def update_me(
 
 
 @router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
-def change_password(
+async def change_password(
     payload: PasswordChange,
     current_user: User = Depends(auth_service.get_current_user),
     db: Session = Depends(get_db),
 ):
-    auth_service.change_password(db, current_user, payload)
+    await auth_service.change_password(db, current_user, payload)
 
 
 @router.post("/forgot-password", status_code=status.HTTP_202_ACCEPTED)
-def forgot_password(payload: ForgotPasswordRequest, db: Session = Depends(get_db)):
+def forgot_password(payload: ForgotPasswordRequest, request: Request, db: Session = Depends(get_db)):
     """
     Trigger a password reset email. We always return 202 to avoid leaking which
     emails exist. The email currently contains a placeholder link; hook up a
     real reset flow later.
     """
+    rate_limiter.check_forgot_password(request, payload.email)
     user = auth_service.get_user_by_email(db, payload.email)
     if user:
         reset_link = "https://example.com/reset-password"  # placeholder
@@ -97,14 +110,13 @@ def forgot_password(payload: ForgotPasswordRequest, db: Session = Depends(get_db
             f"{reset_link}\n\n"
             "If you did not request a reset, you can ignore this email."
         )
-        try:
-            send_email_notification(
-                to_email=user.email,
-                subject="EduAid password reset",
-                body=body,
-                sender_name="EduAid",
-            )
-        except Exception:
-            # Log in real app; we swallow to keep response generic
-            pass
+        # Queued in the outbox's priority lane; the worker does the SMTP work.
+        enqueue_email(
+            db,
+            to_email=user.email,
+            subject="EduAid password reset",
+            body=body,
+            sender_name="EduAid",
+            priority=PRIORITY_HIGH,
+        )
     return {"detail": "If the email exists, a reset link has been sent."}
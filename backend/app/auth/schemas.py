@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 import re
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.models.user import UserRole
 
@@ -39,8 +39,7 @@ class UserRead(UserBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
@@ -54,6 +53,40 @@ class UserAdminUpdate(BaseModel):
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
 
+
+class UserAdminListItem(BaseModel):
+    """Slim read model for the admin users table (no password hash or timestamps)."""
+    id: int
+    email: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    role: UserRole
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserAdminPage(BaseModel):
+    items: list[UserAdminListItem]
+    # Pass back as `after_id` to fetch the next page; null when there are no more rows.
+    next_cursor: Optional[int] = None
+
+
+class UserImportRowError(BaseModel):
+    row: int  # 1-based data row (header excluded for CSV)
+    email: Optional[str] = None
+    error: str
+
+
+class UserImportReport(BaseModel):
+    total_rows: int
+    created: int
+    skipped_existing: int
+    failed: int
+    errors: list[UserImportRowError]
+    elapsed_ms: float
+
+
 class PasswordChange(BaseModel):
     current_password: str = Field(min_length=8, max_length=20)
     new_password: str = Field(min_length=8, max_length=20)
@@ -1,10 +1,14 @@
 from typing import Optional
 
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Query, Security, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import or_, func
 from sqlalchemy.orm import Session
 
+from app.auth.principal_cache import Principal, principal_cache
 from app.core import security
+from app.core.coherence import cache_coherence
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.auth.schemas import UserCreate, UserUpdate, PasswordChange
@@ -12,22 +16,51 @@ from app.auth.schemas import UserCreate, UserUpdate, PasswordChange
 http_bearer = HTTPBearer(auto_error=False)
 
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email.lower()).first()
 
 
-def create_user(db: Session, user_in: UserCreate) -> User:
+def _release_connection(db: Session) -> None:
+    """
+    End the session's transaction before awaiting bcrypt, so requests queued
+    for the hashing pool don't each hold a pooled DB connection. Loaded
+    objects stay readable (detached) and `db.add` re-attaches them.
+    """
+    db.close()
+
+
+def _find_user_released(db: Session, email: str) -> Optional[User]:
+    user = get_user_by_email(db, email)
+    _release_connection(db)
+    return user
+
+
+async def create_user(db: Session, user_in: UserCreate) -> User:
+    """
+    Async so the bcrypt hash is awaited on the hashing pool without holding
+    a threadpool thread; the DB work still runs in the threadpool.
+    """
     email_normalized = user_in.email.lower()
-    if get_user_by_email(db, email_normalized):
+    if await run_in_threadpool(_find_user_released, db, email_normalized):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
     try:
-        hashed_password = security.get_password_hash(user_in.password)
+        hashed_password = await security.hash_password_async(user_in.password)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    except security.HashingBusyError as exc:
+        raise _hashing_busy() from exc
     # All roles active on signup; adjust here if you want approval gating.
     auto_active = True
     user = User(
@@ -38,15 +71,23 @@ def create_user(db: Session, user_in: UserCreate) -> User:
         role=user_in.role,
         is_active=auto_active,
     )
+    return await run_in_threadpool(_insert_user, db, user)
+
+
+def _insert_user(db: Session, user: User) -> User:
     db.add(user)
     db.commit()
     db.refresh(user)
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User:
-    user = get_user_by_email(db, email.lower())
-    if not user or not security.verify_password(password, user.hashed_password):
+async def authenticate_user(db: Session, email: str, password: str) -> User:
+    user = await run_in_threadpool(_find_user_released, db, email.lower())
+    try:
+        password_ok = bool(user) and await security.verify_password_async(password, user.hashed_password)
+    except security.HashingBusyError as exc:
+        raise _hashing_busy() from exc
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -57,9 +98,25 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive account",
         )
+    if security.password_needs_rehash(user.hashed_password):
+        await _upgrade_password_hash(db, user, password)
     return user
 
 
+async def _upgrade_password_hash(db: Session, user: User, password: str) -> None:
+    """Re-hash with the current bcrypt cost; best effort, login never fails on it."""
+    try:
+        user.hashed_password = await security.hash_password_async(password)
+    except (ValueError, security.HashingBusyError):
+        return
+    await run_in_threadpool(_commit_user, db, user)
+
+
+def _commit_user(db: Session, user: User) -> None:
+    db.add(user)
+    db.commit()
+
+
 def build_tokens(user: User) -> dict[str, str]:
     access_token = security.create_access_token(user.id, role=user.role.value)
     refresh_token = security.create_refresh_token(user.id, role=user.role.value)
@@ -76,20 +133,44 @@ def decode_refresh_token(refresh_token: str) -> dict:
     return payload
 
 
-def get_current_user(
+def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Security(http_bearer),
     db: Session = Depends(get_db),
-) -> User:
+) -> Principal:
+    """
+    Resolve the bearer token to a cached Principal. Only a cache miss touches
+    the database; writers that change users invalidate the cache entry.
+    """
     if not credentials or credentials.scheme.lower() != "bearer":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return principal_from_token(db, credentials.credentials)
+
+
+def get_stream_principal(
+    access_token: Optional[str] = Query(None, description="For EventSource, which can't set headers"),
+    credentials: HTTPAuthorizationCredentials = Security(http_bearer),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """Like get_current_principal, but also accepts the token as a query parameter."""
+    if credentials and credentials.scheme.lower() == "bearer":
+        return principal_from_token(db, credentials.credentials)
+    if access_token:
+        return principal_from_token(db, access_token)
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
+def principal_from_token(db: Session, token: str) -> Principal:
     # ⬇️ Catch expired/invalid tokens and turn them into a clean 401
     try:
-        payload = security.decode_token(credentials.credentials, refresh=False)
+        payload = security.decode_token(token, refresh=False)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -110,23 +191,51 @@ def get_current_user(
             detail="Invalid token payload",
         )
 
-    user = db.get(User, int(user_id))
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
+    principal = principal_cache.get(int(user_id))
+    if principal is None:
+        user = db.get(User, int(user_id))
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        principal = Principal.from_user(user)
+        principal_cache.put(principal)
 
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive account",
         )
 
+    # A role change since the token was issued invalidates the token.
+    if payload.get("role") != principal.role.value:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token is out of date, please sign in again",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+) -> User:
+    """Full ORM user for routes that read or modify more than the principal."""
+    user = db.get(User, principal.id)
+    if not user:
+        principal_cache.invalidate(principal.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
     return user
 
+
 def require_roles(*roles: UserRole):
-    def wrapper(current_user: User = Depends(get_current_user)) -> User:
+    def wrapper(current_user: Principal = Depends(get_current_principal)) -> Principal:
         if roles and current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -137,28 +246,91 @@ def require_roles(*roles: UserRole):
     return wrapper
 
 
+def _prefix_upper_bound(prefix: str) -> str:
+    # "abc" -> "abd": lets `email >= prefix AND email < bound` use the email index.
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def list_users_page(
+    db: Session,
+    limit: int = 50,
+    after_id: Optional[int] = None,
+    role: Optional[UserRole] = None,
+    is_active: Optional[bool] = None,
+    email_prefix: Optional[str] = None,
+    name: Optional[str] = None,
+) -> dict:
+    """
+    Keyset-paginated admin user listing ordered by id. Only the columns shown
+    in the admin table are selected, so no full ORM rows are hydrated.
+    """
+    query = db.query(
+        User.id,
+        User.email,
+        User.first_name,
+        User.last_name,
+        User.role,
+        User.is_active,
+    )
+    if after_id is not None:
+        query = query.filter(User.id > after_id)
+    if role is not None:
+        query = query.filter(User.role == role)
+    if is_active is not None:
+        query = query.filter(User.is_active.is_(is_active))
+    if email_prefix:
+        prefix = email_prefix.lower()
+        query = query.filter(User.email >= prefix, User.email < _prefix_upper_bound(prefix))
+    if name:
+        # Escape LIKE wildcards so "_" or "%" in the search box match literally.
+        term = name.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{term}%"
+        query = query.filter(
+            or_(
+                func.lower(User.first_name).like(pattern, escape="\\"),
+                func.lower(User.last_name).like(pattern, escape="\\"),
+            )
+        )
+
+    # Fetch one extra row to know whether another page exists.
+    rows = query.order_by(User.id).limit(limit + 1).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return {"items": rows[:limit], "next_cursor": next_cursor}
+
+
 def update_user(db: Session, current_user: User, updates: UserUpdate) -> User:
     if updates.first_name is not None:
         current_user.first_name = updates.first_name
     if updates.last_name is not None:
         current_user.last_name = updates.last_name
     db.add(current_user)
+    cache_coherence.record(db, "user", current_user.id)
     db.commit()
     db.refresh(current_user)
+    principal_cache.invalidate(current_user.id)
     return current_user
 
 
-def change_password(db: Session, current_user: User, payload: PasswordChange) -> None:
-    if not security.verify_password(payload.current_password, current_user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Current password is incorrect",
-        )
+async def change_password(db: Session, current_user: User, payload: PasswordChange) -> None:
+    await run_in_threadpool(_release_connection, db)
     try:
-        current_user.hashed_password = security.get_password_hash(payload.new_password)
+        if not await security.verify_password_async(payload.current_password, current_user.hashed_password):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Current password is incorrect",
+            )
+        current_user.hashed_password = await security.hash_password_async(payload.new_password)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
+    except security.HashingBusyError as exc:
+        raise _hashing_busy() from exc
+    await run_in_threadpool(_save_password, db, current_user)
+
+
+def _save_password(db: Session, current_user: User) -> None:
     db.add(current_user)
+    cache_coherence.record(db, "user", current_user.id)
     db.commit()
+    principal_cache.invalidate(current_user.id)
@@ -0,0 +1,2 @@
+# app/cli/__init__.py
+# Command-line entry points, run as `python -m app.cli.<command>` from backend/.
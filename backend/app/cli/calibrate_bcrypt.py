@@ -0,0 +1,29 @@
+# app/cli/calibrate_bcrypt.py
+"""
+Recommend a bcrypt cost for this machine.
+
+Usage (from backend/):
+    python -m app.cli.calibrate_bcrypt --target-ms 250
+
+Put the printed value in BCRYPT_ROUNDS, or set BCRYPT_TARGET_MS to let the
+app calibrate itself at startup. With several workers, prefer BCRYPT_ROUNDS:
+each worker process calibrates separately and may pick a different cost.
+"""
+import argparse
+
+from app.core.security import BCRYPT_MAX_ROUNDS, BCRYPT_MIN_ROUNDS, calibrate_bcrypt_rounds
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate bcrypt cost to a target hash latency.")
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--min-rounds", type=int, default=BCRYPT_MIN_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=BCRYPT_MAX_ROUNDS)
+    args = parser.parse_args(argv)
+
+    rounds = calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds)
+    print(f"BCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# app/cli/generate_dataset.py
+"""
+Generate a large synthetic dataset directly into the database.
+
+Users across every role, applicant profiles (GPA, major, citizenship),
+scholarships with varied requirement columns, and applications, reviews and
+notifications with skewed (Zipf-like) popularity: a few scholarships draw
+most applications, a few reviewers carry most of the load, and so on.
+
+Rows are written with chunked Core `insert()` executemany calls inside one
+transaction, ids are assigned up front so nothing is read back, and every
+account shares one bcrypt hash computed once (password: see
+SYNTHETIC_PASSWORD). The same --seed and --anchor-date always produce the
+same rows.
+
+Usage (from backend/):
+    python -m app.cli.generate_dataset --users 50000 --applications 1000000
+    python -m app.cli.generate_dataset --database-url sqlite:///./synthetic.db --reset
+"""
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional
+
+from passlib.hash import bcrypt as bcrypt_hash
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401 - ensures models are registered with Base
+from app.core.security import BCRYPT_ROUNDS
+from app.database import SQLALCHEMY_DATABASE_URL, Base
+from app.models import ApplicantProfile, Application, Notification, Review, Scholarship, User
+from app.models.user import UserRole
+
+SYNTHETIC_PASSWORD = "Synthetic#2024"
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.example.com"
+CHUNK_SIZE = 20_000
+
+ROLE_MIX = {
+    UserRole.APPLICANT: 0.93,
+    UserRole.REVIEWER: 0.04,
+    UserRole.SPONSOR_DONOR: 0.015,
+    UserRole.STEWARD: 0.01,
+    UserRole.ENGR_ADMIN: 0.005,
+}
+MAJORS = {
+    "Software Engineering": 22, "Computer Science": 20, "Electrical Engineering": 12,
+    "Mechanical Engineering": 12, "Systems Engineering": 8, "Civil Engineering": 7,
+    "Biomedical Engineering": 6, "Chemical Engineering": 5, "Aerospace Engineering": 5,
+    "Mathematics": 3,
+}
+MINORS = {"Mathematics": 30, "Business": 20, "Physics": 15, "Statistics": 15, "Economics": 10, "Spanish": 10}
+CITIZENSHIP = {"US": 78, "India": 7, "China": 5, "Mexico": 3, "Canada": 2, "South Korea": 2, "Other": 3}
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Riley", "Casey", "Morgan", "Avery", "Quinn", "Jamie",
+               "Priya", "Wei", "Carlos", "Fatima", "Noah", "Emma", "Liam", "Sofia", "Mateo", "Aisha"]
+LAST_NAMES = ["Smith", "Garcia", "Nguyen", "Patel", "Kim", "Johnson", "Lee", "Martinez", "Brown", "Chen",
+              "Lopez", "Wilson", "Singh", "Davis", "Hernandez", "Clark", "Lewis", "Young", "Walker", "Hall"]
+SCHOLARSHIP_THEMES = ["Merit", "Need-Based", "Research", "Leadership", "First-Generation", "Women in Engineering",
+                      "Transfer", "Community Service", "Innovation", "Industry Partner"]
+APPLICATION_STATUS = {"submitted": 55, "in_review": 25, "accepted": 8, "rejected": 12}
+REVIEW_STATUS = {"in_review": 40, "accepted": 25, "rejected": 35}
+NOTIFICATION_MESSAGES = [
+    "You have been assigned to review application #{n}.",
+    "Your application #{n} status changed.",
+    "Reminder: a scholarship you may qualify for closes soon.",
+    "A new review was submitted for application #{n}.",
+]
+
+
+@dataclass
+class DatasetSpec:
+    users: int = 10_000
+    scholarships: int = 500
+    applications: int = 100_000
+    notifications: int = 200_000
+    review_rate: float = 0.6  # share of assigned applications that have a review
+    assign_rate: float = 0.7  # share of applications with a reviewer
+    seed: int = 1
+    anchor_date: date = field(default_factory=date.today)
+
+
+def _weighted(rng: random.Random, table: Dict[str, float]) -> str:
+    return rng.choices(list(table), weights=list(table.values()))[0]
+
+
+def _zipf_cum_weights(n: int, s: float) -> List[float]:
+    return list(accumulate(1 / (rank ** s) for rank in range(1, n + 1)))
+
+
+def _skewed_picker(rng: random.Random, population: List[int], s: float) -> Callable[[int], List[int]]:
+    """Draw from `population` with Zipf(s) weights assigned in a shuffled order."""
+    shuffled = list(population)
+    rng.shuffle(shuffled)
+    cum = _zipf_cum_weights(len(shuffled), s)
+    return lambda k: rng.choices(shuffled, cum_weights=cum, k=k)
+
+
+def _chunks(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    chunk: List[dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _shared_password_hash(rng: random.Random) -> str:
+    # Salt drawn from the seed so the hash (and the whole dataset) is reproducible.
+    alphabet = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    salt = "".join(rng.choice(alphabet) for _ in range(21)) + rng.choice(".Oeu")
+    return bcrypt_hash.using(rounds=BCRYPT_ROUNDS, salt=salt, ident="2b").hash(SYNTHETIC_PASSWORD)
+
+
+def _next_ids(conn) -> Dict[str, int]:
+    return {
+        model.__tablename__: (conn.scalar(select(func.max(model.id))) or 0) + 1
+        for model in (User, ApplicantProfile, Scholarship, Application, Review, Notification)
+    }
+
+
+def generate_dataset(engine: Engine, spec: DatasetSpec, progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, int]:
+    """Append a synthetic dataset to `engine`'s database; returns rows written per table."""
+    rng = random.Random(spec.seed)
+    anchor = datetime.combine(spec.anchor_date, datetime.min.time())
+    counts: Dict[str, int] = {}
+
+    with engine.begin() as conn:
+        ids = _next_ids(conn)
+
+        def write(model, rows: Iterator[dict]) -> None:
+            total = 0
+            for chunk in _chunks(rows, CHUNK_SIZE):
+                conn.execute(insert(model), chunk)
+                total += len(chunk)
+                if progress:
+                    progress(model.__tablename__, total)
+            counts[model.__tablename__] = total
+
+        # ---- users ---------------------------------------------------
+        hashed = _shared_password_hash(rng)
+        roles: List[UserRole] = []
+        for role, share in ROLE_MIX.items():
+            roles += [role] * max(1 if role != UserRole.APPLICANT else 0, round(spec.users * share))
+        roles = roles[: max(spec.users, len(ROLE_MIX))]
+        rng.shuffle(roles)
+        user_ids = list(range(ids["users"], ids["users"] + len(roles)))
+        by_role: Dict[UserRole, List[int]] = {role: [] for role in ROLE_MIX}
+        for user_id, role in zip(user_ids, roles):
+            by_role[role].append(user_id)
+
+        def user_rows():
+            for user_id, role in zip(user_ids, roles):
+                created = anchor - timedelta(days=rng.uniform(0, 730))
+                yield {
+                    "id": user_id,
+                    "email": f"{role.value}{user_id}@{SYNTHETIC_EMAIL_DOMAIN}",
+                    "first_name": rng.choice(FIRST_NAMES),
+                    "last_name": rng.choice(LAST_NAMES),
+                    "hashed_password": hashed,
+                    "role": role,
+                    "is_active": rng.random() > 0.03,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+
+        write(User, user_rows())
+
+        # ---- applicant profiles --------------------------------------
+        applicants = by_role[UserRole.APPLICANT]
+
+        def profile_rows():
+            for offset, user_id in enumerate(applicants):
+                created = anchor - timedelta(days=rng.uniform(0, 365))
+                yield {
+                    "id": ids["applicant_profiles"] + offset,
+                    "user_id": user_id,
+                    "student_id": f"S{user_id:08d}",
+                    "netid": f"net{user_id}",
+                    "citizenship": _weighted(rng, CITIZENSHIP),
+                    "degree_major": _weighted(rng, MAJORS),
+                    "degree_minor": _weighted(rng, MINORS) if rng.random() < 0.3 else None,
+                    "gpa": round(min(4.0, max(1.5, rng.gauss(3.2, 0.45))), 2),
+                    "academic_achievements": None,
+                    "financial_information": None,
+                    "written_essays": None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+
+        write(ApplicantProfile, profile_rows())
+
+        # ---- scholarships --------------------------------------------
+        scholarship_ids = list(range(ids["scholarships"], ids["scholarships"] + spec.scholarships))
+
+        def scholarship_rows():
+            for n, scholarship_id in enumerate(scholarship_ids):
+                theme = rng.choice(SCHOLARSHIP_THEMES)
+                major = _weighted(rng, MAJORS) if rng.random() < 0.25 else None
+                yield {
+                    "id": scholarship_id,
+                    "name": f"{theme} Scholarship {n + 1}",
+                    "description": f"{theme} award for engineering students. " * rng.randint(1, 4),
+                    "amount": rng.randrange(500, 20_001, 250),
+                    "deadline": spec.anchor_date + timedelta(days=rng.randint(-60, 180)),
+                    "requirements": f"{theme}; {major or 'any major'}",
+                    "min_gpa": rng.choice([2.5, 3.0, 3.3, 3.5, 3.8]) if rng.random() < 0.5 else None,
+                    "required_citizenship": "US" if rng.random() < 0.2 else None,
+                    "required_major": major,
+                    "required_minor": _weighted(rng, MINORS) if rng.random() < 0.05 else None,
+                    "requires_essay": rng.random() < 0.6,
+                    "requires_transcript": rng.random() < 0.4,
+                    "requires_questions": rng.random() < 0.2,
+                }
+
+        write(Scholarship, scholarship_rows())
+
+        # ---- applications --------------------------------------------
+        reviewers = by_role[UserRole.REVIEWER]
+        pick_scholarship = _skewed_picker(rng, scholarship_ids, 0.9)
+        pick_applicant = _skewed_picker(rng, applicants, 0.6)
+        pick_reviewer = _skewed_picker(rng, reviewers, 0.8) if reviewers else None
+        app_span = timedelta(days=365).total_seconds()
+        app_start = anchor - timedelta(days=365)
+        assigned: List[tuple] = []  # (application_id, reviewer_id, created_at)
+
+        def application_rows():
+            n = spec.applications
+            done = 0
+            while done < n:
+                k = min(CHUNK_SIZE, n - done)
+                for scholarship_id, user_id in zip(pick_scholarship(k), pick_applicant(k)):
+                    app_id = ids["applications"] + done
+                    # Ids ascend with created_at, like real inserts.
+                    created = app_start + timedelta(seconds=app_span * done / n + rng.uniform(0, 60))
+                    reviewer_id = (
+                        pick_reviewer(1)[0] if pick_reviewer and rng.random() < spec.assign_rate else None
+                    )
+                    status = _weighted(rng, APPLICATION_STATUS) if reviewer_id else "submitted"
+                    if reviewer_id and rng.random() < spec.review_rate:
+                        assigned.append((app_id, reviewer_id, created))
+                    done += 1
+                    yield {
+                        "id": app_id,
+                        "user_id": user_id,
+                        "scholarship_id": scholarship_id,
+                        "essay_text": "Essay " * rng.randint(20, 120) if rng.random() < 0.6 else None,
+                        "transcript_url": None,
+                        "answers_json": None,
+                        "reviewer_id": reviewer_id,
+                        "status": status,
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+
+        write(Application, application_rows() if applicants and scholarship_ids else iter(()))
+
+        # ---- reviews -------------------------------------------------
+        def review_rows():
+            for offset, (app_id, reviewer_id, created) in enumerate(assigned):
+                reviewed = created + timedelta(days=rng.uniform(1, 30))
+                yield {
+                    "id": ids["reviews"] + offset,
+                    "application_id": app_id,
+                    "reviewer_id": reviewer_id,
+                    "score": max(0, min(100, round(rng.gauss(72, 14)))),
+                    "comment": "Strong candidate." if rng.random() < 0.5 else None,
+                    "status": _weighted(rng, REVIEW_STATUS),
+                    "created_at": reviewed,
+                    "updated_at": reviewed,
+                }
+
+        write(Review, review_rows())
+
+        # ---- notifications -------------------------------------------
+        recipients = applicants + reviewers
+        pick_recipient = _skewed_picker(rng, recipients, 0.9) if recipients else None
+        notif_start = anchor - timedelta(days=180)
+        notif_span = timedelta(days=180).total_seconds()
+
+        def notification_rows():
+            n = spec.notifications
+            done = 0
+            while done < n:
+                k = min(CHUNK_SIZE, n - done)
+                for user_id in pick_recipient(k):
+                    created = notif_start + timedelta(seconds=notif_span * done / n)
+                    yield {
+                        "id": ids["notifications"] + done,
+                        "user_id": user_id,
+                        "message": rng.choice(NOTIFICATION_MESSAGES).format(n=rng.randint(1, 10 ** 6)),
+                        # Older notifications are much more likely to have been read.
+                        "is_read": rng.random() < 0.3 + 0.65 * (1 - done / n),
+                        "created_at": created,
+                    }
+                    done += 1
+
+        write(Notification, notification_rows() if pick_recipient else iter(()))
+
+    return counts
+
+
+def _fast_bulk_load(engine: Engine) -> None:
+    """Trade durability for speed while generating (a crash just means regenerating)."""
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.execute("PRAGMA cache_size = -200000")
+        cursor.close()
+
+
+def main(argv=None) -> None:
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dataset.")
+    parser.add_argument("--database-url", default=SQLALCHEMY_DATABASE_URL)
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--scholarships", type=int, default=defaults.scholarships)
+    parser.add_argument("--applications", type=int, default=defaults.applications)
+    parser.add_argument("--notifications", type=int, default=defaults.notifications)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--anchor-date", type=date.fromisoformat, default=defaults.anchor_date,
+                        help="dates are generated relative to this day (YYYY-MM-DD); fix it for identical output")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        _fast_bulk_load(engine)
+    if args.reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    spec = DatasetSpec(
+        users=args.users,
+        scholarships=args.scholarships,
+        applications=args.applications,
+        notifications=args.notifications,
+        seed=args.seed,
+        anchor_date=args.anchor_date,
+    )
+    started = time.perf_counter()
+
+    def progress(table: str, rows: int) -> None:
+        if rows % (CHUNK_SIZE * 10) == 0:
+            print(f"  {table}: {rows:,} rows ({time.perf_counter() - started:.1f}s)", flush=True)
+
+    counts = generate_dataset(engine, spec, progress)
+    elapsed = time.perf_counter() - started
+    for table, rows in counts.items():
+        print(f"{table:<20} {rows:>12,}")
+    print(f"done in {elapsed:.1f}s; every account's password is {SYNTHETIC_PASSWORD!r}")
+
+
+if __name__ == "__main__":
+    main()
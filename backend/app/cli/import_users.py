@@ -0,0 +1,47 @@
+# app/cli/import_users.py
+"""
+Bulk-provision users from a CSV or NDJSON file.
+
+Usage (from backend/):
+    python -m app.cli.import_users users.csv
+    python -m app.cli.import_users users.ndjson --format ndjson --workers 8
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.database import Base, SessionLocal, engine
+import app.models  # noqa: F401 - ensures models are registered with Base
+from app.services.user_import_service import (
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    bulk_import_users,
+    parse_user_rows,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or NDJSON.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the file extension")
+    parser.add_argument("--workers", type=int, default=None, help="Hashing processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("ndjson" if args.path.suffix.lower() in (".ndjson", ".jsonl") else "csv")
+    rows = parse_user_rows(args.path.read_text(encoding="utf-8-sig"), fmt)
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        report = bulk_import_users(db, rows, chunk_size=args.chunk_size, max_workers=args.workers)
+    finally:
+        db.close()
+
+    print(json.dumps(report.model_dump(), indent=2))
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+# app/cli/notification_retention.py
+"""
+Run the notification retention job once.
+
+Usage (from backend/):
+    python -m app.cli.notification_retention --days 90 --inbox-max 500
+    python -m app.cli.notification_retention --enable-incremental-vacuum
+
+Defaults come from the same NOTIFICATION_* env vars the background job uses.
+"""
+import argparse
+
+from app.database import SessionLocal, engine
+from app.notifications.retention import NotificationRetentionJob, enable_incremental_vacuum
+
+
+def main(argv=None) -> None:
+    job = NotificationRetentionJob.from_env(SessionLocal)
+    parser = argparse.ArgumentParser(description="Archive old notifications and cap inbox sizes.")
+    parser.add_argument("--days", type=float, default=job.retention_days)
+    parser.add_argument("--inbox-max", type=int, default=job.inbox_max, help="0 disables the per-user cap")
+    parser.add_argument("--chunk-size", type=int, default=job.chunk_size)
+    parser.add_argument("--vacuum-pages", type=int, default=job.vacuum_pages)
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="switch the database to auto_vacuum=INCREMENTAL first (runs a full VACUUM once)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.enable_incremental_vacuum:
+        enable_incremental_vacuum(engine)
+        print("auto_vacuum set to INCREMENTAL")
+
+    job.retention_days = args.days
+    job.inbox_max = args.inbox_max
+    job.chunk_size = args.chunk_size
+    job.vacuum_pages = args.vacuum_pages
+    job.pause_seconds = 0
+    report = job.run_once()
+    print(
+        f"archived {report.archived_aged} aged and {report.archived_over_cap} over-cap notifications, "
+        f"vacuumed {report.vacuumed_pages} pages in {report.seconds:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
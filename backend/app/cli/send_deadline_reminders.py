@@ -0,0 +1,25 @@
+# app/cli/send_deadline_reminders.py
+"""
+Send deadline reminders once (safe to rerun; already-reminded pairs are skipped).
+
+Usage (from backend/):
+    python -m app.cli.send_deadline_reminders --days 3
+"""
+import argparse
+
+from app.database import SessionLocal
+from app.notifications.reminders import REMINDER_LEAD_DAYS, send_deadline_reminders
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Remind eligible applicants before scholarship deadlines.")
+    parser.add_argument("--days", type=int, default=REMINDER_LEAD_DAYS, help="deadlines within this many days")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        sent = send_deadline_reminders(db, lead_days=args.days)
+    print(f"sent {sent} reminders")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Cache coherence across workers through a shared `change_log` table.
+
+Each worker caches in process: the scholarship catalog
+(app.services.catalog_cache), principals (app.auth.principal_cache) and
+unread counts (app.notifications.unread_counter). Writers keep their own
+worker's caches current, but with several uvicorn/gunicorn workers the
+others would serve stale entries until their TTLs run out. With
+CACHE_COHERENCE=change_log:
+
+  * write paths call `cache_coherence.record(db, entity, id)` before they
+    commit, which appends to `change_log` in the same transaction, so a
+    change is logged exactly when it commits;
+  * before each request, CacheCoherenceMiddleware reads the entries after
+    the last one this worker has seen (a primary-key range scan that is
+    almost always empty) and runs the invalidation handlers registered for
+    their entities. Entries a worker wrote itself are skipped.
+
+A request that follows a committed write therefore sees it on every
+worker (or up to CACHE_COHERENCE_INTERVAL_MS later, when that is set).
+SQLite has one writer at a time, so ids become visible in order and `id >
+last seen` misses nothing. Entries older than CHANGE_LOG_RETENTION_SECONDS
+are pruned by a background thread the app starts in its lifespan (the
+DELETE takes SQLite's write lock, so it stays off the event loop); a
+worker that hasn't checked for that long drops all its caches rather than
+trust a pruned log.
+
+The check reads through a raw cursor on one DBAPI connection the worker
+keeps for it: about 8 us, against about 450 us through a Session. This
+also keeps it out of the query stats and the slow-query log. It still
+runs on the thread pool, not the event loop: while another process holds
+SQLite's lock the read can wait up to the busy timeout, and on the loop
+that would stall every in-flight request.
+
+Entities and their ids: "scholarship" (scholarship id), "user" (user id),
+"notification" (the id of the user whose notifications changed). A None
+id means every entity of that kind.
+
+Configuration (env):
+  CACHE_COHERENCE (default off; change_log when running several workers)
+  CACHE_COHERENCE_INTERVAL_MS (default 0: check before every request)
+  CHANGE_LOG_RETENTION_SECONDS (default 3600)
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.change_log import ChangeLogEntry
+
+logger = logging.getLogger(__name__)
+
+CACHE_COHERENCE = os.getenv("CACHE_COHERENCE", "off").lower()
+CACHE_COHERENCE_INTERVAL_MS = float(os.getenv("CACHE_COHERENCE_INTERVAL_MS", "0"))
+CHANGE_LOG_RETENTION_SECONDS = float(os.getenv("CHANGE_LOG_RETENTION_SECONDS", "3600"))
+
+# Beyond this many ids in one write, a single "every entity" entry is cheaper.
+MAX_ENTRIES_PER_WRITE = 100
+
+Handler = Callable[[Optional[int]], None]
+
+
+class CacheCoherence:
+    def __init__(
+        self,
+        enabled: bool = CACHE_COHERENCE == "change_log",
+        interval_seconds: float = CACHE_COHERENCE_INTERVAL_MS / 1000,
+        retention_seconds: float = CHANGE_LOG_RETENTION_SECONDS,
+        origin: Optional[str] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.interval = interval_seconds
+        self.retention = retention_seconds
+        self.origin = origin or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._connection = None  # raw DBAPI connection for check()
+        self._last_id: Optional[int] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pruner: Optional[threading.Thread] = None
+        self.applied = 0
+
+    def register(self, entity: str, handler: Handler) -> None:
+        """`handler(entity_id)` drops this worker's cached copy (all of them for None)."""
+        self._handlers.setdefault(entity, []).append(handler)
+
+    # ---- writers -----------------------------------------------------
+
+    def record(self, db: Session, entity: str, entity_id: Optional[int] = None) -> None:
+        self.record_many(db, entity, [entity_id])
+
+    def record_many(self, db: Session, entity: str, entity_ids: Iterable[Optional[int]]) -> None:
+        """Log a change in the caller's transaction; it is seen once that commits."""
+        if not self.enabled:
+            return
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return
+        if None in ids or len(ids) > MAX_ENTRIES_PER_WRITE:
+            ids = [None]
+        now = datetime.utcnow()
+        db.execute(
+            insert(ChangeLogEntry),
+            [{"entity": entity, "entity_id": i, "origin": self.origin, "created_at": now} for i in ids],
+        )
+
+    # ---- readers -----------------------------------------------------
+
+    def due(self) -> bool:
+        """Whether the next request should run `check` (cheap; no I/O)."""
+        return self.enabled and time.monotonic() - self._last_check >= self.interval
+
+    def check(self, engine: Engine, force: bool = False) -> int:
+        """Apply other workers' changes since the last check; returns how many were applied."""
+        if not self.enabled:
+            return 0
+        if not force and time.monotonic() - self._last_check < self.interval:
+            return 0
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_check < self.interval:
+                return 0
+            if self._connection is None:
+                self._connection = engine.raw_connection()
+            applied = 0
+            try:
+                cursor = self._connection.cursor()
+                try:
+                    if self._last_id is None or now - self._last_check > self.retention:
+                        # First check, or entries we needed may have been pruned.
+                        cursor.execute("SELECT max(id) FROM change_log")
+                        self._last_id = cursor.fetchone()[0] or 0
+                        for entity in self._handlers:
+                            self._apply(entity, None)
+                    else:
+                        cursor.execute(
+                            "SELECT id, entity, entity_id, origin FROM change_log WHERE id > ? ORDER BY id",
+                            (self._last_id,),
+                        )
+                        rows = cursor.fetchall()
+                        for _, entity, entity_id, origin in rows:
+                            if origin != self.origin:
+                                self._apply(entity, entity_id)
+                                applied += 1
+                        if rows:
+                            self._last_id = rows[-1][0]
+                finally:
+                    cursor.close()
+            except Exception:
+                self.close()  # reconnect on the next check
+                raise
+            self._last_check = now
+            self.applied += applied
+            return applied
+
+    def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            try:
+                connection.close()
+            except Exception:  # noqa: BLE001 - already broken
+                pass
+
+    def _apply(self, entity: str, entity_id: Optional[int]) -> None:
+        for handler in self._handlers.get(entity, ()):
+            try:
+                handler(entity_id)
+            except Exception:  # noqa: BLE001 - one bad handler mustn't block the others
+                logger.exception("cache invalidation for %s %s failed", entity, entity_id)
+
+    # ---- pruning -----------------------------------------------------
+
+    def prune(self, engine: Engine) -> int:
+        """Delete entries older than the retention; returns how many went."""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        with engine.begin() as conn:
+            return conn.execute(delete(ChangeLogEntry).where(ChangeLogEntry.created_at < cutoff)).rowcount
+
+    def start_pruning(self, engine: Engine) -> None:
+        self._stop.clear()
+        self._pruner = threading.Thread(target=self._prune_loop, args=(engine,), name="change-log-prune", daemon=True)
+        self._pruner.start()
+
+    def stop_pruning(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._pruner is not None:
+            self._pruner.join(timeout)
+            self._pruner = None
+
+    def _prune_loop(self, engine: Engine) -> None:
+        while not self._stop.is_set():
+            try:
+                self.prune(engine)
+            except Exception:
+                logger.exception("change_log prune failed")
+            self._stop.wait(self.retention / 10)
+
+
+class CacheCoherenceMiddleware:
+    """
+    Runs `coherence.check` on the thread pool before each HTTP request it
+    is due for, so a locked database blocks that request, not the loop.
+    It never writes; pruning runs on its own thread (`start_pruning`).
+    """
+
+    def __init__(self, app, coherence: CacheCoherence, engine: Engine) -> None:
+        self.app = app
+        self.coherence = coherence
+        self.engine = engine
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self.coherence.due():
+            await run_in_threadpool(self.coherence.check, self.engine)
+        await self.app(scope, receive, send)
+
+
+cache_coherence = CacheCoherence()
@@ -0,0 +1,232 @@
+"""
+Response compression negotiated from Accept-Encoding.
+
+`CompressionMiddleware` (pure ASGI) picks the best encoding the client
+accepts, by the client's q-values and then server preference zstd > br >
+gzip. zstd and br are only offered when their optional packages are
+installed (`pip install zstandard brotli`); gzip always is.
+
+  * Complete responses smaller than COMPRESSION_MIN_BYTES go out as-is.
+  * Streaming responses (CSV/NDJSON exports) are compressed chunk by chunk
+    with a sync flush after each one, so clients still receive rows as they
+    are produced.
+  * Responses that already carry Content-Encoding (for example the
+    precompressed scholarship catalog, see `precompressed_response`) pass
+    through untouched, as do non-text types and Server-Sent Events.
+
+Everything uses fast levels (gzip 6, br 4, zstd 3), cached bodies
+included: those are built on a request, so brotli 11 or zstd 19 would
+slow the first request after each catalog write by far more than the
+few percent of bytes they save.
+
+Configuration (env):
+  COMPRESSION_ENABLED (default true)
+  COMPRESSION_MIN_BYTES (default 1024)
+"""
+import gzip
+import os
+import zlib
+from typing import Callable, List, Optional
+
+from fastapi import Response
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() != "false"
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# Server preference, best first.
+AVAILABLE_ENCODINGS: List[str] = (
+    (["zstd"] if zstandard is not None else [])
+    + (["br"] if brotli is not None else [])
+    + ["gzip"]
+)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+def negotiate(accept_encoding: Optional[str], available: List[str] = AVAILABLE_ENCODINGS) -> Optional[str]:
+    """The encoding to use for this Accept-Encoding header, or None for identity."""
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip()] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Encoder:
+    """Incremental compressor: compress(), flush() (sync point), finish()."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._obj = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=4)
+        elif encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=3).compressobj()
+        else:
+            raise ValueError(f"unsupported encoding {encoding!r}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._obj.process(data)
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "gzip":
+            return self._obj.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._obj.flush()
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """One-shot compression at the same levels as the streaming encoder."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == "br":
+        return brotli.compress(data, quality=4)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"unsupported encoding {encoding!r}")
+
+
+def precompressed_response(
+    body: bytes,
+    accept_encoding: Optional[str],
+    encoded: Callable[[str], bytes],
+    media_type: str = "application/json",
+) -> Response:
+    """
+    Serve a cached body, using `encoded(encoding)` (which should cache its
+    result) when the client accepts compression and the body is big enough.
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = negotiate(accept_encoding) if len(body) >= COMPRESSION_MIN_BYTES else None
+    if encoding is None:
+        return Response(content=body, media_type=media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=encoded(encoding), media_type=media_type, headers=headers)
+
+
+def _compressible(headers: List[tuple]) -> bool:
+    content_type = b""
+    for name, value in headers:
+        name = name.lower()
+        if name == b"content-encoding":
+            return False
+        if name == b"content-type":
+            content_type = value
+    content_type = content_type.decode("latin-1").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(UNCOMPRESSIBLE_TYPES)
+
+
+def _with_vary(headers: List[tuple]) -> List[tuple]:
+    for i, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            if b"accept-encoding" not in value.lower():
+                headers[i] = (name, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        accept = None
+        for name, value in scope.get("headers") or []:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept)
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, encoder, passthrough
+            if passthrough:
+                return await send(message)
+            if message["type"] == "http.response.start":
+                # Hold the headers until the first body chunk shows how big it is.
+                start_message = message
+                if not _compressible(list(message.get("headers", []))):
+                    passthrough = True
+                    await send(message)
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    headers = _with_vary(list(start_message.get("headers", [])))
+                    passthrough = True
+                    await send({**start_message, "headers": headers})
+                    return await send(message)
+                encoder = _Encoder(encoding)
+                headers = [
+                    (k, v) for k, v in start_message.get("headers", []) if k.lower() != b"content-length"
+                ]
+                headers.append((b"content-encoding", encoding.encode()))
+                headers = _with_vary(headers)
+                if not more_body:
+                    compressed = encoder.compress(body) + encoder.finish()
+                    headers.append((b"content-length", str(len(compressed)).encode()))
+                    await send({**start_message, "headers": headers})
+                    return await send({"type": "http.response.body", "body": compressed})
+                await send({**start_message, "headers": headers})
+
+            if more_body:
+                chunk = encoder.compress(body) + encoder.flush()
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": encoder.compress(body) + encoder.finish()})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,94 @@
+"""
+Conditional GET: weak ETags and Last-Modified, answered with 304.
+
+Validators come from row versions, never from the response body, so an
+unchanged resource is answered before its rows are loaded or serialized:
+
+  * a single row: its id and `updated_at` (ETag and Last-Modified);
+  * a collection: `collection_version`, i.e. COUNT, MAX(id) and
+    MAX(updated_at) over the route's filters. Any insert, update or delete
+    changes one of them. Collections send no Last-Modified, because a
+    delete doesn't move MAX(updated_at).
+
+`If-None-Match` wins over `If-Modified-Since` (RFC 9110 13.2.2). Responses
+carry `Cache-Control: private, no-cache`, so browsers store them but always
+revalidate.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def collection_version(db: Session, model: Any, *criteria: Any) -> Tuple[int, Any, Any]:
+    """(count, max id, max updated_at) of the model's rows matching `criteria`."""
+    query = select(func.count(), func.max(model.id), func.max(model.updated_at)).select_from(model)
+    if criteria:
+        query = query.where(*criteria)
+    return tuple(db.execute(query).one())
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)  # stored timestamps are UTC
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match.
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request,
+    etag: str,
+    build: Callable[[], Response],
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """304 if the client's copy is current, otherwise `build()` with validators attached."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response = build()
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,141 @@
+"""
+Bounded executor for CPU-heavy password hashing.
+
+bcrypt releases the GIL, so a small dedicated thread pool gives real
+parallelism while capping how many hashes run at once. Requests beyond
+`max_workers + max_queue` are rejected immediately, and a caller whose job
+is still queued after `queue_timeout` gets HashingBusyError straight away
+(the job is cancelled, not run late).
+
+The auth routes await `run_async`, so a request waiting for a hash holds
+no Starlette threadpool thread; a login burst queues here, not in front of
+unrelated sync endpoints. `run` is the blocking form for scripts and other
+sync callers.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when the hashing executor is saturated or a job waited too long."""
+
+
+class PasswordHashExecutor:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: int = 64,
+        queue_timeout: float = 5.0,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="password-hash"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._wait_seconds_total = 0.0
+        self._hash_seconds_total = 0.0
+        self._hash_seconds_max = 0.0
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """Queue `fn(*args)` on the hashing pool; raises HashingBusyError when full."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingBusyError("Password hashing queue is full")
+
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def job() -> T:
+            started_at = time.perf_counter()
+            waited = started_at - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._wait_seconds_total += waited
+                if waited > self.queue_timeout:
+                    self._timed_out += 1
+                    raise HashingBusyError("Timed out waiting for a password hashing worker")
+                self._running += 1
+            try:
+                return fn(*args)
+            finally:
+                elapsed = time.perf_counter() - started_at
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._hash_seconds_total += elapsed
+                    self._hash_seconds_max = max(self._hash_seconds_max, elapsed)
+
+        def done(future: Future) -> None:
+            if future.cancelled():  # shed while still queued; job() never ran
+                with self._lock:
+                    self._queued -= 1
+                    self._timed_out += 1
+                    self._wait_seconds_total += time.perf_counter() - enqueued_at
+            self._slots.release()
+
+        try:
+            future = self._executor.submit(job)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+        future.add_done_callback(done)
+        return future
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` on the hashing pool and block until it finishes."""
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=self.queue_timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                raise HashingBusyError("Timed out waiting for a password hashing worker") from None
+            return future.result()  # already hashing; finishes within one hash time
+
+    async def run_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """`run` for async callers: waiting for the pool costs no thread."""
+        future = self.submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.cancel():
+                raise HashingBusyError("Timed out waiting for a password hashing worker") from None
+            return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self._completed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_timeout_seconds": self.queue_timeout,
+                "queue_depth": self._queued,
+                "in_flight": self._running,
+                "completed": completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": round(self._wait_seconds_total / max(completed + self._timed_out, 1) * 1000, 3),
+                "avg_hash_ms": round(self._hash_seconds_total / max(completed, 1) * 1000, 3),
+                "max_hash_ms": round(self._hash_seconds_max * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,41 @@
+"""
+Leases for background jobs that must run on one worker at a time.
+
+Every worker starts the same lifespan jobs. A job that shouldn't run
+concurrently takes the `job_leases` row for its name before each run: one
+INSERT ... ON CONFLICT DO UPDATE that only succeeds if the row is free,
+expired, or already ours. The holder renews it on every run; if its
+worker dies, another takes over once the lease expires.
+"""
+import os
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.job_lease import JobLease
+
+
+def new_holder() -> str:
+    return f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def acquire_lease(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """Take or renew the lease on `name` for `ttl_seconds`; False if another holder has it."""
+    now = datetime.utcnow()
+    stmt = sqlite_insert(JobLease).values(name=name, holder=holder, expires_at=now + timedelta(seconds=ttl_seconds))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[JobLease.name],
+        set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+        where=(JobLease.holder == holder) | (JobLease.expires_at < now),
+    )
+    acquired = db.execute(stmt.returning(JobLease.holder)).first() is not None
+    db.commit()
+    return acquired
+
+
+def release_lease(db: Session, name: str, holder: str) -> None:
+    db.execute(delete(JobLease).where(JobLease.name == name, JobLease.holder == holder))
+    db.commit()
@@ -0,0 +1,221 @@
+"""
+Per-route request metrics in Prometheus text format.
+
+`MetricsMiddleware` is a plain ASGI middleware (no BaseHTTPMiddleware task
+or body buffering). After the router has run, the matched route's template
+(`/api/v1/applications/{application_id}`) is the label, so ids never blow up
+cardinality; unmatched paths share one `<unmatched>` series.
+
+Updates happen on the event loop thread only (the middleware wraps the
+whole app, and sync routes run in the threadpool *inside* it), so the
+counters are plain ints in `__slots__` objects with no locks; a scrape just
+reads them. The route is only known once the router has matched, so the
+per-route in-flight gauge counts responses that have started but not
+finished (SSE streams, exports); `http_requests_in_flight_total` counts
+every request. The cost is two `perf_counter` calls, one dict lookup and a
+`bisect` per request; see `benchmarks/bench_metrics.py`.
+"""
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Seconds; roughly log-spaced from fast cached reads to slow bcrypt/export work.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteStats:
+    __slots__ = (
+        "buckets", "count", "seconds_sum", "in_flight", "statuses", "bytes_sum",
+        "db_queries", "db_seconds", "n_plus_one",
+    )
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)  # last = +Inf
+        self.count = 0
+        self.seconds_sum = 0.0
+        self.in_flight = 0
+        self.statuses: Dict[int, int] = {}
+        self.bytes_sum = 0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.n_plus_one = 0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        # All requests in flight; per-route gauges only start at response start.
+        self.in_flight = 0
+
+    def stats(self, method: str, route: str) -> RouteStats:
+        key = (method, route)
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = RouteStats()
+        return stats
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int) -> None:
+        stats = self.stats(method, route)
+        stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        stats.count += 1
+        stats.seconds_sum += seconds
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.bytes_sum += size
+
+    def observe_queries(self, method: str, route: str, queries: int, seconds: float, repeated_shapes: int) -> None:
+        """SQL work for one request (from app.core.query_stats)."""
+        stats = self.stats(method, route)
+        stats.db_queries += queries
+        stats.db_seconds += seconds
+        if repeated_shapes:
+            stats.n_plus_one += 1
+
+    def reset(self) -> None:
+        self.routes.clear()
+        self.in_flight = 0
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        items = sorted(self.routes.items())
+        for (method, route), s in items:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, s.buckets):
+                cumulative += n
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {s.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {_fmt(s.seconds_sum)}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {s.count}")
+
+        lines += [
+            "# HELP http_requests_total Completed requests by route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), s in items:
+            for status, n in sorted(s.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {n}'
+                )
+
+        lines += [
+            "# HELP http_response_size_bytes Response body bytes by route template.",
+            "# TYPE http_response_size_bytes summary",
+        ]
+        for (method, route), s in items:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            lines.append(f"http_response_size_bytes_sum{{{labels}}} {s.bytes_sum}")
+            lines.append(f"http_response_size_bytes_count{{{labels}}} {s.count}")
+
+        lines += [
+            "# HELP http_request_db_queries_total SQL statements executed while serving the route.",
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        for (method, route), s in items:
+            lines.append(f'http_request_db_queries_total{{method="{method}",route="{_escape(route)}"}} {s.db_queries}')
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL statements while serving the route.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route), s in items:
+            lines.append(
+                f'http_request_db_seconds_total{{method="{method}",route="{_escape(route)}"}} {_fmt(s.db_seconds)}'
+            )
+        lines += [
+            "# HELP http_requests_suspected_n_plus_one_total Requests that repeated one statement shape "
+            "N_PLUS_ONE_THRESHOLD or more times.",
+            "# TYPE http_requests_suspected_n_plus_one_total counter",
+        ]
+        for (method, route), s in items:
+            if s.n_plus_one:
+                lines.append(
+                    f'http_requests_suspected_n_plus_one_total{{method="{method}",route="{_escape(route)}"}} '
+                    f"{s.n_plus_one}"
+                )
+
+        lines += [
+            "# HELP http_requests_in_flight_total Requests currently being handled, all routes.",
+            "# TYPE http_requests_in_flight_total gauge",
+            f"http_requests_in_flight_total {self.in_flight}",
+            "# HELP http_requests_in_flight Requests whose response has started but not finished "
+            "(streams, exports), by route template.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for (method, route), s in items:
+            if s.in_flight:
+                lines.append(f'http_requests_in_flight{{method="{method}",route="{_escape(route)}"}} {s.in_flight}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+_PATH_PARAM = re.compile(r"{([^}:]+)(?::[^}]*)?}")
+
+
+def route_template(scope) -> str:
+    route = scope.get("route")
+    template: Optional[str] = getattr(route, "path_format", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    # Routes from include_router(prefix=...) carry their own relative path;
+    # recover the prefix from the part of the request path they didn't match.
+    params = scope.get("path_params") or {}
+    concrete = _PATH_PARAM.sub(lambda m: str(params.get(m.group(1), m.group(0))), template)
+    path = scope["path"]
+    if path != concrete and path.endswith(concrete):
+        return path[: -len(concrete)] + template
+    return template
+
+
+class MetricsMiddleware:
+    def __init__(self, app, registry: MetricsRegistry = registry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        registry = self.registry
+        started = time.perf_counter()
+        status = 500
+        size = 0
+        route_stats: Optional[RouteStats] = None
+        registry.in_flight += 1
+
+        async def send_wrapper(message):
+            nonlocal status, size, route_stats
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # The router has matched by now; count this request against its route.
+                route_stats = registry.stats(scope["method"], route_template(scope))
+                route_stats.in_flight += 1
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.in_flight -= 1
+            if route_stats is not None:
+                route_stats.in_flight -= 1
+            registry.observe(
+                scope["method"], route_template(scope), status, time.perf_counter() - started, size
+            )
@@ -0,0 +1,350 @@
+"""
+On-demand request profiling.
+
+`ProfilingMiddleware` runs a statistical stack sampler around selected
+requests and writes the result to PROFILE_DIR, keeping the newest
+PROFILE_MAX_FILES. A request is profiled when:
+
+  * it carries `X-Profile: 1` and an access token with the engr_admin role.
+    Tokens without the admin claim are turned away from the JWT alone; an
+    admin claim is then checked like any authenticated request, against the
+    cached principal (app.auth.principal_cache; only a miss reads the user
+    row), so a demoted or deactivated admin loses access straight away, or
+  * it is picked by PROFILE_SAMPLE_RATE (0.0-1.0; 0 disables sampling).
+
+Profiled responses carry `X-Profile-Id`; `GET /api/v1/admin/profiles` lists
+captures and `GET /api/v1/admin/profiles/{profile_id}` downloads one.
+
+Why a sampler instead of cProfile: sync routes and dependencies run in the
+threadpool, which a per-thread cProfile started by the middleware never
+sees. The sampler thread reads `sys._current_frames()` every
+PROFILE_INTERVAL_MS and keeps the event loop thread (unless it is idle in
+`select`) and busy threadpool workers. Worker threads carry no request id,
+so a profile taken while other requests were in flight may include their
+stacks; each profile records the peak number of requests in flight
+(`peak_in_flight`) so those can be recognised. Work handed to other pools
+(bcrypt runs in app.core.hashing) shows up as the wait on its future.
+
+Output (PROFILE_FORMAT):
+  collapsed   one `frame;frame;frame count` line per stack (flamegraph.pl,
+              speedscope, inferno all read it)
+  speedscope  speedscope.app "sampled" JSON with one profile per thread
+"""
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.auth.service import principal_from_token
+from app.core import security
+from app.core.metrics import MetricsRegistry, registry as metrics_registry, route_template
+from app.database import SessionLocal
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", "./profiles"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "1"))
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "collapsed")
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ADMIN_ROLE = "engr_admin"
+EXTENSIONS = {"collapsed": ".collapsed.txt", "speedscope": ".speedscope.json"}
+
+_ID = re.compile(r"^\d{13}-[0-9a-f]{8}$")
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+
+
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages/", "/backend/"):
+        idx = filename.rfind(marker)
+        if idx != -1:
+            return filename[idx + len(marker):]
+    return filename
+
+
+def _stack(frame) -> List[Frame]:
+    """Outermost-first list of frames."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_name, _short_path(code.co_filename), code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _is_idle(stack: List[Frame]) -> bool:
+    if not stack:
+        return True
+    name, filename, _ = stack[-1]
+    # Event loop waiting for I/O, or a threadpool worker waiting for work.
+    if filename.endswith("selectors.py") and name == "select":
+        return True
+    for (outer, outer_file, _), (inner, inner_file, _) in zip(stack, stack[1:]):
+        if outer == "run" and "anyio" in outer_file:
+            return inner == "get" and inner_file.endswith("queue.py")
+    return False
+
+
+def _is_worker(thread: Optional[threading.Thread]) -> bool:
+    return thread is not None and type(thread).__name__ == "WorkerThread"
+
+
+class StackSampler:
+    """Samples the request's event loop thread and busy threadpool workers."""
+
+    def __init__(self, loop_thread_id: int, interval: float) -> None:
+        self.loop_thread_id = loop_thread_id
+        self.interval = interval
+        self.samples: Dict[int, Counter] = {}
+        self.thread_names: Dict[int, str] = {}
+        self.started = 0.0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            threads = {t.ident: t for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                thread = threads.get(thread_id)
+                if thread_id != self.loop_thread_id and not _is_worker(thread):
+                    continue
+                stack = _stack(frame)
+                if _is_idle(stack):
+                    continue
+                self.thread_names.setdefault(thread_id, thread.name if thread else str(thread_id))
+                self.samples.setdefault(thread_id, Counter())[tuple(stack)] += 1
+
+    @property
+    def total_samples(self) -> int:
+        return sum(sum(c.values()) for c in self.samples.values())
+
+
+def _label(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({filename}:{line})".replace(";", ":")
+
+
+def render_collapsed(sampler: StackSampler) -> str:
+    lines = []
+    for thread_id, stacks in sampler.samples.items():
+        root = sampler.thread_names[thread_id].replace(";", ":").replace(" ", "_")
+        for stack, count in stacks.most_common():
+            lines.append(";".join([root] + [_label(f) for f in stack]) + f" {count}")
+    return "\n".join(lines) + "\n"
+
+
+def render_speedscope(sampler: StackSampler, name: str) -> str:
+    frames: List[dict] = []
+    index: Dict[Frame, int] = {}
+    profiles = []
+    for thread_id, stacks in sampler.samples.items():
+        samples, weights = [], []
+        for stack, count in stacks.items():
+            ids = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                ids.append(index[frame])
+            samples.append(ids)
+            weights.append(count * sampler.interval)
+        profiles.append({
+            "type": "sampled",
+            "name": sampler.thread_names[thread_id],
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        })
+    return json.dumps({
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "eduaid-profiler",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    })
+
+
+class ProfileStore:
+    """Profiles as `<id><ext>` plus a `<id>.meta.json` sidecar; keeps the newest `max_files`."""
+
+    def __init__(self, directory: Path = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES) -> None:
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_id() -> str:
+        # Sorts by capture time; the suffix keeps concurrent captures apart.
+        return f"{int(time.time() * 1000):013d}-{random.getrandbits(32):08x}"
+
+    def save(self, profile_id: str, fmt: str, body: str, meta: dict) -> None:
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{profile_id}{EXTENSIONS[fmt]}").write_text(body)
+            meta = {"id": profile_id, "format": fmt, "bytes": len(body.encode()), **meta}
+            (self.directory / f"{profile_id}.meta.json").write_text(json.dumps(meta))
+            self._prune()
+
+    def _ids(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        ids = [p.name[: -len(".meta.json")] for p in self.directory.glob("*.meta.json")]
+        return sorted((i for i in ids if _ID.match(i)), reverse=True)
+
+    def _prune(self) -> None:
+        for stale in self._ids()[self.max_files:]:
+            for path in self.directory.glob(f"{stale}.*"):
+                path.unlink(missing_ok=True)
+
+    def list(self) -> List[dict]:
+        entries = []
+        for profile_id in self._ids():
+            try:
+                entries.append(json.loads((self.directory / f"{profile_id}.meta.json").read_text()))
+            except (OSError, ValueError):
+                continue  # pruned by another worker mid-listing
+        return entries
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """File for a listed profile id; anything else (including traversal) is None."""
+        if not _ID.match(profile_id):
+            return None
+        for ext in EXTENSIONS.values():
+            path = self.directory / f"{profile_id}{ext}"
+            if path.is_file():
+                return path
+        return None
+
+
+profile_store = ProfileStore()
+
+
+def _admin_token(scope) -> Optional[str]:
+    """The bearer token of an `X-Profile` request whose claims say engr_admin."""
+    headers = dict(scope.get("headers") or [])
+    if headers.get(PROFILE_HEADER, b"").strip() not in (b"1", b"true"):
+        return None
+    auth = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = security.decode_token(token.strip(), refresh=False)
+    except ValueError:
+        return None
+    if payload.get("token_type") != "access" or payload.get("role") != PROFILE_ADMIN_ROLE:
+        return None
+    return token.strip()
+
+
+def _is_current_admin(session_factory: Callable[[], Session], token: str) -> bool:
+    with session_factory() as db:  # connects only on a principal cache miss
+        try:
+            principal = principal_from_token(db, token)
+        except HTTPException:  # inactive, deleted, or role changed since the token was issued
+            return False
+    return principal.role.value == PROFILE_ADMIN_ROLE
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app,
+        store: ProfileStore = profile_store,
+        sample_rate: float = PROFILE_SAMPLE_RATE,
+        interval_ms: float = PROFILE_INTERVAL_MS,
+        fmt: str = PROFILE_FORMAT,
+        registry: MetricsRegistry = metrics_registry,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        if fmt not in EXTENSIONS:
+            raise ValueError(f"PROFILE_FORMAT must be one of {sorted(EXTENSIONS)}")
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+        self.fmt = fmt
+        self.registry = registry
+        self.session_factory = session_factory
+
+    async def _admin_requested(self, scope) -> bool:
+        token = _admin_token(scope)
+        if token is None:
+            return False
+        return await run_in_threadpool(_is_current_admin, self.session_factory, token)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        trigger = "header" if await self._admin_requested(scope) else None
+        if trigger is None and self.sample_rate > 0 and random.random() < self.sample_rate:
+            trigger = "sample"
+        if trigger is None:
+            return await self.app(scope, receive, send)
+
+        profile_id = self.store.new_id()
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        peak = self.registry.in_flight
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal peak, status
+            peak = max(peak, self.registry.in_flight)
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            method, route = scope["method"], route_template(scope)
+            body = (
+                render_speedscope(sampler, f"{method} {route}")
+                if self.fmt == "speedscope"
+                else render_collapsed(sampler)
+            )
+            self.store.save(profile_id, self.fmt, body, {
+                "method": method,
+                "route": route,
+                "path": scope["path"],
+                "status": status,
+                "trigger": trigger,
+                "duration_ms": round(sampler.elapsed * 1000, 3),
+                "samples": sampler.total_samples,
+                "interval_ms": self.interval * 1000,
+                "peak_in_flight": peak,
+                "captured_at": time.time(),
+            })
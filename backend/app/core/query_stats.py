@@ -0,0 +1,143 @@
+"""
+Per-request SQL instrumentation.
+
+Engine-level `before/after_cursor_execute` listeners add every statement's
+count and duration to the `QueryStats` of the request being served (held in
+a context variable, which Starlette copies into the threadpool for sync
+routes). `QueryStatsMiddleware` then:
+
+  * adds `Server-Timing: db;dur=<ms>;desc="<n> queries"` to the response,
+  * feeds the per-route query/DB-time counters in `app.core.metrics`,
+  * logs a warning when one statement shape ran `N_PLUS_ONE_THRESHOLD` or
+    more times in a single request (the classic N+1 signature).
+
+Statement shapes are the SQL text with whitespace collapsed and expanded
+IN lists folded to `(?...)`, so `WHERE id IN (?, ?, ?)` groups together.
+
+Configuration (env):
+  QUERY_STATS_ENABLED (default true)
+  N_PLUS_ONE_THRESHOLD (default 5)
+"""
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import MetricsRegistry, registry as metrics_registry, route_template
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """Statement shapes run at least `threshold` times (suspected N+1)."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_current_scope: ContextVar[Optional[dict]] = ContextVar("query_stats_scope", default=None)
+
+
+def current_request() -> Optional[Tuple[str, str]]:
+    """(method, route template) of the request whose code is running, if any."""
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    return scope["method"], route_template(scope)
+
+# Called with (method, route, stats) after each request; used by the test query budget.
+_request_listeners: List[Callable[[str, str, QueryStats], None]] = []
+
+
+def add_request_listener(callback: Callable[[str, str, QueryStats], None]) -> None:
+    _request_listeners.append(callback)
+
+
+def remove_request_listener(callback: Callable[[str, str, QueryStats], None]) -> None:
+    if callback in _request_listeners:
+        _request_listeners.remove(callback)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        started = conn.info.get("query_started")
+        if started:
+            stats.record(statement, time.perf_counter() - started.pop())
+
+
+class QueryStatsMiddleware:
+    def __init__(
+        self,
+        app,
+        registry: MetricsRegistry = metrics_registry,
+        n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        scope_token = _current_scope.set(scope)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            _current_scope.reset(scope_token)
+            method, route = scope["method"], route_template(scope)
+            repeated = stats.repeated(self.n_plus_one_threshold)
+            for shape, n in repeated:
+                logger.warning("Suspected N+1 on %s %s: %d x %s", method, route, n, shape)
+            self.registry.observe_queries(method, route, stats.count, stats.seconds, len(repeated))
+            for callback in list(_request_listeners):
+                callback(method, route, stats)
@@ -1,4 +1,5 @@
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Union
 
@@ -7,10 +8,59 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from dotenv import load_dotenv
 
+from app.core.hashing import HashingBusyError, PasswordHashExecutor
+
 # Load environment variables from .env if present
 load_dotenv()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = BCRYPT_MIN_ROUNDS,
+    max_rounds: int = BCRYPT_MAX_ROUNDS,
+) -> int:
+    """
+    Pick the highest bcrypt cost whose hash time stays within `target_ms` on
+    this machine. Each extra round doubles the work, so one timing at
+    `min_rounds` is enough to extrapolate.
+    """
+    probe = CryptContext(schemes=["bcrypt"], bcrypt__rounds=min_rounds)
+    start = time.perf_counter()
+    probe.hash("calibration-probe")
+    base_ms = (time.perf_counter() - start) * 1000
+    rounds = min_rounds
+    while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    return rounds
+
+
+def _configured_bcrypt_rounds() -> int:
+    if os.getenv("BCRYPT_ROUNDS"):
+        return int(os.environ["BCRYPT_ROUNDS"])
+    if os.getenv("BCRYPT_TARGET_MS"):
+        rounds = calibrate_bcrypt_rounds(float(os.environ["BCRYPT_TARGET_MS"]))
+        # Visible to processes this one starts (e.g. the import hashing pool),
+        # not to sibling uvicorn/gunicorn workers: each of those calibrates on
+        # its own. For several workers, set BCRYPT_ROUNDS from
+        # `python -m app.cli.calibrate_bcrypt` instead.
+        os.environ["BCRYPT_ROUNDS"] = str(rounds)
+        return rounds
+    return 12  # passlib's default
+
+
+BCRYPT_ROUNDS = _configured_bcrypt_rounds()
+
+# min_rounds makes needs_update() flag hashes made with a lower cost, so they
+# get upgraded the next time the user logs in.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
 
 # Defaults are for development; override via environment variables in production.
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-key-change-me")
@@ -19,6 +69,13 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 ALGORITHM = "HS256"
 
+# Dedicated pool for bcrypt so hashing bursts can't starve the request threadpool.
+password_hasher = PasswordHashExecutor(
+    max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", "0")) or None,
+    max_queue=int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64")),
+    queue_timeout=float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", "5")),
+)
+
 
 def get_password_hash(password: str) -> str:
     # Enforce 20-char max (project requirement), well within bcrypt's 72-byte limit.
@@ -31,6 +88,30 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
+
+def hash_password_bounded(password: str) -> str:
+    """`get_password_hash` on the bounded hashing pool; may raise HashingBusyError."""
+    return password_hasher.run(get_password_hash, password)
+
+
+def verify_password_bounded(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password` on the bounded hashing pool; may raise HashingBusyError."""
+    return password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """`hash_password_bounded` for async routes: awaiting the pool holds no thread."""
+    return await password_hasher.run_async(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password_bounded` for async routes: awaiting the pool holds no thread."""
+    return await password_hasher.run_async(verify_password, plain_password, hashed_password)
+
+
 def _build_expiry(delta: timedelta) -> datetime:
     return datetime.now(timezone.utc) + delta
 
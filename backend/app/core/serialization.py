@@ -0,0 +1,82 @@
+"""
+Fast JSON for large list responses.
+
+A `response_model` list route hydrates one ORM object per row and then
+validates each object from attributes before encoding. For big lists the
+hot routes instead select just the schema's columns with Core and hand the
+row tuples to `rows_response`, which zips them into dicts and encodes them
+in one call:
+
+  * with orjson installed (optional: `pip install orjson`), `orjson.dumps`;
+  * otherwise a cached `TypeAdapter(list[<schema>Row])`, a TypedDict with
+    the schema's fields, whose `dump_json` writes the same JSON a
+    `response_model` route would, without building model instances.
+
+Rows are trusted as-is (they come from the columns the schema mirrors), so
+nothing is re-validated. Keep `response_model=` on the route for the
+OpenAPI schema; FastAPI skips it when a Response is returned.
+See `benchmarks/bench_serialization.py` for per-row costs.
+
+`model_response` / `models_response` build the same body from ORM objects,
+for routes that must return a Response (e.g. app.core.conditional).
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, Sequence, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def schema_fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def schema_columns(schema: Type[BaseModel], model: Any) -> List[Any]:
+    """The model's columns for each schema field, in field order, for `select(*...)`."""
+    table = model.__table__
+    return [table.c[name] for name in schema_fields(schema)]
+
+
+@lru_cache(maxsize=None)
+def row_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    fields = {name: field.annotation for name, field in schema.model_fields.items()}
+    row_type = TypedDict(f"{schema.__name__}Row", fields)  # type: ignore[misc]
+    return TypeAdapter(List[row_type])
+
+
+def encode_rows(schema: Type[BaseModel], rows: Iterable[Sequence[Any]]) -> bytes:
+    """JSON array of objects keyed by the schema's fields, from rows in field order."""
+    fields = schema_fields(schema)
+    dicts = [dict(zip(fields, row)) for row in rows]
+    if orjson is not None:
+        return orjson.dumps(dicts)
+    return row_adapter(schema).dump_json(dicts)
+
+
+def rows_response(schema: Type[BaseModel], rows: Iterable[Sequence[Any]], status_code: int = 200) -> Response:
+    return Response(content=encode_rows(schema, rows), status_code=status_code, media_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def model_response(schema: Type[BaseModel], obj: Any, status_code: int = 200) -> Response:
+    """What `response_model=schema` would send for one ORM object."""
+    body = schema.model_validate(obj, from_attributes=True).model_dump_json()
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def models_response(schema: Type[BaseModel], objs: Iterable[Any], status_code: int = 200) -> Response:
+    """What `response_model=List[schema]` would send for a list of ORM objects."""
+    adapter = list_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(list(objs), from_attributes=True))
+    return Response(content=body, status_code=status_code, media_type="application/json")
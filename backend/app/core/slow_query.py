@@ -0,0 +1,238 @@
+"""
+Slow-query log with query plans.
+
+`SlowQueryLog.install(engine)` times every statement on the engine and
+keeps, per statement shape (`app.core.query_stats.statement_shape`), the
+call count and total/max time, so the admin endpoint can rank statements
+by total time including fast-but-frequent ones. Statements slower than
+SLOW_QUERY_MS are also:
+
+  * appended to an in-memory ring buffer (SLOW_QUERY_BUFFER entries),
+  * written as one JSON line to SLOW_QUERY_LOG_FILE, rotated at
+    SLOW_QUERY_LOG_MAX_BYTES with SLOW_QUERY_LOG_BACKUPS old files.
+
+Each entry has the normalized SQL, the bound-parameter shape (types, never
+values), duration and the originating route (from the request context set
+by QueryStatsMiddleware, or "-" for background jobs and CLIs). The first
+time a shape is slow its plan is captured with `EXPLAIN QUERY PLAN` on a
+raw cursor of the same connection, so the plan lookup itself is never timed
+or logged. Plans are captured on SQLite only: there a failing EXPLAIN leaves
+the caller's transaction usable, whereas on PostgreSQL it would abort the
+request's open transaction. Other dialects still get timings and the log,
+with the plan recorded as unavailable.
+
+With several workers each process keeps its own buffer and totals; the
+rotating file should then be per worker (e.g. SLOW_QUERY_LOG_FILE with the
+pid), since RotatingFileHandler does not coordinate rotation across
+processes.
+
+Configuration (env):
+  SLOW_QUERY_LOG_ENABLED (default true)
+  SLOW_QUERY_MS (default 100)
+  SLOW_QUERY_BUFFER (default 500)
+  SLOW_QUERY_LOG_FILE (default ./slow_queries.log; empty = buffer only)
+  SLOW_QUERY_LOG_MAX_BYTES (default 5 MB), SLOW_QUERY_LOG_BACKUPS (default 3)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.query_stats import current_request, statement_shape
+
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() != "false"
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+SLOW_QUERY_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER", "500"))
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "./slow_queries.log")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "3"))
+
+# Distinct shapes tracked; beyond this only already-known shapes are aggregated.
+MAX_SHAPES = 5000
+EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN "}
+
+
+@lru_cache(maxsize=4096)
+def _shape(statement: str) -> str:
+    # Compiled statements are cached by SQLAlchemy, so the same strings recur.
+    return statement_shape(statement)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Types of the bound parameters, e.g. `(int, str)` or `3 x (int, NoneType)`."""
+    if executemany:
+        rows = list(parameters or [])
+        return f"{len(rows)} x {parameter_shape(rows[0])}" if rows else "0 x ()"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return type(parameters).__name__
+
+
+class StatementTotals:
+    __slots__ = ("shape", "calls", "seconds", "max_seconds", "slow_calls", "plan", "last_route")
+
+    def __init__(self, shape: str) -> None:
+        self.shape = shape
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.slow_calls = 0
+        self.plan: Optional[str] = None
+        self.last_route: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "statement": self.shape,
+            "calls": self.calls,
+            "total_ms": round(self.seconds * 1000, 3),
+            "mean_ms": round(self.seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "slow_calls": self.slow_calls,
+            "last_slow_route": self.last_route,
+            "plan": self.plan,
+        }
+
+
+TOP_ORDERINGS = {
+    "total": lambda t: t.seconds,
+    "max": lambda t: t.max_seconds,
+    "calls": lambda t: t.calls,
+    "slow": lambda t: t.slow_calls,
+}
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_MS,
+        buffer_size: int = SLOW_QUERY_BUFFER,
+        log_file: Optional[str] = SLOW_QUERY_LOG_FILE,
+        max_bytes: int = SLOW_QUERY_LOG_MAX_BYTES,
+        backups: int = SLOW_QUERY_LOG_BACKUPS,
+    ) -> None:
+        self.threshold = threshold_ms / 1000
+        self.recent: Deque[dict] = deque(maxlen=buffer_size)
+        self.totals: Dict[str, StatementTotals] = {}
+        self._lock = threading.Lock()
+        self._file_logger: Optional[logging.Logger] = None
+        if log_file:
+            self._file_logger = logging.getLogger(f"{__name__}.file.{id(self)}")
+            self._file_logger.propagate = False
+            self._file_logger.setLevel(logging.INFO)
+            handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups, delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_logger.addHandler(handler)
+
+    # ---- engine hooks ------------------------------------------------
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def uninstall(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("slow_query_started")
+        if not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        shape = _shape(statement)
+        with self._lock:
+            totals = self.totals.get(shape)
+            if totals is None:
+                if len(self.totals) >= MAX_SHAPES:
+                    return
+                totals = self.totals[shape] = StatementTotals(shape)
+            totals.calls += 1
+            totals.seconds += seconds
+            if seconds > totals.max_seconds:
+                totals.max_seconds = seconds
+            if seconds < self.threshold:
+                return
+            totals.slow_calls += 1
+            need_plan = totals.plan is None
+            # Claim the plan slot so concurrent slow calls don't all EXPLAIN.
+            if need_plan:
+                totals.plan = ""
+
+        request = current_request()
+        route = f"{request[0]} {request[1]}" if request else "-"
+        if need_plan:
+            plan = self._explain(conn, statement, parameters, executemany)
+        entry = {
+            "ts": time.time(),
+            "duration_ms": round(seconds * 1000, 3),
+            "statement": shape,
+            "parameters": parameter_shape(parameters, executemany),
+            "route": route,
+        }
+        with self._lock:
+            totals.last_route = route
+            if need_plan:
+                totals.plan = plan
+            self.recent.append(entry)
+        if self._file_logger is not None:
+            line = dict(entry, plan=plan) if need_plan else entry
+            self._file_logger.info(json.dumps(line))
+
+    def _explain(self, conn, statement: str, parameters: Any, executemany: bool) -> str:
+        prefix = EXPLAIN_PREFIX.get(conn.dialect.name)
+        if prefix is None:
+            return f"unavailable: plans are only captured on SQLite, not {conn.dialect.name}"
+        if executemany:
+            parameters = next(iter(parameters or []), ())
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(prefix + statement, parameters or ())
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as exc:  # noqa: BLE001 - a plan is best effort
+            return f"unavailable: {exc}"
+        return format_plan(rows)
+
+    # ---- reporting ---------------------------------------------------
+
+    def top(self, limit: int = 20, order_by: str = "total") -> List[dict]:
+        key = TOP_ORDERINGS[order_by]
+        with self._lock:
+            ranked = sorted(self.totals.values(), key=key, reverse=True)[:limit]
+            return [t.as_dict() for t in ranked]
+
+    def recent_entries(self, limit: int = 50) -> List[dict]:
+        with self._lock:
+            return list(self.recent)[-limit:][::-1]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.recent.clear()
+            self.totals.clear()
+
+
+def format_plan(rows: List[tuple]) -> str:
+    # SQLite rows are (id, parent, notused, detail); indent children under parents.
+    depth: Dict[int, int] = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + str(detail))
+    return "\n".join(lines)
+
+
+slow_query_log = SlowQueryLog()
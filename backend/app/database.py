@@ -1,16 +1,56 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from app.core.slow_query import SLOW_QUERY_LOG_ENABLED, slow_query_log
+
 # SQLite database; stored in backend/eduaid.db relative to the run directory.
 SQLALCHEMY_DATABASE_URL = "sqlite:///./eduaid.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+# Statements over SLOW_QUERY_MS are logged with their plan; see app.core.slow_query.
+if SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Columns added to existing tables after release: (table, column, SQL type).
+# create_all only creates missing tables, so upgrade_schema adds these to
+# databases created before them and stamps existing rows with the current time.
+ADDED_COLUMNS = [
+    ("scholarships", "updated_at", "DATETIME"),
+]
+
+# Indexes added to existing tables after release: (index, table, columns).
+# create_all skips tables that already exist, so databases created before
+# these get them here.
+ADDED_INDEXES = [
+    ("ix_users_role", "users", "role"),
+    ("ix_users_is_active", "users", "is_active"),
+    ("ix_notifications_user_read", "notifications", "user_id, is_read"),
+    ("ix_notifications_user_id_id", "notifications", "user_id, id"),
+    ("ix_applications_user_scholarship", "applications", "user_id, scholarship_id"),
+]
+
+
+def upgrade_schema(bind) -> None:
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table, column, sql_type in ADDED_COLUMNS:
+            if not inspector.has_table(table):
+                continue
+            if column in {c["name"] for c in inspector.get_columns(table)}:
+                continue
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}"))
+            conn.execute(text(f"UPDATE {table} SET {column} = CURRENT_TIMESTAMP"))
+        for name, table, columns in ADDED_INDEXES:
+            if inspector.has_table(table):
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
 
 def get_db():
     """FastAPI dependency that yields a database session."""
@@ -1,8 +1,12 @@
 # app/main.py
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine, upgrade_schema
 import app.models  # ensures models are registered with Base
 
 from app.auth import router as auth_router
@@ -12,11 +16,63 @@ from app.api.v1 import (
     routes_applications,
     routes_applicant_profile,
     routes_notifications,
+    routes_exports,
 )
 
+from app.auth.principal_cache import principal_cache
+from app.core.coherence import CacheCoherenceMiddleware, cache_coherence
+from app.core.compression import COMPRESSION_ENABLED, CompressionMiddleware
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.profiling import PROFILING_ENABLED, ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.notifications.digest import DIGEST_TICK_SECONDS, DIGEST_WINDOW_SECONDS, DigestScheduler
+from app.notifications.reminders import REMINDER_INTERVAL_SECONDS, DeadlineReminderJob
+from app.notifications.retention import NotificationRetentionJob
+from app.notifications.unread_counter import unread_counter
+from app.notifications.worker import EmailOutboxWorker
+from app.services.catalog_cache import scholarship_catalog
+from app.services.user_import_service import shutdown_hash_pools
+
 Base.metadata.create_all(bind=engine)
+upgrade_schema(engine)
+
 
-app = FastAPI(title="UMSAMS Backend")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Outbox sender threads only run when SMTP is configured.
+    worker = None
+    if os.getenv("SMTP_HOST") and int(os.getenv("EMAIL_OUTBOX_WORKERS", "2")) > 0:
+        worker = EmailOutboxWorker.from_env(SessionLocal)
+        worker.start()
+    retention = None
+    if float(os.getenv("NOTIFICATION_RETENTION_INTERVAL_SECONDS", "3600")) > 0:
+        retention = NotificationRetentionJob.from_env(SessionLocal)
+        retention.start()
+    digests = None
+    if DIGEST_WINDOW_SECONDS > 0 and DIGEST_TICK_SECONDS > 0:
+        digests = DigestScheduler(SessionLocal)
+        digests.start()
+    reminders = None
+    if REMINDER_INTERVAL_SECONDS > 0:
+        reminders = DeadlineReminderJob(SessionLocal)
+        reminders.start()
+    if cache_coherence.enabled:
+        cache_coherence.start_pruning(engine)
+    yield
+    if cache_coherence.enabled:
+        cache_coherence.stop_pruning()
+    if reminders is not None:
+        reminders.stop()
+    if digests is not None:
+        digests.stop()
+    if retention is not None:
+        retention.stop()
+    if worker is not None:
+        worker.stop()
+    shutdown_hash_pools()
+
+
+app = FastAPI(title="UMSAMS Backend", lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -29,8 +85,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by the frontend client for conditional GETs (app.core.conditional)
+    expose_headers=["ETag", "Last-Modified"],
 )
 
+# Several workers (CACHE_COHERENCE=change_log): drop cache entries other workers
+# changed before handling each request
+if cache_coherence.enabled:
+    cache_coherence.register("scholarship", lambda _: scholarship_catalog.invalidate())
+    cache_coherence.register(
+        "user", lambda user_id: principal_cache.clear() if user_id is None else principal_cache.invalidate(user_id)
+    )
+    cache_coherence.register("notification", unread_counter.invalidate)
+    app.add_middleware(CacheCoherenceMiddleware, coherence=cache_coherence, engine=engine)
+
+# gzip/br/zstd negotiated from Accept-Encoding; inside the metrics middleware so
+# response sizes are the bytes actually sent
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# Per-request SQL counts/time (Server-Timing header, N+1 warnings)
+if os.getenv("QUERY_STATS_ENABLED", "true").lower() != "false":
+    app.add_middleware(QueryStatsMiddleware, registry=metrics_registry)
+
+# Per-route latency/status/size metrics, scraped from /metrics (added last = outermost)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint():
+        return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+# On-demand profiling (admin X-Profile header or PROFILE_SAMPLE_RATE); outermost so
+# the profile covers every other middleware too
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, registry=metrics_registry)
+
 # Auth routes: /api/v1/auth/...
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 
@@ -48,3 +139,6 @@ app.include_router(routes_applicant_profile.router, prefix="/api/v1", tags=["app
 
 # Notifications
 app.include_router(routes_notifications.router, prefix="/api/v1", tags=["notifications"])
+
+# Streaming CSV/NDJSON exports (admin only)
+app.include_router(routes_exports.router, prefix="/api/v1", tags=["exports"])
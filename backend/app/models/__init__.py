@@ -5,5 +5,26 @@ from app.models.application import Application
 from app.models.applicant_profile import ApplicantProfile
 from app.models.review import Review
 from app.models.notification import Notification
+from app.models.rate_limit import RateLimitCounter
+from app.models.email_outbox import EmailOutbox
+from app.models.notification_archive import NotificationArchive
+from app.models.notification_digest import NotificationDigestEvent
+from app.models.deadline_reminder import DeadlineReminder
+from app.models.change_log import ChangeLogEntry
+from app.models.job_lease import JobLease
 
-__all__ = ["User", "Scholarship", "Application", "ApplicantProfile", "Review", "Notification"]
+__all__ = [
+    "User",
+    "Scholarship",
+    "Application",
+    "ApplicantProfile",
+    "Review",
+    "Notification",
+    "RateLimitCounter",
+    "EmailOutbox",
+    "NotificationArchive",
+    "NotificationDigestEvent",
+    "DeadlineReminder",
+    "ChangeLogEntry",
+    "JobLease",
+]
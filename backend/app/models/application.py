@@ -9,6 +9,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
 )
 
 from app.database import Base
@@ -44,3 +45,8 @@ class Application(Base):
         default=datetime.utcnow,
         onupdate=datetime.utcnow,
     )
+
+    __table_args__ = (
+        # "Has this user applied to this scholarship?" (reminder anti-join, duplicate checks)
+        Index("ix_applications_user_scholarship", "user_id", "scholarship_id"),
+    )
@@ -0,0 +1,21 @@
+# app/models/change_log.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.database import Base
+
+
+class ChangeLogEntry(Base):
+    """One committed change to a cached entity, read by the other workers (app.core.coherence)."""
+
+    __tablename__ = "change_log"
+
+    # AUTOINCREMENT: ids must never be reused after pruning, workers read `id > last seen`.
+    id = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)  # "scholarship" | "user" | "notification"
+    entity_id = Column(Integer, nullable=True)  # None: every entity of the kind
+    origin = Column(String, nullable=False)  # writing worker, which skips its own entries
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = ({"sqlite_autoincrement": True},)
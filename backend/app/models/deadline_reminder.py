@@ -0,0 +1,19 @@
+# app/models/deadline_reminder.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
+
+from app.database import Base
+
+
+class DeadlineReminder(Base):
+    """One row per (user, scholarship) reminded, so reminder runs are idempotent."""
+
+    __tablename__ = "deadline_reminders"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    scholarship_id = Column(Integer, ForeignKey("scholarships.id"), nullable=False)
+    sent_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = (UniqueConstraint("user_id", "scholarship_id", name="uq_deadline_reminder"),)
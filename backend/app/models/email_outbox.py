@@ -0,0 +1,33 @@
+# app/models/email_outbox.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class EmailOutbox(Base):
+    """Durable queue of outgoing email; routes enqueue, the outbox worker sends."""
+
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    sender_name = Column(String, nullable=True)
+    sender_email = Column(String, nullable=True)
+    # 0 = priority lane (password reset), higher numbers are sent later
+    priority = Column(Integer, nullable=False, default=1)
+    status = Column(String, nullable=False, default="pending")  # pending | sending | sent | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    claimed_by = Column(String, nullable=True)  # worker token while status == "sending"
+    claimed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_claim", "status", "priority", "next_attempt_at"),
+    )
@@ -0,0 +1,14 @@
+# app/models/job_lease.py
+from sqlalchemy import Column, DateTime, String
+
+from app.database import Base
+
+
+class JobLease(Base):
+    """Which worker runs a singleton background job until `expires_at` (app.core.lease)."""
+
+    __tablename__ = "job_leases"
+
+    name = Column(String, primary_key=True)  # job name, e.g. "notification-retention"
+    holder = Column(String, nullable=False)  # "<pid>-<random>" of the worker holding it
+    expires_at = Column(DateTime, nullable=False)
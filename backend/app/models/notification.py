@@ -1,7 +1,7 @@
 # app/models/notification.py
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 
 from app.database import Base
 
@@ -14,3 +14,9 @@ class Notification(Base):
     message = Column(String, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Unread counts and the keyset-paginated inbox (newest id first).
+        Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+    )
@@ -0,0 +1,23 @@
+# app/models/notification_archive.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary
+
+from app.database import Base
+
+
+class NotificationArchive(Base):
+    """
+    Notifications moved out of the hot `notifications` table by the retention
+    job: one zlib-compressed JSON array of rows per user per archived batch.
+    """
+
+    __tablename__ = "notification_archive"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    first_notification_id = Column(Integer, nullable=False)
+    last_notification_id = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,26 @@
+# app/models/notification_digest.py
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from app.database import Base
+
+
+class NotificationDigestEvent(Base):
+    """
+    A notification waiting to be coalesced into its user's next digest.
+    `digested_at` is set once it has been delivered as part of one.
+    """
+
+    __tablename__ = "notification_digest_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    kind = Column(String, nullable=False, default="general")
+    message = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    digested_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_notification_digest_pending", "digested_at", "user_id", "created_at"),
+    )
@@ -0,0 +1,14 @@
+# app/models/rate_limit.py
+from sqlalchemy import Column, Integer, String
+
+from app.database import Base
+
+
+class RateLimitCounter(Base):
+    """Shared sliding-window counters for multi-worker rate limiting."""
+
+    __tablename__ = "rate_limit_counters"
+
+    key = Column(String, primary_key=True)  # "<rule>:<ip or email>"
+    window_index = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
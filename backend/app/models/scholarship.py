@@ -1,6 +1,8 @@
 # app/models/scholarship.py
 
-from sqlalchemy import Boolean, Column, Integer, String, Text, Date, Float
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, Integer, String, Text, Date, DateTime, Float
 from app.database import Base
 
 
@@ -22,3 +24,11 @@ class Scholarship(Base):
     requires_essay = Column(Boolean, nullable=False, default=False)
     requires_transcript = Column(Boolean, nullable=False, default=False)
     requires_questions = Column(Boolean, nullable=False, default=False)
+
+    # Row version for conditional GET (app.core.conditional)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    )
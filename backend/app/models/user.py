@@ -22,7 +22,7 @@ class User(Base):
     first_name = Column(String, nullable=True)
     last_name = Column(String, nullable=True)
     hashed_password = Column(String, nullable=False)
-    role = Column(SAEnum(UserRole), nullable=False, default=UserRole.APPLICANT)
-    is_active = Column(Boolean, default=True)
+    role = Column(SAEnum(UserRole), nullable=False, default=UserRole.APPLICANT, index=True)
+    is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
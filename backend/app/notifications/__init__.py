@@ -1,4 +1,13 @@
 # app/notifications/__init__.py
-from .emailer import EmailSender, send_email_notification
+from .emailer import EmailSender, PooledSMTPConnection, send_email_notification
+from .outbox import PRIORITY_BULK, PRIORITY_HIGH, PRIORITY_NORMAL, enqueue_email
 
-__all__ = ["EmailSender", "send_email_notification"]
+__all__ = [
+    "EmailSender",
+    "PooledSMTPConnection",
+    "send_email_notification",
+    "enqueue_email",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_BULK",
+]
@@ -0,0 +1,227 @@
+# app/notifications/digest.py
+"""
+Digest batching for high-volume notification events.
+
+Instead of one notification (and email) per event, producers such as
+reviewer assignment call `queue_digest_event`. A background timer runs
+`flush_digests`: every user whose oldest pending event is at least
+`window_seconds` old gets one notification and one email summarising
+everything pending, so mail volume follows users rather than events.
+
+Batching is off by default. Events are only queued while a scheduler is
+running in this process (`batching_active`); otherwise `notify_user`
+delivers at once, so nothing waits on a timer that never fires.
+
+Events are claimed with a single `UPDATE ... RETURNING` in the same
+transaction that writes the digest, so several workers running the timer
+never deliver an event twice, and a failed flush leaves events pending.
+
+Configuration (env):
+  NOTIFICATION_DIGEST_WINDOW_SECONDS (default 0)    0 delivers immediately, no digest
+  NOTIFICATION_DIGEST_TICK_SECONDS (default 30)     how often the timer checks
+  NOTIFICATION_DIGEST_EMAIL (default true)          also queue a digest email
+"""
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.coherence import cache_coherence
+from app.models.notification import Notification
+from app.models.notification_digest import NotificationDigestEvent
+from app.models.user import User
+from app.notifications.hub import notification_hub
+from app.notifications.outbox import PRIORITY_BULK, enqueue_email, notify_enqueued
+from app.notifications.unread_counter import unread_counter
+
+logger = logging.getLogger(__name__)
+
+DIGEST_WINDOW_SECONDS = float(os.getenv("NOTIFICATION_DIGEST_WINDOW_SECONDS", "0"))
+DIGEST_TICK_SECONDS = float(os.getenv("NOTIFICATION_DIGEST_TICK_SECONDS", "30"))
+DIGEST_EMAIL = os.getenv("NOTIFICATION_DIGEST_EMAIL", "true").lower() != "false"
+# Event lines listed in a digest email before "...and N more".
+DIGEST_MAX_LINES = 20
+
+# One-line summaries for digests made of a single kind of event.
+DIGEST_SUMMARIES = {
+    "review_assignment": "You have been assigned {count} applications to review.",
+}
+DEFAULT_SUMMARY = "You have {count} new notifications."
+
+# The scheduler delivering queued events in this process, if any.
+_active_scheduler: Optional["DigestScheduler"] = None
+
+
+@dataclass
+class DigestReport:
+    users: int = 0
+    events: int = 0
+    emails: int = 0
+
+
+def queue_digest_event(
+    db: Session,
+    user_id: int,
+    message: str,
+    kind: str = "general",
+    commit: bool = True,
+) -> NotificationDigestEvent:
+    event = NotificationDigestEvent(user_id=user_id, kind=kind, message=message)
+    db.add(event)
+    if commit:
+        db.commit()
+    return event
+
+
+def batching_active() -> bool:
+    """True while a scheduler with a window is running here to flush queued events."""
+    return _active_scheduler is not None
+
+
+def summarize(events: List) -> str:
+    if len(events) == 1:
+        return events[0].message
+    kinds = {e.kind for e in events}
+    template = DIGEST_SUMMARIES.get(kinds.pop()) if len(kinds) == 1 else None
+    return (template or DEFAULT_SUMMARY).format(count=len(events))
+
+
+def _email_body(first_name: Optional[str], summary: str, events: List) -> str:
+    lines = [f"- {e.message}" for e in events[:DIGEST_MAX_LINES]]
+    if len(events) > DIGEST_MAX_LINES:
+        lines.append(f"...and {len(events) - DIGEST_MAX_LINES} more.")
+    return (
+        f"Hello {first_name or 'there'},\n\n"
+        f"{summary}\n\n" + "\n".join(lines) + "\n\nSign in to EduAid to see the details."
+    )
+
+
+def flush_digests(
+    db: Session,
+    window_seconds: float = DIGEST_WINDOW_SECONDS,
+    now: Optional[datetime] = None,
+    send_email: bool = DIGEST_EMAIL,
+) -> DigestReport:
+    """Deliver one digest per user whose oldest pending event is due."""
+    now = now or datetime.utcnow()
+    due_users = (
+        select(NotificationDigestEvent.user_id)
+        .where(NotificationDigestEvent.digested_at.is_(None))
+        .group_by(NotificationDigestEvent.user_id)
+        .having(func.min(NotificationDigestEvent.created_at) <= now - timedelta(seconds=window_seconds))
+    )
+    claimed = db.execute(
+        update(NotificationDigestEvent)
+        .where(
+            NotificationDigestEvent.digested_at.is_(None),
+            NotificationDigestEvent.created_at <= now,
+            NotificationDigestEvent.user_id.in_(due_users),
+        )
+        .values(digested_at=now)
+        .returning(
+            NotificationDigestEvent.id,
+            NotificationDigestEvent.user_id,
+            NotificationDigestEvent.kind,
+            NotificationDigestEvent.message,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    if not claimed:
+        db.rollback()
+        return DigestReport()
+
+    by_user: Dict[int, List] = {}
+    for event in sorted(claimed, key=lambda e: e.id):
+        by_user.setdefault(event.user_id, []).append(event)
+
+    notifications = []
+    emails = 0
+    users = {
+        u.id: u
+        for u in db.execute(
+            select(User.id, User.email, User.first_name).where(User.id.in_(list(by_user)))
+        )
+    }
+    for user_id, events in by_user.items():
+        summary = summarize(events)
+        notifications.append(Notification(user_id=user_id, message=summary, is_read=False, created_at=now))
+        user = users.get(user_id)
+        if send_email and user is not None:
+            enqueue_email(
+                db,
+                to_email=user.email,
+                subject="EduAid: " + (summary if len(events) > 1 else "new notification"),
+                body=_email_body(user.first_name, summary, events),
+                sender_name="EduAid",
+                priority=PRIORITY_BULK,
+                commit=False,
+            )
+            emails += 1
+    db.add_all(notifications)
+    cache_coherence.record_many(db, "notification", by_user)
+    db.commit()
+
+    if emails:
+        notify_enqueued()
+    for notif in notifications:
+        unread_counter.adjust(notif.user_id, 1)
+    notification_hub.publish_notifications(notifications)
+    return DigestReport(users=len(by_user), events=len(claimed), emails=emails)
+
+
+class DigestScheduler:
+    """Background timer that flushes due digests every `tick_seconds`."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        window_seconds: float = DIGEST_WINDOW_SECONDS,
+        tick_seconds: float = DIGEST_TICK_SECONDS,
+        send_email: bool = DIGEST_EMAIL,
+    ) -> None:
+        self.session_factory = session_factory
+        self.window_seconds = window_seconds
+        self.tick_seconds = tick_seconds
+        self.send_email = send_email
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def flush(self) -> DigestReport:
+        with self.session_factory() as db:
+            return flush_digests(db, self.window_seconds, send_email=self.send_email)
+
+    def start(self) -> None:
+        global _active_scheduler
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-digest", daemon=True)
+        self._thread.start()
+        if self.window_seconds > 0:
+            _active_scheduler = self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        global _active_scheduler
+        if _active_scheduler is self:
+            _active_scheduler = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Deliver whatever is due rather than holding it until the next start.
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Final digest flush failed")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.tick_seconds):
+            try:
+                report = self.flush()
+                if report.users:
+                    logger.info("Sent %d digests covering %d events", report.users, report.events)
+            except Exception:
+                logger.exception("Digest flush failed")
@@ -12,6 +12,7 @@ Configuration (env):
 """
 import os
 import smtplib
+import time
 from email.message import EmailMessage
 from typing import Optional
 
@@ -44,18 +45,15 @@ class EmailSender:
         if not self.default_sender:
             raise ValueError("EMAIL_SENDER is required for EmailSender")
 
-    def send_email(
+    def build_message(
         self,
         to_email: str,
         subject: str,
         body: str,
         sender_name: Optional[str] = None,
         sender_email: Optional[str] = None,
-    ) -> None:
-        """
-        Send an email to `to_email` with the given `subject` and `body`.
-        The from-address defaults to EMAIL_SENDER, but can be overridden per-call.
-        """
+    ) -> EmailMessage:
+        """Build the message; the from-address defaults to EMAIL_SENDER."""
         from_address = sender_email or self.default_sender
         if sender_name:
             from_header = f"{sender_name} <{from_address}>"
@@ -67,18 +65,90 @@ class EmailSender:
         msg["To"] = to_email
         msg["Subject"] = subject
         msg.set_content(body)
+        return msg
 
-        if self.use_tls:
-            with smtplib.SMTP(self.host, self.port) as smtp:
+    def open_connection(self) -> smtplib.SMTP:
+        """Connect, STARTTLS (if enabled) and log in. Caller owns the connection."""
+        smtp = smtplib.SMTP(self.host, self.port)
+        try:
+            if self.use_tls:
                 smtp.starttls()
-                if self.username and self.password:
-                    smtp.login(self.username, self.password)
-                smtp.send_message(msg)
-        else:
-            with smtplib.SMTP(self.host, self.port) as smtp:
-                if self.username and self.password:
-                    smtp.login(self.username, self.password)
-                smtp.send_message(msg)
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def send_email(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        sender_name: Optional[str] = None,
+        sender_email: Optional[str] = None,
+    ) -> None:
+        """
+        Send an email to `to_email` with the given `subject` and `body`.
+        The from-address defaults to EMAIL_SENDER, but can be overridden per-call.
+        Opens a fresh connection; use PooledSMTPConnection for volume.
+        """
+        msg = self.build_message(to_email, subject, body, sender_name, sender_email)
+        with self.open_connection() as smtp:
+            smtp.send_message(msg)
+
+
+class PooledSMTPConnection:
+    """
+    A long-lived SMTP connection owned by one outbox worker thread.
+
+    Connects lazily, reconnects once if the server dropped us, and recycles
+    the connection after `max_messages` sends or `max_idle_seconds` idle.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        max_messages: int = 500,
+        max_idle_seconds: float = 60.0,
+    ) -> None:
+        self.sender = sender
+        self.max_messages = max_messages
+        self.max_idle_seconds = max_idle_seconds
+        self.connects = 0
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._sent_on_connection = 0
+        self._last_used = 0.0
+
+    def send(self, msg: EmailMessage) -> None:
+        if self._smtp is not None and (
+            self._sent_on_connection >= self.max_messages
+            or time.monotonic() - self._last_used > self.max_idle_seconds
+        ):
+            self.close()
+        try:
+            self._connection().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self._connection().send_message(msg)
+        self._sent_on_connection += 1
+        self._last_used = time.monotonic()
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            self._smtp = self.sender.open_connection()
+            self._sent_on_connection = 0
+            self.connects += 1
+        return self._smtp
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
 
 # Convenience instance/function for quick use
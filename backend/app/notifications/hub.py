@@ -0,0 +1,250 @@
+# app/notifications/hub.py
+"""
+In-process pub/sub for real-time notifications (server-sent events).
+
+Service functions call `notification_hub.publish(...)` after committing;
+each open SSE connection holds a subscription queue on the event loop.
+Publishing is thread-safe because services run in the threadpool.
+
+Writes made by other worker processes (or set-based inserts whose rows we
+never see) are picked up by a single high-water-mark poller per process:
+one `id > last_seen` range query per tick, and only while somebody is
+subscribed. Idle connections cost no database work.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "15"))
+HWM_POLL_SECONDS = float(os.getenv("NOTIFICATION_HWM_POLL_SECONDS", "5"))
+BACKLOG_LIMIT = 100
+
+
+@dataclass
+class NotificationEvent:
+    id: int
+    user_id: int
+    event: str  # "notification" | "read" | "read_all"
+    data: dict
+
+    @classmethod
+    def from_notification(cls, notif: Notification, event: str = "notification") -> "NotificationEvent":
+        created_at = notif.created_at
+        return cls(
+            id=notif.id,
+            user_id=notif.user_id,
+            event=event,
+            data={
+                "id": notif.id,
+                "user_id": notif.user_id,
+                "message": notif.message,
+                "is_read": bool(notif.is_read),
+                "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+            },
+        )
+
+
+@dataclass(eq=False)
+class Subscription:
+    user_id: int
+    loop: asyncio.AbstractEventLoop
+    queue: "asyncio.Queue[NotificationEvent]" = field(default_factory=asyncio.Queue)
+    _recent: Deque[tuple] = field(default_factory=lambda: deque(maxlen=1000))
+    _recent_set: Set[tuple] = field(default_factory=set)
+
+    def first_delivery(self, event: NotificationEvent) -> bool:
+        """Drop duplicates (local publish + poller can both see one row)."""
+        if event.event != "notification":
+            return True  # only new rows are seen by the poller too
+        key = (event.event, event.id)
+        if key in self._recent_set:
+            return False
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_set.discard(self._recent[0])
+        self._recent.append(key)
+        self._recent_set.add(key)
+        return True
+
+
+class NotificationHub:
+    def __init__(self, poll_seconds: float = HWM_POLL_SECONDS) -> None:
+        self.poll_seconds = poll_seconds
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._high_water_mark: Optional[int] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._poke: Optional[asyncio.Event] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+
+    # ---- subscriptions -------------------------------------------------
+
+    def subscribe(self, user_id: int) -> Subscription:
+        sub = Subscription(user_id=user_id, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.user_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[sub.user_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+    # ---- publishing ----------------------------------------------------
+
+    def publish(self, event: NotificationEvent) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(event.user_id, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.queue.put_nowait, event)
+            except RuntimeError:
+                # Loop already closed; the connection is going away.
+                self.unsubscribe(sub)
+
+    def publish_notifications(self, notifications: Iterable[Notification], event: str = "notification") -> None:
+        for notif in notifications:
+            self.publish(NotificationEvent.from_notification(notif, event))
+
+    def publish_read_all(self, user_id: int) -> None:
+        self.publish(NotificationEvent(id=0, user_id=user_id, event="read_all", data={"user_id": user_id}))
+
+    def poke(self) -> None:
+        """Ask the poller to look for new rows now (after set-based inserts)."""
+        poke, poller = self._poke, self._poller
+        if poke is not None and poller is not None and not poller.done():
+            poller.get_loop().call_soon_threadsafe(poke.set)
+
+    # ---- high-water-mark fallback -------------------------------------
+
+    def ensure_poller(self, session_factory: Callable[[], Session]) -> None:
+        """Start the per-process poller on the running loop if needed."""
+        if self.poll_seconds <= 0:
+            return
+        self._session_factory = session_factory
+        if self._poller is None or self._poller.done():
+            self._poke = asyncio.Event()
+            self._poller = asyncio.get_running_loop().create_task(self._poll_forever())
+
+    def prime(self, db: Session) -> None:
+        """Set the mark before a new subscriber starts streaming, so nothing in between is lost."""
+        if self._high_water_mark is None:
+            self._high_water_mark = db.scalar(select(func.max(Notification.id))) or 0
+
+    def poll_once(self) -> int:
+        """One range query past the high-water mark for subscribed users; returns rows dispatched."""
+        with self._lock:
+            user_ids = list(self._subscribers)
+        if not user_ids or self._session_factory is None:
+            return 0
+        with self._session_factory() as db:
+            if self._high_water_mark is None:
+                self.prime(db)
+                return 0
+            # Bound the range first so rows landing mid-poll are seen next tick, not skipped.
+            newest = db.scalar(select(func.max(Notification.id))) or 0
+            if newest <= self._high_water_mark:
+                return 0
+            rows: List[Notification] = list(
+                db.scalars(
+                    select(Notification)
+                    .where(
+                        Notification.id > self._high_water_mark,
+                        Notification.id <= newest,
+                        Notification.user_id.in_(user_ids),
+                    )
+                    .order_by(Notification.id)
+                )
+            )
+        self._high_water_mark = newest
+        self.publish_notifications(rows)
+        return len(rows)
+
+    async def _poll_forever(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(self._poke.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._poke.clear()
+            if not self.subscriber_count():
+                # Nobody listening: forget the mark and stop until the next subscriber.
+                self._high_water_mark = None
+                self._poller = None
+                return
+            try:
+                await loop.run_in_executor(None, self.poll_once)
+            except Exception:
+                logger.exception("Notification high-water-mark poll failed")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._subscribers.clear()
+        self._high_water_mark = None
+
+
+notification_hub = NotificationHub()
+
+
+def load_backlog(db: Session, user_id: int, after_id: int) -> List[NotificationEvent]:
+    """Notifications missed since `after_id` (from Last-Event-ID) for resume."""
+    rows = db.scalars(
+        select(Notification)
+        .where(Notification.user_id == user_id, Notification.id > after_id)
+        .order_by(Notification.id)
+        .limit(BACKLOG_LIMIT)
+    )
+    return [NotificationEvent.from_notification(n) for n in rows]
+
+
+def format_sse(event: NotificationEvent) -> str:
+    # Only new notifications carry an `id:`: it becomes the browser's
+    # Last-Event-ID, and a "read" event for an older row would rewind it, so
+    # the next reconnect would replay notifications already delivered.
+    if event.event != "notification":
+        return f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+    return f"id: {event.id}\nevent: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+
+
+async def stream_events(
+    sub: Subscription,
+    backlog: List[NotificationEvent],
+    is_disconnected: Callable,
+    heartbeat: float = HEARTBEAT_SECONDS,
+):
+    """Async generator of SSE frames for one subscription."""
+    try:
+        yield "retry: 3000\n\n"
+        for event in backlog:
+            if sub.first_delivery(event):
+                yield format_sse(event)
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if sub.first_delivery(event):
+                yield format_sse(event)
+    finally:
+        notification_hub.unsubscribe(sub)
@@ -0,0 +1,151 @@
+# app/notifications/outbox.py
+"""
+Durable email outbox.
+
+Request handlers call `enqueue_email` (one INSERT in their own transaction)
+and return; `EmailOutboxWorker` claims due rows in batches and sends them
+over long-lived SMTP connections, retrying failures with exponential backoff.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.email_outbox import EmailOutbox
+
+PRIORITY_HIGH = 0  # password reset and other interactive mail
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2  # digests, reminders
+
+# Called after an enqueue commits, so an in-process worker can wake early.
+_listeners: list = []
+
+
+def add_enqueue_listener(callback) -> None:
+    _listeners.append(callback)
+
+
+def remove_enqueue_listener(callback) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def notify_enqueued() -> None:
+    """Wake listeners after committing rows added with `commit=False`."""
+    for callback in list(_listeners):
+        callback()
+
+
+def enqueue_email(
+    db: Session,
+    to_email: str,
+    subject: str,
+    body: str,
+    sender_name: Optional[str] = None,
+    sender_email: Optional[str] = None,
+    priority: int = PRIORITY_NORMAL,
+    commit: bool = True,
+) -> EmailOutbox:
+    entry = EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        sender_name=sender_name,
+        sender_email=sender_email,
+        priority=priority,
+        status="pending",
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.add(entry)
+    if commit:
+        db.commit()
+        notify_enqueued()
+    return entry
+
+
+def claim_batch(
+    db: Session,
+    worker_token: str,
+    limit: int,
+    max_priority: Optional[int] = None,
+) -> List[EmailOutbox]:
+    """
+    Atomically mark up to `limit` due rows as sending for `worker_token`
+    and return them, most urgent first.
+    """
+    now = datetime.utcnow()
+    due = (
+        select(EmailOutbox.id)
+        .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.priority, EmailOutbox.id)
+        .limit(limit)
+    )
+    if max_priority is not None:
+        due = due.where(EmailOutbox.priority <= max_priority)
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(due.scalar_subquery()), EmailOutbox.status == "pending")
+        .values(
+            status="sending",
+            claimed_by=worker_token,
+            claimed_at=now,
+            attempts=EmailOutbox.attempts + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return list(
+        db.scalars(
+            select(EmailOutbox)
+            .where(EmailOutbox.status == "sending", EmailOutbox.claimed_by == worker_token)
+            .order_by(EmailOutbox.priority, EmailOutbox.id)
+        )
+    )
+
+
+def mark_sent(db: Session, ids: List[int]) -> None:
+    if not ids:
+        return
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids))
+        .values(status="sent", sent_at=datetime.utcnow(), claimed_by=None, last_error=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def mark_failed(
+    db: Session,
+    entry: EmailOutbox,
+    error: str,
+    max_attempts: int,
+    backoff_seconds: float,
+    max_backoff_seconds: float = 3600.0,
+) -> None:
+    """Schedule a retry with exponential backoff, or give up after max_attempts."""
+    delay = min(backoff_seconds * 2 ** max(entry.attempts - 1, 0), max_backoff_seconds)
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id == entry.id)
+        .values(
+            status="failed" if entry.attempts >= max_attempts else "pending",
+            next_attempt_at=datetime.utcnow() + timedelta(seconds=delay),
+            last_error=error[:1000],
+            claimed_by=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def release_stale_claims(db: Session, older_than_seconds: float = 300.0) -> int:
+    """Return rows stuck in `sending` (e.g. a worker crashed mid-batch) to the queue."""
+    cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+    result = db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.status == "sending", EmailOutbox.claimed_at < cutoff)
+        .values(status="pending", claimed_by=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
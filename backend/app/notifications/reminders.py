@@ -0,0 +1,153 @@
+# app/notifications/reminders.py
+"""
+Deadline reminders for eligible applicants who haven't applied yet.
+
+One set-based statement finds every (profile, scholarship) pair where the
+scholarship closes within `lead_days`, the profile meets its GPA,
+citizenship and major requirements (the same rules as the suitability
+check), and there is no application and no earlier reminder. The pairs are
+recorded in `deadline_reminders` and turned into notifications with
+INSERT ... SELECT, all in one transaction, so a rerun (or a second worker)
+finds nothing left to send.
+
+Configuration (env):
+  DEADLINE_REMINDER_DAYS (default 3)
+  DEADLINE_REMINDER_INTERVAL_SECONDS (default 3600)  background job period; 0 disables
+"""
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import String, and_, cast, exists, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.coherence import cache_coherence
+from app.models.applicant_profile import ApplicantProfile
+from app.models.application import Application
+from app.models.deadline_reminder import DeadlineReminder
+from app.models.notification import Notification
+from app.models.scholarship import Scholarship
+from app.models.user import User, UserRole
+from app.notifications.hub import notification_hub
+from app.notifications.unread_counter import unread_counter
+
+logger = logging.getLogger(__name__)
+
+REMINDER_LEAD_DAYS = int(os.getenv("DEADLINE_REMINDER_DAYS", "3"))
+REMINDER_INTERVAL_SECONDS = float(os.getenv("DEADLINE_REMINDER_INTERVAL_SECONDS", "3600"))
+
+
+def _matches(required, actual):
+    return or_(required.is_(None), required == "", func.lower(actual) == func.lower(required))
+
+
+def eligible_non_applicants_query(today: date, lead_days: int = REMINDER_LEAD_DAYS):
+    """(user_id, scholarship_id) pairs still owed a reminder."""
+    return (
+        select(ApplicantProfile.user_id, Scholarship.id.label("scholarship_id"))
+        .join(User, User.id == ApplicantProfile.user_id)
+        .join(
+            Scholarship,
+            and_(
+                Scholarship.deadline >= today,
+                Scholarship.deadline <= today + timedelta(days=lead_days),
+                or_(Scholarship.min_gpa.is_(None), ApplicantProfile.gpa >= Scholarship.min_gpa),
+                _matches(Scholarship.required_citizenship, ApplicantProfile.citizenship),
+                _matches(Scholarship.required_major, ApplicantProfile.degree_major),
+            ),
+        )
+        .where(
+            User.role == UserRole.APPLICANT,
+            User.is_active.is_(True),
+            ~exists().where(
+                Application.user_id == ApplicantProfile.user_id,
+                Application.scholarship_id == Scholarship.id,
+            ),
+            ~exists().where(
+                DeadlineReminder.user_id == ApplicantProfile.user_id,
+                DeadlineReminder.scholarship_id == Scholarship.id,
+            ),
+        )
+    )
+
+
+def send_deadline_reminders(
+    db: Session,
+    today: Optional[date] = None,
+    lead_days: int = REMINDER_LEAD_DAYS,
+) -> int:
+    """Record and notify every pair still owed a reminder; returns how many were sent."""
+    today = today or date.today()
+    run_at = datetime.utcnow()
+    pairs = eligible_non_applicants_query(today, lead_days).subquery()
+    result = db.execute(
+        insert(DeadlineReminder).from_select(
+            ["user_id", "scholarship_id", "sent_at"],
+            select(pairs.c.user_id, pairs.c.scholarship_id, literal(run_at)),
+        )
+    )
+    sent = result.rowcount
+    if sent:
+        message = (
+            literal("Reminder: applications for ")
+            + Scholarship.name
+            + literal(" close on ")
+            + cast(Scholarship.deadline, String)
+            + literal(". You appear to be eligible and haven't applied yet.")
+        )
+        db.execute(
+            insert(Notification).from_select(
+                ["user_id", "message", "is_read", "created_at"],
+                select(DeadlineReminder.user_id, message, literal(False), literal(run_at))
+                .join(Scholarship, Scholarship.id == DeadlineReminder.scholarship_id)
+                .where(DeadlineReminder.sent_at == run_at)
+                .order_by(DeadlineReminder.id),
+            )
+        )
+        cache_coherence.record(db, "notification")
+    db.commit()
+    if sent:
+        unread_counter.invalidate()
+        notification_hub.poke()
+    return sent
+
+
+class DeadlineReminderJob:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        lead_days: int = REMINDER_LEAD_DAYS,
+        interval_seconds: float = REMINDER_INTERVAL_SECONDS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.lead_days = lead_days
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            return send_deadline_reminders(db, lead_days=self.lead_days)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="deadline-reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                sent = self.run_once()
+                if sent:
+                    logger.info("Sent %d deadline reminders", sent)
+            except Exception:
+                logger.exception("Deadline reminder run failed")
+            self._stop.wait(self.interval_seconds)
@@ -0,0 +1,295 @@
+# app/notifications/retention.py
+"""
+Retention for the `notifications` table.
+
+Read notifications older than `retention_days`, and read notifications
+beyond the newest `inbox_max` per user, are moved into
+`notification_archive` as zlib-compressed JSON batches. Unread
+notifications are never archived, so an inbox can exceed the cap by
+however many the user hasn't seen yet. Each batch is its own short transaction
+(select ids, insert archive rows, delete), so the SQLite write lock is only
+held for one chunk at a time and requests interleave between chunks.
+
+Every worker starts the background job, but each run first takes the
+"notification-retention" lease (app.core.lease), so only one worker runs
+it at a time.
+
+Deleted rows leave free pages behind; with `auto_vacuum=INCREMENTAL` the job
+returns up to `vacuum_pages` of them to the OS per run. Existing databases
+need a one-off `VACUUM` to switch modes (`--enable-incremental-vacuum` on
+the CLI).
+
+Configuration (env):
+  NOTIFICATION_RETENTION_DAYS (default 90)           read notifications older than this are archived
+  NOTIFICATION_INBOX_MAX (default 500)               per-user cap on read notifications kept hot; 0 disables
+  NOTIFICATION_RETENTION_CHUNK_SIZE (default 500)
+  NOTIFICATION_RETENTION_INTERVAL_SECONDS (default 3600)  background job period; 0 disables
+  NOTIFICATION_VACUUM_PAGES (default 1000)
+"""
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.coherence import cache_coherence
+from app.core.lease import acquire_lease, new_holder, release_lease
+from app.models.notification import Notification
+from app.models.notification_archive import NotificationArchive
+from app.notifications.unread_counter import unread_counter
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_INCREMENTAL = 2
+LEASE_NAME = "notification-retention"
+
+
+@dataclass
+class RetentionReport:
+    archived_aged: int = 0
+    archived_over_cap: int = 0
+    vacuumed_pages: int = 0
+    seconds: float = 0.0
+
+
+def _encode(rows: Sequence) -> bytes:
+    return zlib.compress(
+        json.dumps(
+            [
+                {
+                    "id": r.id,
+                    "message": r.message,
+                    "is_read": bool(r.is_read),
+                    "created_at": r.created_at.isoformat(),
+                }
+                for r in rows
+            ]
+        ).encode()
+    )
+
+
+def archive_notifications(db: Session, ids: Sequence[int]) -> int:
+    """Move the given notifications into the archive and commit; returns rows moved."""
+    if not ids:
+        return 0
+    rows = db.execute(
+        select(
+            Notification.id,
+            Notification.user_id,
+            Notification.message,
+            Notification.is_read,
+            Notification.created_at,
+        )
+        .where(Notification.id.in_(ids))
+        .order_by(Notification.id)
+    ).all()
+    by_user: Dict[int, List] = {}
+    for row in rows:
+        by_user.setdefault(row.user_id, []).append(row)
+    if by_user:
+        db.execute(
+            insert(NotificationArchive),
+            [
+                {
+                    "user_id": user_id,
+                    "first_notification_id": user_rows[0].id,
+                    "last_notification_id": user_rows[-1].id,
+                    "row_count": len(user_rows),
+                    "payload": _encode(user_rows),
+                }
+                for user_id, user_rows in by_user.items()
+            ],
+        )
+        db.execute(
+            delete(Notification)
+            .where(Notification.id.in_([r.id for r in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        # Only users who lost unread rows have a different unread count.
+        cache_coherence.record_many(
+            db, "notification", (user_id for user_id, user_rows in by_user.items() if not all(r.is_read for r in user_rows))
+        )
+    db.commit()
+    for user_id, user_rows in by_user.items():
+        unread_counter.adjust(user_id, -sum(1 for r in user_rows if not r.is_read))
+    return len(rows)
+
+
+def archive_read_notifications(
+    db: Session,
+    older_than: datetime,
+    chunk_size: int = 500,
+    pause_seconds: float = 0.0,
+) -> int:
+    """Archive read notifications created before `older_than`, one chunk per transaction."""
+    total = 0
+    while True:
+        ids = list(
+            db.scalars(
+                select(Notification.id)
+                .where(Notification.is_read.is_(True), Notification.created_at < older_than)
+                .order_by(Notification.id)
+                .limit(chunk_size)
+            )
+        )
+        if not ids:
+            return total
+        total += archive_notifications(db, ids)
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+
+def cap_inboxes(db: Session, max_per_user: int, chunk_size: int = 500, pause_seconds: float = 0.0) -> int:
+    """Archive each user's read notifications beyond the newest `max_per_user`."""
+    over_cap = (
+        select(Notification.user_id)
+        .group_by(Notification.user_id)
+        .having(func.count() > max_per_user)
+    )
+    ranked = (
+        select(
+            Notification.id,
+            Notification.is_read,
+            func.row_number()
+            .over(partition_by=Notification.user_id, order_by=Notification.id.desc())
+            .label("position"),
+        )
+        .where(Notification.user_id.in_(over_cap))
+        .subquery()
+    )
+    ids = list(
+        db.scalars(
+            select(ranked.c.id)
+            .where(ranked.c.position > max_per_user, ranked.c.is_read.is_(True))
+            .order_by(ranked.c.id)
+        )
+    )
+    db.commit()
+    total = 0
+    for start in range(0, len(ids), chunk_size):
+        total += archive_notifications(db, ids[start : start + chunk_size])
+        if pause_seconds:
+            time.sleep(pause_seconds)
+    return total
+
+
+def load_archived_notifications(db: Session, user_id: int) -> List[dict]:
+    """Decompress a user's archived notifications, oldest first."""
+    rows: List[dict] = []
+    for payload in db.scalars(
+        select(NotificationArchive.payload)
+        .where(NotificationArchive.user_id == user_id)
+        .order_by(NotificationArchive.first_notification_id)
+    ):
+        rows.extend(json.loads(zlib.decompress(payload)))
+    return rows
+
+
+def enable_incremental_vacuum(engine: Engine) -> None:
+    """Switch the database to auto_vacuum=INCREMENTAL (rewrites the file once)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+
+
+def incremental_vacuum(engine: Engine, pages: int) -> int:
+    """Free up to `pages` pages; returns how many were released (0 if not enabled)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if conn.scalar(text("PRAGMA auto_vacuum")) != AUTO_VACUUM_INCREMENTAL:
+            return 0
+        before = conn.scalar(text("PRAGMA freelist_count"))
+        conn.exec_driver_sql(f"PRAGMA incremental_vacuum({int(pages)})")
+        return before - conn.scalar(text("PRAGMA freelist_count"))
+
+
+class NotificationRetentionJob:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        retention_days: float = 90,
+        inbox_max: int = 500,
+        chunk_size: int = 500,
+        interval_seconds: float = 3600,
+        vacuum_pages: int = 1000,
+        pause_seconds: float = 0.05,
+    ) -> None:
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.inbox_max = inbox_max
+        self.chunk_size = chunk_size
+        self.interval_seconds = interval_seconds
+        self.vacuum_pages = vacuum_pages
+        self.pause_seconds = pause_seconds
+        self.last_report: Optional[RetentionReport] = None
+        self.holder = new_holder()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, session_factory: Callable[[], Session]) -> "NotificationRetentionJob":
+        return cls(
+            session_factory,
+            retention_days=float(os.getenv("NOTIFICATION_RETENTION_DAYS", "90")),
+            inbox_max=int(os.getenv("NOTIFICATION_INBOX_MAX", "500")),
+            chunk_size=int(os.getenv("NOTIFICATION_RETENTION_CHUNK_SIZE", "500")),
+            interval_seconds=float(os.getenv("NOTIFICATION_RETENTION_INTERVAL_SECONDS", "3600")),
+            vacuum_pages=int(os.getenv("NOTIFICATION_VACUUM_PAGES", "1000")),
+        )
+
+    def run_once(self, now: Optional[datetime] = None) -> RetentionReport:
+        started = time.perf_counter()
+        report = RetentionReport()
+        now = now or datetime.utcnow()
+        with self.session_factory() as db:
+            report.archived_aged = archive_read_notifications(
+                db, now - timedelta(days=self.retention_days), self.chunk_size, self.pause_seconds
+            )
+            if self.inbox_max > 0:
+                report.archived_over_cap = cap_inboxes(db, self.inbox_max, self.chunk_size, self.pause_seconds)
+            if self.vacuum_pages > 0:
+                report.vacuumed_pages = incremental_vacuum(db.get_bind(), self.vacuum_pages)
+        report.seconds = time.perf_counter() - started
+        self.last_report = report
+        return report
+
+    def run_if_leased(self) -> Optional[RetentionReport]:
+        """`run_once` if this worker holds the lease (None if another one does)."""
+        # Outlives the gap between runs, so the holder keeps it while it lives.
+        with self.session_factory() as db:
+            if not acquire_lease(db, LEASE_NAME, self.holder, max(self.interval_seconds, 1) * 2):
+                return None
+        return self.run_once()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        try:
+            with self.session_factory() as db:
+                release_lease(db, LEASE_NAME, self.holder)
+        except Exception:
+            logger.exception("Releasing the notification retention lease failed")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                report = self.run_if_leased()
+                if report and (report.archived_aged or report.archived_over_cap):
+                    logger.info("Notification retention: %s", report)
+            except Exception:
+                logger.exception("Notification retention run failed")
+            self._stop.wait(self.interval_seconds)
@@ -0,0 +1,89 @@
+"""
+Minimal in-process SMTP server for tests and throughput benchmarks.
+
+Speaks just enough SMTP for smtplib (EHLO/HELO, MAIL, RCPT, DATA, RSET,
+NOOP, QUIT) and counts delivered messages. `connect_delay` is slept before
+the greeting to stand in for TCP + STARTTLS + AUTH setup cost, which is what
+connection reuse saves.
+
+    with SMTPStandIn(connect_delay=0.05) as server:
+        EmailSender(host="127.0.0.1", port=server.port, use_tls=False, ...)
+"""
+import socketserver
+import threading
+import time
+from typing import List
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: "_Server" = self.server  # type: ignore[assignment]
+        with server.lock:
+            server.connections += 1
+        if server.connect_delay:
+            time.sleep(server.connect_delay)
+        self._reply("220 standin ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.wfile.write(b"250-standin\r\n250 8BITMIME\r\n")
+            elif verb in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines: List[bytes] = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    lines.append(data_line)
+                with server.lock:
+                    server.messages.append(b"".join(lines))
+                self._reply("250 Queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _reply(self, text: str) -> None:
+        self.wfile.write(text.encode() + b"\r\n")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPStandIn:
+    def __init__(self, connect_delay: float = 0.0) -> None:
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.connect_delay = connect_delay
+        self._server.lock = threading.Lock()
+        self._server.messages = []
+        self._server.connections = 0
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def messages(self) -> List[bytes]:
+        return self._server.messages
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    def __enter__(self) -> "SMTPStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
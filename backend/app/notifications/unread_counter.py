@@ -0,0 +1,60 @@
+# app/notifications/unread_counter.py
+"""
+Per-user unread notification counts, cached in process.
+
+A miss runs one indexed COUNT; after that the notification writers keep the
+entry current (+n on insert, -n on read). Entries expire after a TTL so
+writes made by other workers are picked up eventually.
+"""
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.notification import Notification
+
+
+class UnreadCounter:
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._counts: Dict[int, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._counts.get(user_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        count = db.scalar(
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read.is_(False))
+        ) or 0
+        with self._lock:
+            self._counts[user_id] = (now + self.ttl_seconds, count)
+        return count
+
+    def adjust(self, user_id: int, delta: int) -> None:
+        """Apply a committed change; uncached users are left to the next COUNT."""
+        with self._lock:
+            entry = self._counts.get(user_id)
+            if entry is not None:
+                self._counts[user_id] = (entry[0], max(0, entry[1] + delta))
+
+    def adjust_many(self, user_ids: Iterable[int], delta: int) -> None:
+        for user_id in user_ids:
+            self.adjust(user_id, delta)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._counts.clear()
+            else:
+                self._counts.pop(user_id, None)
+
+
+unread_counter = UnreadCounter(ttl_seconds=float(os.getenv("UNREAD_COUNT_TTL_SECONDS", "60")))
@@ -0,0 +1,182 @@
+# app/notifications/worker.py
+"""
+Background sender for the email outbox.
+
+Each thread owns one PooledSMTPConnection and sends claimed rows in batches.
+`priority_workers` threads only serve the priority lane (password reset),
+so a backlog of bulk mail never delays an interactive message.
+
+Rows left in `sending` by a batch that failed part-way (or by a crashed
+process) are returned to the queue once they are `claim_timeout` old: at
+start and then periodically from the sender loop.
+
+Configuration (env):
+  EMAIL_OUTBOX_WORKERS (default 2)         total sender threads
+  EMAIL_OUTBOX_PRIORITY_WORKERS (default 1)
+  EMAIL_OUTBOX_BATCH_SIZE (default 50)
+  EMAIL_OUTBOX_MAX_ATTEMPTS (default 5)
+  EMAIL_OUTBOX_BACKOFF_SECONDS (default 30)
+  EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS (default 300)
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.notifications.emailer import EmailSender, PooledSMTPConnection
+from app.notifications.outbox import (
+    PRIORITY_HIGH,
+    add_enqueue_listener,
+    claim_batch,
+    mark_failed,
+    mark_sent,
+    release_stale_claims,
+    remove_enqueue_listener,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sender_factory: Callable[[], EmailSender] = EmailSender,
+        workers: int = 2,
+        priority_workers: int = 1,
+        batch_size: int = 50,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        claim_timeout: float = 300.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.sender_factory = sender_factory
+        self.workers = max(workers, 1)
+        self.priority_workers = min(priority_workers, self.workers - 1) if self.workers > 1 else 0
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.claim_timeout = claim_timeout
+        self.sent = 0
+        self.failed = 0
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._stats_lock = threading.Lock()
+        self._next_release = 0.0
+
+    @classmethod
+    def from_env(cls, session_factory: Callable[[], Session]) -> "EmailOutboxWorker":
+        return cls(
+            session_factory,
+            workers=int(os.getenv("EMAIL_OUTBOX_WORKERS", "2")),
+            priority_workers=int(os.getenv("EMAIL_OUTBOX_PRIORITY_WORKERS", "1")),
+            batch_size=int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50")),
+            max_attempts=int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5")),
+            backoff_seconds=float(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30")),
+            claim_timeout=float(os.getenv("EMAIL_OUTBOX_CLAIM_TIMEOUT_SECONDS", "300")),
+        )
+
+    def start(self) -> None:
+        self.release_stale_claims()
+        self._stop.clear()
+        add_enqueue_listener(self.notify)
+        for i in range(self.workers):
+            lane = PRIORITY_HIGH if i < self.priority_workers else None
+            thread = threading.Thread(
+                target=self._run, args=(lane,), name=f"email-outbox-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        remove_enqueue_listener(self.notify)
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def release_stale_claims(self) -> int:
+        """Requeue rows claimed more than `claim_timeout` ago; at most once per claim_timeout / 10."""
+        with self._stats_lock:
+            now = time.monotonic()
+            if now < self._next_release:
+                return 0
+            self._next_release = now + self.claim_timeout / 10
+        with self.session_factory() as db:
+            released = release_stale_claims(db, older_than_seconds=self.claim_timeout)
+        if released:
+            logger.warning("Requeued %s outbox emails stuck in sending", released)
+        return released
+
+    def drain(self, lane: Optional[int] = None) -> int:
+        """Send everything currently due on the calling thread (CLI/tests)."""
+        connection = PooledSMTPConnection(self.sender_factory())
+        total = 0
+        try:
+            while True:
+                sent = self.process_batch(connection, lane, token=f"drain-{uuid.uuid4().hex}")
+                if not sent:
+                    return total
+                total += sent
+        finally:
+            connection.close()
+
+    def process_batch(
+        self,
+        connection: PooledSMTPConnection,
+        lane: Optional[int],
+        token: str,
+    ) -> int:
+        """Claim, send and record one batch; returns how many rows were claimed."""
+        with self.session_factory() as db:
+            batch = claim_batch(db, token, self.batch_size, max_priority=lane)
+            if not batch:
+                return 0
+            sent_ids: List[int] = []
+            for entry in batch:
+                try:
+                    msg = connection.sender.build_message(
+                        entry.to_email, entry.subject, entry.body, entry.sender_name, entry.sender_email
+                    )
+                    connection.send(msg)
+                    sent_ids.append(entry.id)
+                except Exception as exc:  # SMTP errors vary; any failure is retried
+                    logger.warning("Outbox email %s failed: %s", entry.id, exc)
+                    connection.close()
+                    mark_failed(db, entry, str(exc), self.max_attempts, self.backoff_seconds)
+            mark_sent(db, sent_ids)
+            db.commit()
+        with self._stats_lock:
+            self.sent += len(sent_ids)
+            self.failed += len(batch) - len(sent_ids)
+        return len(batch)
+
+    def _run(self, lane: Optional[int]) -> None:
+        token = f"{threading.current_thread().name}-{uuid.uuid4().hex}"
+        connection: Optional[PooledSMTPConnection] = None
+        try:
+            connection = PooledSMTPConnection(self.sender_factory())
+            while not self._stop.is_set():
+                try:
+                    self.release_stale_claims()
+                    claimed = self.process_batch(connection, lane, token)
+                except Exception:
+                    logger.exception("Email outbox batch failed")
+                    claimed = 0
+                if not claimed:
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+        finally:
+            if connection is not None:
+                connection.close()
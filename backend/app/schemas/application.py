@@ -2,7 +2,7 @@
 from typing import Optional
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ApplicationBase(BaseModel):
@@ -37,8 +37,7 @@ class ApplicationRead(BaseModel):
     # NEW
     reviewer_id: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ApplicationAssign(BaseModel):
     reviewer_id: int
@@ -1,6 +1,10 @@
 # app/schemas/notification.py
 from datetime import datetime
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.user import UserRole
 
 
 class NotificationCreate(BaseModel):
@@ -15,5 +19,38 @@ class NotificationRead(BaseModel):
   is_read: bool
   created_at: datetime
 
-  class Config:
-    from_attributes = True
+  model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationBroadcast(BaseModel):
+  """
+  scholarship_applicants: everyone who applied to `scholarship_id`
+  reviewers:              all active reviewers
+  role:                   all active users with `role`
+  users:                  the explicit `user_ids`
+  """
+  message: str = Field(min_length=1)
+  target: Literal["scholarship_applicants", "reviewers", "role", "users"]
+  scholarship_id: Optional[int] = None
+  role: Optional[UserRole] = None
+  user_ids: Optional[List[int]] = None
+
+  @model_validator(mode="after")
+  def check_target_args(self):
+    required = {"scholarship_applicants": "scholarship_id", "role": "role", "users": "user_ids"}
+    field = required.get(self.target)
+    if field and not getattr(self, field):
+      raise ValueError(f"{field} is required for target '{self.target}'")
+    return self
+
+
+class NotificationBroadcastResult(BaseModel):
+  count: int
+
+
+class NotificationUnreadCount(BaseModel):
+  unread: int
+
+
+class NotificationMarkReadResult(BaseModel):
+  updated: int
@@ -2,7 +2,7 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ScholarshipBase(BaseModel):
@@ -48,5 +48,4 @@ class ScholarshipUpdate(BaseModel):
 class ScholarshipRead(ScholarshipBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
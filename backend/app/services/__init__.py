@@ -3,6 +3,8 @@
 from .scholarship_service import (
     list_scholarships,
     search_scholarships,
+    list_scholarship_rows,
+    scholarship_rows_version,
     create_scholarship,
     get_scholarship,
     update_scholarship,
@@ -16,9 +18,12 @@ from .application_service import (
     assign_reviewer,
     list_applications_for_reviewer,
     list_all_applications,
+    list_application_rows,
+    application_rows_version,
     upsert_review,
     list_reviews_for_application,
     list_reviews_for_reviewer,
+    reviews_version,
     update_application_status,
     evaluate_application_suitability,
 )
@@ -29,15 +34,27 @@ from .applicant_profile_service import (
 )
 from .notification_service import (
     create_notification,
+    notify_user,
     list_notifications_for_user,
     list_unread_notifications_for_user,
     mark_notification_read,
+    broadcast_notification,
+    get_unread_count,
+    list_notification_page,
+    notification_inbox_version,
+    mark_notifications_read,
+)
+from .user_import_service import (
+    parse_user_rows,
+    bulk_import_users,
 )
 
 __all__ = [
     # scholarships
     "list_scholarships",
     "search_scholarships",
+    "list_scholarship_rows",
+    "scholarship_rows_version",
     "create_scholarship",
     "get_scholarship",
     "update_scholarship",
@@ -49,9 +66,12 @@ __all__ = [
     "assign_reviewer",
     "list_applications_for_reviewer",
     "list_all_applications",
+    "list_application_rows",
+    "application_rows_version",
     "upsert_review",
     "list_reviews_for_application",
     "list_reviews_for_reviewer",
+    "reviews_version",
     "update_application_status",
     "evaluate_application_suitability",
     # applicant profiles
@@ -60,7 +80,16 @@ __all__ = [
     "upsert_applicant_profile",
     # notifications
     "create_notification",
+    "notify_user",
     "list_notifications_for_user",
     "list_unread_notifications_for_user",
     "mark_notification_read",
+    "broadcast_notification",
+    "get_unread_count",
+    "list_notification_page",
+    "notification_inbox_version",
+    "mark_notifications_read",
+    # bulk user import
+    "parse_user_rows",
+    "bulk_import_users",
 ]
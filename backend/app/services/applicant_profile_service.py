@@ -4,7 +4,6 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.applicant_profile import ApplicantProfile
-from app.models.user import User
 from app.schemas.applicant_profile import ApplicantProfileCreate
 
 
@@ -28,11 +27,11 @@ def applicant_profile_exists(db: Session, user_id: int) -> bool:
 
 
 def upsert_applicant_profile(
-    db: Session, user: User, payload: ApplicantProfileCreate
+    db: Session, user_id: int, payload: ApplicantProfileCreate
 ) -> ApplicantProfile:
-    profile = get_profile_for_user(db, user.id)
+    profile = get_profile_for_user(db, user_id)
     if not profile:
-        profile = ApplicantProfile(user_id=user.id)
+        profile = ApplicantProfile(user_id=user_id)
         db.add(profile)
 
     profile.student_id = payload.student_id
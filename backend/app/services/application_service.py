@@ -1,9 +1,14 @@
 # app/services/application_service.py
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
+from app.core.conditional import collection_version
+from app.core.serialization import schema_columns
+
 from app.models.application import Application
 from app.models.review import Review
 from app.models.user import User
@@ -165,6 +170,42 @@ def list_applications_for_reviewer(db: Session, reviewer_id: int) -> List[Applic
         .order_by(Application.created_at.desc())
         .all()
     )
+def list_application_rows(
+    db: Session,
+    user_id: Optional[int] = None,
+    reviewer_id: Optional[int] = None,
+) -> List[Row]:
+    """
+    ApplicationRead columns as Core rows, newest first, for the list routes
+    (see app.core.serialization.rows_response). Filters match
+    list_applications_for_user / list_applications_for_reviewer.
+    """
+    query = (
+        select(*schema_columns(ApplicationRead, Application))
+        .where(*_application_criteria(user_id, reviewer_id))
+        .order_by(Application.created_at.desc())
+    )
+    return db.execute(query).all()
+
+
+def _application_criteria(user_id: Optional[int], reviewer_id: Optional[int]) -> list:
+    criteria = []
+    if user_id is not None:
+        criteria.append(Application.user_id == user_id)
+    if reviewer_id is not None:
+        criteria.append(Application.reviewer_id == reviewer_id)
+    return criteria
+
+
+def application_rows_version(
+    db: Session,
+    user_id: Optional[int] = None,
+    reviewer_id: Optional[int] = None,
+) -> Tuple:
+    """Collection version of what list_application_rows returns for the same filters."""
+    return collection_version(db, Application, *_application_criteria(user_id, reviewer_id))
+
+
 def list_all_applications(db: Session) -> List[Application]:
     """
     Return all applications in the system.
@@ -229,6 +270,20 @@ def list_reviews_for_reviewer(db: Session, reviewer_id: int) -> List[Review]:
     )
 
 
+def reviews_version(
+    db: Session,
+    application_id: Optional[int] = None,
+    reviewer_id: Optional[int] = None,
+) -> Tuple:
+    """Collection version of list_reviews_for_application / list_reviews_for_reviewer."""
+    criteria = []
+    if application_id is not None:
+        criteria.append(Review.application_id == application_id)
+    if reviewer_id is not None:
+        criteria.append(Review.reviewer_id == reviewer_id)
+    return collection_version(db, Review, *criteria)
+
+
 def update_application_status(
     db: Session,
     application_id: int,
@@ -0,0 +1,72 @@
+# app/services/catalog_cache.py
+"""
+The full scholarship catalog (GET /scholarships/), cached in process as
+encoded JSON.
+
+Each entry also keeps its ETag (from the catalog's collection version, so
+revalidation needs no query while cached) and the body compressed per
+Content-Encoding, built on first request for that encoding at the
+middleware's fast levels, so a hot catalog is serialized and compressed once rather than per
+request. The scholarship writers invalidate the entry on commit; the TTL
+bounds how long writes made by other workers can go unseen.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.compression import compress_bytes
+
+
+class CatalogEntry:
+    __slots__ = ("body", "etag", "expires_at", "_encoded", "_lock")
+
+    def __init__(self, body: bytes, etag: str, expires_at: float) -> None:
+        self.body = body
+        self.etag = etag
+        self.expires_at = expires_at
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        data = self._encoded.get(encoding)
+        if data is None:
+            with self._lock:
+                data = self._encoded.get(encoding)
+                if data is None:
+                    data = self._encoded[encoding] = compress_bytes(self.body, encoding)
+        return data
+
+
+class ScholarshipCatalogCache:
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entry: Optional[CatalogEntry] = None
+        # Bumped by invalidate(), so a build that raced a write isn't stored.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, build: Callable[[], Tuple[bytes, str]]) -> CatalogEntry:
+        """The cached entry, or a new one from `build()`, which returns (body, etag)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry.expires_at > now:
+                return entry
+            generation = self._generation
+        body, etag = build()
+        entry = CatalogEntry(body, etag, now + self.ttl_seconds)
+        with self._lock:
+            if self._generation == generation:
+                self._entry = entry
+        return entry
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entry = None
+            self._generation += 1
+
+
+scholarship_catalog = ScholarshipCatalogCache(
+    ttl_seconds=float(os.getenv("SCHOLARSHIP_CATALOG_TTL_SECONDS", "60"))
+)
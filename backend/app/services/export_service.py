@@ -0,0 +1,164 @@
+# app/services/export_service.py
+"""
+Streaming CSV / NDJSON exports.
+
+Each export is a generator over a single Core SELECT executed with
+`yield_per`, so rows are pulled from the cursor in batches and written out
+immediately; memory stays flat no matter how many rows are exported.
+"""
+import csv
+import io
+import json
+from typing import Iterator, List, Optional, Sequence
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.applicant_profile import ApplicantProfile
+from app.models.application import Application
+from app.models.review import Review
+from app.models.scholarship import Scholarship
+from app.models.user import User, UserRole
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+# Rows fetched from the cursor (and flushed to the client) per batch.
+EXPORT_BATCH_SIZE = 1000
+
+
+def _review_aggregates():
+    return (
+        select(
+            Review.application_id.label("application_id"),
+            func.count(Review.id).label("review_count"),
+            func.avg(Review.score).label("avg_score"),
+        )
+        .group_by(Review.application_id)
+        .subquery()
+    )
+
+
+def applications_export_query(scholarship_id: Optional[int] = None) -> Select:
+    """Applications joined with applicant, profile, scholarship and review aggregates."""
+    reviews = _review_aggregates()
+    stmt = (
+        select(
+            Application.id.label("application_id"),
+            Application.status,
+            Application.created_at,
+            Application.updated_at,
+            Application.reviewer_id,
+            Scholarship.id.label("scholarship_id"),
+            Scholarship.name.label("scholarship_name"),
+            User.id.label("user_id"),
+            User.email,
+            User.first_name,
+            User.last_name,
+            ApplicantProfile.student_id,
+            ApplicantProfile.gpa,
+            ApplicantProfile.degree_major,
+            ApplicantProfile.degree_minor,
+            ApplicantProfile.citizenship,
+            func.coalesce(reviews.c.review_count, 0).label("review_count"),
+            reviews.c.avg_score,
+        )
+        .join(Scholarship, Scholarship.id == Application.scholarship_id)
+        .join(User, User.id == Application.user_id)
+        .outerjoin(ApplicantProfile, ApplicantProfile.user_id == Application.user_id)
+        .outerjoin(reviews, reviews.c.application_id == Application.id)
+        .order_by(Application.id)
+    )
+    if scholarship_id is not None:
+        stmt = stmt.where(Application.scholarship_id == scholarship_id)
+    return stmt
+
+
+def reviews_export_query(scholarship_id: Optional[int] = None) -> Select:
+    reviewer = aliased(User)
+    stmt = (
+        select(
+            Review.id.label("review_id"),
+            Review.application_id,
+            Application.scholarship_id,
+            Scholarship.name.label("scholarship_name"),
+            Review.reviewer_id,
+            reviewer.email.label("reviewer_email"),
+            Review.score,
+            Review.status,
+            Review.comment,
+            Review.created_at,
+            Review.updated_at,
+        )
+        .join(Application, Application.id == Review.application_id)
+        .join(Scholarship, Scholarship.id == Application.scholarship_id)
+        .join(reviewer, reviewer.id == Review.reviewer_id)
+        .order_by(Review.id)
+    )
+    if scholarship_id is not None:
+        stmt = stmt.where(Application.scholarship_id == scholarship_id)
+    return stmt
+
+
+def users_export_query(role: Optional[UserRole] = None) -> Select:
+    stmt = select(
+        User.id,
+        User.email,
+        User.first_name,
+        User.last_name,
+        User.role,
+        User.is_active,
+        User.created_at,
+    ).order_by(User.id)
+    if role is not None:
+        stmt = stmt.where(User.role == role)
+    return stmt
+
+
+def _plain(value):
+    if isinstance(value, UserRole):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _iter_batches(db: Session, stmt: Select) -> Iterator[tuple[List[str], Sequence]]:
+    result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    columns = list(result.keys())
+    for batch in result.partitions():
+        yield columns, batch
+
+
+def stream_export(db: Session, stmt: Select, fmt: str) -> Iterator[str]:
+    """
+    Yield the export as text chunks, one chunk per cursor batch.
+
+    A private session on the request session's bind is used, because the
+    response body is produced after the route function has returned.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    with Session(bind=db.get_bind()) as stream_db:
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            header_written = False
+            for columns, batch in _iter_batches(stream_db, stmt):
+                if not header_written:
+                    writer.writerow(columns)
+                    header_written = True
+                writer.writerows([_plain(v) for v in row] for row in batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            if not header_written:
+                # Empty export: still emit the header so the file is well-formed.
+                writer.writerow(stream_db.execute(stmt.limit(0)).keys())
+                yield buffer.getvalue()
+        else:
+            for columns, batch in _iter_batches(stream_db, stmt):
+                yield "".join(
+                    json.dumps({c: _plain(v) for c, v in zip(columns, row)}) + "\n"
+                    for row in batch
+                )
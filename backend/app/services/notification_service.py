@@ -1,10 +1,22 @@
 # app/services/notification_service.py
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy import Row, func, insert, literal, select, update
 from sqlalchemy.orm import Session
 
+from app.core.coherence import cache_coherence
+from app.core.serialization import schema_columns
+from app.models.application import Application
 from app.models.notification import Notification
-from app.schemas.notification import NotificationCreate
+from app.models.notification_archive import NotificationArchive
+from app.models.user import User, UserRole
+from app.notifications import digest
+from app.notifications.hub import notification_hub
+from app.notifications.unread_counter import unread_counter
+from app.schemas.notification import NotificationBroadcast, NotificationCreate, NotificationRead
+
+BROADCAST_CHUNK_SIZE = 1000
 
 
 def create_notification(db: Session, payload: NotificationCreate) -> Notification:
@@ -14,18 +26,94 @@ def create_notification(db: Session, payload: NotificationCreate) -> Notificatio
         is_read=False,
     )
     db.add(notif)
+    cache_coherence.record(db, "notification", payload.user_id)
     db.commit()
     db.refresh(notif)
+    unread_counter.adjust(notif.user_id, 1)
+    notification_hub.publish_notifications([notif])
     return notif
 
 
-def list_notifications_for_user(db: Session, user_id: int) -> List[Notification]:
-    return (
-        db.query(Notification)
-        .filter(Notification.user_id == user_id)
-        .order_by(Notification.created_at.desc())
-        .all()
+def notify_user(db: Session, user_id: int, message: str, kind: str = "general") -> None:
+    """
+    Notify now, or queue the event for the user's next digest when digest
+    batching is enabled (NOTIFICATION_DIGEST_WINDOW_SECONDS > 0) and a
+    scheduler is running to deliver it.
+    """
+    if digest.batching_active():
+        digest.queue_digest_event(db, user_id, message, kind)
+    else:
+        create_notification(db, NotificationCreate(user_id=user_id, message=message))
+
+
+def list_notifications_for_user(
+    db: Session,
+    user_id: int,
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None,
+    unread_only: bool = False,
+) -> List[Notification]:
+    """
+    Newest-first inbox. With `limit`, pages by keyset: pass the last id of
+    one page as `before_id` to get the next.
+    """
+    query = db.query(Notification).filter(Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(Notification.is_read.is_(False))
+    if before_id is not None:
+        query = query.filter(Notification.id < before_id)
+    query = query.order_by(Notification.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def list_notification_page(
+    db: Session,
+    user_id: int,
+    limit: int,
+    before_id: Optional[int] = None,
+    unread_only: bool = False,
+) -> List[Row]:
+    """
+    One inbox page as NotificationRead rows (see list_notifications_for_user):
+    a keyset scan of ix_notifications_user_id_id that stops after `limit`.
+    """
+    criteria = [Notification.user_id == user_id]
+    if unread_only:
+        criteria.append(Notification.is_read.is_(False))
+    if before_id is not None:
+        criteria.append(Notification.id < before_id)
+    query = (
+        select(*schema_columns(NotificationRead, Notification))
+        .where(*criteria)
+        .order_by(Notification.id.desc())
+        .limit(limit)
     )
+    return db.execute(query).all()
+
+
+def notification_inbox_version(db: Session, user_id: int) -> Tuple:
+    """
+    Version of a user's whole inbox: (max notification id, max archive id,
+    unread count). Notifications have no updated_at, but inserts raise the
+    max id, retention archives every notification it deletes, and marking
+    read lowers the unread count. Two index seeks plus the cached count, so
+    it stays cheap however long the history is.
+    """
+    max_ids = db.execute(
+        select(
+            select(func.max(Notification.id)).where(Notification.user_id == user_id).scalar_subquery(),
+            select(func.max(NotificationArchive.id))
+            .where(NotificationArchive.user_id == user_id)
+            .scalar_subquery(),
+        )
+    ).one()
+    return (*max_ids, unread_counter.get(db, user_id))
+
+
+def get_unread_count(db: Session, user_id: int) -> int:
+    return unread_counter.get(db, user_id)
 
 
 def list_unread_notifications_for_user(db: Session, user_id: int) -> List[Notification]:
@@ -41,7 +129,94 @@ def mark_notification_read(db: Session, notif_id: int) -> Optional[Notification]
     notif = db.query(Notification).filter(Notification.id == notif_id).first()
     if not notif:
         return None
+    was_unread = not notif.is_read
     notif.is_read = True
+    if was_unread:
+        cache_coherence.record(db, "notification", notif.user_id)
     db.commit()
     db.refresh(notif)
+    if was_unread:
+        unread_counter.adjust(notif.user_id, -1)
+    notification_hub.publish_notifications([notif], event="read")
     return notif
+
+
+def mark_notifications_read(db: Session, user_id: int, ids: Optional[List[int]] = None) -> int:
+    """
+    Mark the given notifications (or all of them, when `ids` is None) read
+    for one user with a single UPDATE; returns how many rows changed.
+
+    Open streams get a "read" event per listed notification, or one
+    "read_all" event for the user (a mark-all can cover thousands of rows).
+    """
+    stmt = update(Notification).where(
+        Notification.user_id == user_id, Notification.is_read.is_(False)
+    )
+    if ids is not None:
+        if not ids:
+            return 0
+        stmt = stmt.where(Notification.id.in_(ids)).returning(*schema_columns(NotificationRead, Notification))
+    result = db.execute(stmt.values(is_read=True).execution_options(synchronize_session=False))
+    changed = result.all() if ids is not None else None
+    updated = len(changed) if changed is not None else result.rowcount
+    if updated:
+        cache_coherence.record(db, "notification", user_id)
+    db.commit()
+    # Subtract rather than zero: a notification may have landed since the commit.
+    unread_counter.adjust(user_id, -updated)
+    if ids is None:
+        if updated:
+            notification_hub.publish_read_all(user_id)
+    else:
+        notification_hub.publish_notifications(changed, event="read")
+    return updated
+
+
+def _broadcast_recipients(payload: NotificationBroadcast):
+    if payload.target == "scholarship_applicants":
+        return (
+            select(Application.user_id)
+            .where(Application.scholarship_id == payload.scholarship_id)
+            .distinct()
+        )
+    role = UserRole.REVIEWER if payload.target == "reviewers" else payload.role
+    return select(User.id).where(User.role == role, User.is_active.is_(True))
+
+
+def broadcast_notification(db: Session, payload: NotificationBroadcast) -> int:
+    """
+    Fan one message out to a set of users in a single transaction and return
+    how many notifications were created. Every target is an INSERT ... SELECT
+    from its recipients; explicit user lists go in chunks, and ids that
+    aren't users are skipped.
+    """
+    now = datetime.utcnow()
+
+    def insert_for(recipients):
+        return insert(Notification).from_select(
+            ["user_id", "message", "is_read", "created_at"],
+            select(recipients.c[0], literal(payload.message), literal(False), literal(now)),
+        )
+
+    if payload.target == "users":
+        requested = list(dict.fromkeys(payload.user_ids or []))
+        user_ids: List[int] = []
+        for start in range(0, len(requested), BROADCAST_CHUNK_SIZE):
+            chunk = requested[start:start + BROADCAST_CHUNK_SIZE]
+            recipients = select(User.id).where(User.id.in_(chunk)).subquery()
+            user_ids += db.scalars(insert_for(recipients).returning(Notification.user_id)).all()
+        count = len(user_ids)
+        cache_coherence.record_many(db, "notification", user_ids)
+    else:
+        result = db.execute(insert_for(_broadcast_recipients(payload).subquery()))
+        count = result.rowcount
+        cache_coherence.record(db, "notification")
+    db.commit()
+    if payload.target == "users":
+        unread_counter.adjust_many(user_ids, 1)
+    else:
+        # Recipients weren't loaded; recount lazily rather than query them now.
+        unread_counter.invalidate()
+    # Rows weren't loaded here; let the high-water-mark poller deliver them.
+    notification_hub.poke()
+    return count
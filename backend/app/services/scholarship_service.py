@@ -1,34 +1,53 @@
 # app/services/scholarship_service.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import Row, or_, func, select
 
+from app.core.coherence import cache_coherence
+from app.core.conditional import collection_version
+from app.core.serialization import schema_columns
 from app.models.scholarship import Scholarship
-from app.schemas import ScholarshipCreate, ScholarshipUpdate
+from app.schemas import ScholarshipCreate, ScholarshipRead, ScholarshipUpdate
+from app.services.catalog_cache import scholarship_catalog
 
 
 def list_scholarships(db: Session) -> List[Scholarship]:
     return db.query(Scholarship).all()
 
 
+def _keyword_filter(keyword: str):
+    pattern = f"%{keyword.lower()}%"
+    return or_(
+        func.lower(Scholarship.name).like(pattern),
+        func.lower(Scholarship.description).like(pattern),
+        func.lower(Scholarship.requirements).like(pattern),
+    )
+
+
 def search_scholarships(db: Session, keyword: str) -> List[Scholarship]:
     """
     Case-insensitive keyword search across scholarship name, description,
     and requirements.
     """
-    pattern = f"%{keyword.lower()}%"
-    return (
-        db.query(Scholarship)
-        .filter(
-            or_(
-                func.lower(Scholarship.name).like(pattern),
-                func.lower(Scholarship.description).like(pattern),
-                func.lower(Scholarship.requirements).like(pattern),
-            )
-        )
-        .all()
-    )
+    return db.query(Scholarship).filter(_keyword_filter(keyword)).all()
+
+
+def list_scholarship_rows(db: Session, keyword: Optional[str] = None) -> List[Row]:
+    """
+    ScholarshipRead columns as Core rows (no ORM objects), optionally
+    filtered like search_scholarships; for app.core.serialization.rows_response.
+    """
+    query = select(*schema_columns(ScholarshipRead, Scholarship))
+    if keyword:
+        query = query.where(_keyword_filter(keyword))
+    return db.execute(query).all()
+
+
+def scholarship_rows_version(db: Session, keyword: Optional[str] = None) -> Tuple:
+    """Collection version of what list_scholarship_rows(db, keyword) returns."""
+    criteria = [_keyword_filter(keyword)] if keyword else []
+    return collection_version(db, Scholarship, *criteria)
 
 
 def create_scholarship(db: Session, payload: ScholarshipCreate) -> Scholarship:
@@ -48,7 +67,9 @@ def create_scholarship(db: Session, payload: ScholarshipCreate) -> Scholarship:
         requires_questions=payload.requires_questions,
     )
     db.add(sch)
+    cache_coherence.record(db, "scholarship")
     db.commit()
+    scholarship_catalog.invalidate()
     db.refresh(sch)
     return sch
 
@@ -94,7 +115,9 @@ def update_scholarship(
         sch.requires_questions = payload.requires_questions
 
     db.add(sch)
+    cache_coherence.record(db, "scholarship", sch.id)
     db.commit()
+    scholarship_catalog.invalidate()
     db.refresh(sch)
     return sch
 
@@ -105,5 +128,7 @@ def delete_scholarship(db: Session, scholarship_id: int) -> bool:
         return False
 
     db.delete(sch)
+    cache_coherence.record(db, "scholarship", scholarship_id)
     db.commit()
+    scholarship_catalog.invalidate()
     return True
@@ -0,0 +1,199 @@
+# app/services/user_import_service.py
+"""
+Bulk user provisioning (CSV / NDJSON).
+
+Rows are validated with the same `UserCreate` schema as `/auth/register`,
+deduplicated against the database with one IN query, hashed in parallel
+across a process pool and inserted in chunked executemany transactions;
+a row whose email was registered in the meantime is skipped on its own.
+
+The process pool is created once per worker count and reused. Its workers
+are spawned rather than forked: the web worker is multithreaded, and a
+fork copies whatever locks its other threads hold at that moment.
+"""
+import csv
+import io
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.auth.schemas import UserCreate, UserImportReport, UserImportRowError
+from app.core import security
+from app.models.user import User
+
+IMPORT_FORMATS = ("csv", "ndjson")
+DEFAULT_CHUNK_SIZE = 500
+# Below this many passwords, process-pool startup costs more than it saves.
+MIN_POOL_BATCH = 32
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def parse_user_rows(content: str, fmt: str) -> List[dict]:
+    """Parse an upload into a list of raw row dicts (not yet validated)."""
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(content))
+        return [
+            {k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in row.items() if k}
+            for row in reader
+        ]
+    if fmt == "ndjson":
+        rows: List[dict] = []
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                parsed = json.loads(line)
+            except json.JSONDecodeError as exc:
+                parsed = {"__parse_error__": f"Invalid JSON: {exc.msg}"}
+            rows.append(parsed if isinstance(parsed, dict) else {"__parse_error__": "Expected a JSON object"})
+        return rows
+    raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _hash_pool(workers: int) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pools[workers] = pool
+        return pool
+
+
+def shutdown_hash_pools() -> None:
+    """Stop the hashing processes (app shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def hash_passwords(
+    passwords: List[str],
+    max_workers: Optional[int] = None,
+    min_pool_batch: int = MIN_POOL_BATCH,
+) -> List[str]:
+    """Hash passwords with bcrypt, fanning out across CPU cores for large batches."""
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1 or len(passwords) < min_pool_batch:
+        return [security.get_password_hash(p) for p in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(_hash_pool(workers).map(security.get_password_hash, passwords, chunksize=chunksize))
+
+
+def _chunks(items: List[dict], size: int) -> Iterable[List[dict]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bulk_import_users(
+    db: Session,
+    rows: List[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    min_pool_batch: int = MIN_POOL_BATCH,
+) -> UserImportReport:
+    started = time.perf_counter()
+    errors: List[UserImportRowError] = []
+    valid: List[tuple[int, UserCreate]] = []
+    seen: set[str] = set()
+
+    # 1) Validate every row and drop duplicates inside the file itself.
+    for row_number, raw in enumerate(rows, start=1):
+        if "__parse_error__" in raw:
+            errors.append(UserImportRowError(row=row_number, error=raw["__parse_error__"]))
+            continue
+        raw = {k: v for k, v in raw.items() if v not in (None, "")}
+        try:
+            user_in = UserCreate(**raw)
+        except ValidationError as exc:
+            first = exc.errors()[0]
+            field = ".".join(str(loc) for loc in first.get("loc", ()))
+            email = raw.get("email")
+            errors.append(
+                UserImportRowError(
+                    row=row_number,
+                    email=email if isinstance(email, str) else None,
+                    error=f"{field}: {first.get('msg')}" if field else first.get("msg", "Invalid row"),
+                )
+            )
+            continue
+        email = user_in.email.lower()
+        if email in seen:
+            errors.append(UserImportRowError(row=row_number, email=email, error="Duplicate email in upload"))
+            continue
+        seen.add(email)
+        valid.append((row_number, user_in))
+
+    # 2) One IN query for emails that already exist.
+    existing: set[str] = set()
+    if seen:
+        existing = {
+            email for (email,) in db.query(User.email).filter(User.email.in_(seen)).all()
+        }
+    pending: List[tuple[int, UserCreate]] = []
+    skipped = 0
+    for row_number, user_in in valid:
+        if user_in.email.lower() in existing:
+            skipped += 1
+            errors.append(
+                UserImportRowError(row=row_number, email=user_in.email.lower(), error="Email already registered")
+            )
+        else:
+            pending.append((row_number, user_in))
+
+    # 3) Hash in parallel, then insert in chunked transactions.
+    hashes = hash_passwords(
+        [user_in.password for _, user_in in pending],
+        max_workers=max_workers,
+        min_pool_batch=min_pool_batch,
+    )
+    records = [
+        {
+            "row": row_number,
+            "email": user_in.email.lower(),
+            "first_name": user_in.first_name,
+            "last_name": user_in.last_name,
+            "hashed_password": hashed,
+            "role": user_in.role,
+            "is_active": True,
+        }
+        for (row_number, user_in), hashed in zip(pending, hashes)
+    ]
+
+    # A registration racing the import makes only its own row conflict; the
+    # rest of the chunk still goes in.
+    stmt = sqlite_insert(User).on_conflict_do_nothing(index_elements=[User.email]).returning(User.email)
+    created = 0
+    for chunk in _chunks(records, chunk_size):
+        values = [{k: v for k, v in rec.items() if k != "row"} for rec in chunk]
+        inserted = set(db.scalars(stmt, values).all())
+        db.commit()
+        created += len(inserted)
+        for rec in chunk:
+            if rec["email"] not in inserted:
+                skipped += 1
+                errors.append(
+                    UserImportRowError(row=rec["row"], email=rec["email"], error="Email already registered")
+                )
+
+    errors.sort(key=lambda e: e.row)
+    return UserImportReport(
+        total_rows=len(rows),
+        created=created,
+        skipped_existing=skipped,
+        failed=len(errors) - skipped,
+        errors=errors,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
@@ -0,0 +1,105 @@
+"""
+Auth performance suite.
+
+Times the pieces of a login separately (bcrypt hash and verify, JWT encode
+and decode) and then the full /auth/login and /auth/refresh requests through
+the ASGI app on an in-memory database, so the bcrypt share of login latency
+is visible at the configured cost.
+
+    cd backend
+    python -m benchmarks.bench_auth --iterations 20
+    BCRYPT_ROUNDS=10 python -m benchmarks.bench_auth
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Callable
+
+# Benchmarks hammer the same email; lift the login limits before the app loads.
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_IP", "1000000/60")
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_EMAIL", "1000000/60")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core import security  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+PASSWORD = "StrongP@ss1"
+
+
+def _measure(fn: Callable[[], object], iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(name: str, samples: list[float]) -> float:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    mean = statistics.mean(samples)
+    print(f"{name:<22} mean={mean:9.3f} ms  p50={statistics.median(samples):9.3f} ms  p95={p95:9.3f} ms")
+    return mean
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--jwt-iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"bcrypt rounds: {security.BCRYPT_ROUNDS}")
+    hashed = security.get_password_hash(PASSWORD)
+    hash_ms = _report("hash", _measure(lambda: security.get_password_hash(PASSWORD), args.iterations))
+    verify_ms = _report("verify", _measure(lambda: security.verify_password(PASSWORD, hashed), args.iterations))
+
+    token = security.create_access_token(1, role="applicant")
+    _report("jwt encode", _measure(lambda: security.create_access_token(1, role="applicant"), args.jwt_iterations))
+    _report("jwt decode", _measure(lambda: security.decode_token(token), args.jwt_iterations))
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    SessionTesting = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = SessionTesting()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            client.post(
+                "/api/v1/auth/register",
+                json={"email": "bench@example.com", "password": PASSWORD, "role": "reviewer"},
+            )
+            credentials = {"email": "bench@example.com", "password": PASSWORD}
+            login_ms = _report(
+                "POST /auth/login",
+                _measure(lambda: client.post("/api/v1/auth/login", json=credentials), args.iterations),
+            )
+            refresh_token = client.post("/api/v1/auth/login", json=credentials).json()["refresh_token"]
+            _report(
+                "POST /auth/refresh",
+                _measure(
+                    lambda: client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token}),
+                    args.iterations,
+                ),
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    print(f"bcrypt verify share of login: {verify_ms / login_ms:6.1%} (hash alone: {hash_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
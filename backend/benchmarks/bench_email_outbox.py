@@ -0,0 +1,74 @@
+"""
+Email throughput before/after the outbox.
+
+"before" sends each message with EmailSender.send_email (new connection per
+message, as forgot-password used to do inline). "after" enqueues the same
+messages and lets EmailOutboxWorker drain them over pooled connections.
+Both run against the in-process SMTP stand-in.
+
+    cd backend
+    python -m benchmarks.bench_email_outbox --messages 500 --connect-delay 0.02
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import EmailOutbox
+from app.notifications.emailer import EmailSender
+from app.notifications.outbox import enqueue_email
+from app.notifications.worker import EmailOutboxWorker
+from app.notifications.smtp_standin import SMTPStandIn
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--connect-delay", type=float, default=0.02, help="Simulated connect+TLS+AUTH seconds")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    with SMTPStandIn(connect_delay=args.connect_delay) as server, tempfile.TemporaryDirectory() as tmp:
+        def make_sender() -> EmailSender:
+            return EmailSender(host="127.0.0.1", port=server.port, use_tls=False, default_sender="bench@example.com")
+
+        sender = make_sender()
+        start = time.perf_counter()
+        for i in range(args.messages):
+            sender.send_email(f"user{i}@example.com", "Deadline reminder", "Body text " * 20)
+        before = args.messages / (time.perf_counter() - start)
+        print(f"before (connection per message): {before:9.1f} msg/s  connections={server.connections}")
+
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'outbox.db')}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        SessionBench = sessionmaker(bind=engine, autoflush=False)
+        with SessionBench() as db:
+            for i in range(args.messages):
+                enqueue_email(db, f"user{i}@example.com", "Deadline reminder", "Body text " * 20, commit=False)
+            db.commit()
+
+        connections_before = server.connections
+        worker = EmailOutboxWorker(SessionBench, make_sender, workers=args.workers, poll_interval=0.05)
+        start = time.perf_counter()
+        worker.start()
+        while True:
+            with SessionBench() as db:
+                remaining = db.scalar(select(func.count()).where(EmailOutbox.status != "sent"))
+            if not remaining:
+                break
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        worker.stop()
+        after = args.messages / elapsed
+        print(
+            f"after  (outbox, {args.workers} workers):     {after:9.1f} msg/s  "
+            f"connections={server.connections - connections_before}  speedup={after / before:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
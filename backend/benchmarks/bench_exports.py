@@ -0,0 +1,72 @@
+"""
+Peak-memory check for streaming exports.
+
+Seeds N applications into a throwaway SQLite file and drains
+`stream_export` while tracing allocations; the peak should stay roughly
+flat as --rows grows.
+
+    cd backend
+    python -m benchmarks.bench_exports --rows 10000 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models import Application, Scholarship, User
+from app.models.user import UserRole
+from app.services.export_service import applications_export_query, stream_export
+
+
+def _seed(engine, rows: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    with Session(engine) as db:
+        db.execute(insert(User), [{"email": "a@example.com", "hashed_password": "x", "role": UserRole.APPLICANT}])
+        db.execute(
+            insert(Scholarship),
+            [{"name": "S", "description": "d" * 200, "amount": 1, "deadline": date(2030, 1, 1)}],
+        )
+        db.execute(
+            insert(Application),
+            [
+                {"user_id": 1, "scholarship_id": 1, "essay_text": "e" * 500, "status": "submitted",
+                 "created_at": now, "updated_at": now}
+                for _ in range(rows)
+            ],
+        )
+        db.commit()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--format", default="csv", choices=["csv", "ndjson"])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        for rows in args.rows:
+            _seed(engine, rows)
+            with Session(engine) as db:
+                tracemalloc.start()
+                start = time.perf_counter()
+                size = sum(len(chunk) for chunk in stream_export(db, applications_export_query(), args.format))
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            print(
+                f"rows={rows:<8} bytes={size:<11} {rows / elapsed:10.0f} rows/s  "
+                f"peak={peak / 1024 / 1024:6.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
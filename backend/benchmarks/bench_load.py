@@ -0,0 +1,370 @@
+"""
+End-to-end load test with realistic workflows.
+
+Seeds a throwaway SQLite file with scholarships, reviewers and admins, then
+runs concurrent simulated users against the real app:
+
+  applicants  register, log in, fill in their profile, then repeatedly browse
+              and search scholarships, apply, and check their applications
+              and notifications
+  reviewers   log in, then repeatedly load their assignments, submit reviews
+              and clear their notifications
+  admins      log in, then repeatedly page through users, list applications,
+              assign reviewers and load the summary
+
+Latency is recorded per route template and reported as p50/p95/p99 plus
+requests per second. Results are compared with a stored baseline, and the
+script exits 1 when a route's p95 or the overall throughput regressed by
+more than --tolerance, or any request failed.
+
+    cd backend
+    python -m benchmarks.bench_load                          # in-process (ASGI)
+    python -m benchmarks.bench_load --transport uvicorn      # real HTTP on localhost
+    python -m benchmarks.bench_load --update-baseline        # record a new baseline
+
+The stored baseline is machine-specific: record one on the machine that
+runs the comparison (CI runner, laptop) before relying on the exit code.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "load.json"
+PASSWORD = "StrongP@ss1"
+SEARCH_TERMS = ["engineering", "software", "merit", "need", "research", "women", "transfer"]
+
+
+def _configure_env(bcrypt_rounds: int) -> None:
+    """Must run before the app is imported."""
+    os.environ.setdefault("BCRYPT_ROUNDS", str(bcrypt_rounds))
+    os.environ.setdefault("LOGIN_RATE_LIMIT_PER_IP", "1000000/60")
+    os.environ.setdefault("LOGIN_RATE_LIMIT_PER_EMAIL", "1000000/60")
+    # Keep background jobs off; only request handling is measured.
+    os.environ.setdefault("NOTIFICATION_RETENTION_INTERVAL_SECONDS", "0")
+    os.environ.setdefault("NOTIFICATION_DIGEST_TICK_SECONDS", "0")
+    os.environ.setdefault("DEADLINE_REMINDER_INTERVAL_SECONDS", "0")
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.error_examples: List[str] = []
+
+    async def call(self, client, route: str, method: str, url: str, expected=(200, 201, 202, 204), **kwargs):
+        start = time.perf_counter()
+        resp = await client.request(method, url, **kwargs)
+        self.samples[route].append((time.perf_counter() - start) * 1000)
+        if resp.status_code not in expected:
+            self.errors[route] += 1
+            if len(self.error_examples) < 5:
+                self.error_examples.append(f"{route} -> {resp.status_code} {resp.text[:200]}")
+        return resp
+
+    def summary(self, wall_seconds: float) -> dict:
+        routes = {}
+        for route, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            routes[route] = {
+                "count": len(samples),
+                "errors": self.errors.get(route, 0),
+                "p50_ms": round(percentile(ordered, 50), 3),
+                "p95_ms": round(percentile(ordered, 95), 3),
+                "p99_ms": round(percentile(ordered, 99), 3),
+                "rps": round(len(samples) / wall_seconds, 2),
+            }
+        total = sum(len(s) for s in self.samples.values())
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "total_rps": round(total / wall_seconds, 2),
+            "routes": routes,
+        }
+
+
+def _seed(engine, scholarships: int, reviewers: int, admins: int) -> None:
+    from sqlalchemy import insert
+    from sqlalchemy.orm import Session
+
+    from app.core.security import get_password_hash
+    from app.database import Base
+    from app.models import Scholarship, User
+    from app.models.user import UserRole
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    hashed = get_password_hash(PASSWORD)  # one hash shared by every seeded account
+    rng = random.Random(42)
+    today = date.today()
+    with Session(engine) as db:
+        db.execute(
+            insert(User),
+            [
+                {"email": f"reviewer{i}@load.example.com", "hashed_password": hashed, "role": UserRole.REVIEWER,
+                 "first_name": "Reviewer", "last_name": str(i)}
+                for i in range(reviewers)
+            ]
+            + [
+                {"email": f"admin{i}@load.example.com", "hashed_password": hashed, "role": UserRole.ENGR_ADMIN,
+                 "first_name": "Admin", "last_name": str(i)}
+                for i in range(admins)
+            ],
+        )
+        db.execute(
+            insert(Scholarship),
+            [
+                {
+                    "name": f"{rng.choice(SEARCH_TERMS).title()} Scholarship {i}",
+                    "description": " ".join(rng.choices(SEARCH_TERMS, k=30)),
+                    "amount": rng.randrange(500, 10000, 250),
+                    "deadline": today + timedelta(days=rng.randrange(10, 200)),
+                    "requirements": " ".join(rng.choices(SEARCH_TERMS, k=8)),
+                    "min_gpa": rng.choice([None, 2.5, 3.0, 3.5]),
+                }
+                for i in range(scholarships)
+            ],
+        )
+        db.commit()
+
+
+async def _login(rec: Recorder, client, email: str) -> dict:
+    resp = await rec.call(client, "POST /auth/login", "POST", "/api/v1/auth/login",
+                          json={"email": email, "password": PASSWORD})
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    me = await rec.call(client, "GET /auth/me", "GET", "/api/v1/auth/me", headers=headers)
+    return {"headers": headers, "id": me.json()["id"]}
+
+
+async def applicant_flow(rec: Recorder, client, n: int, iterations: int, scholarship_ids: List[int], rng) -> None:
+    email = f"applicant{n}@load.example.com"
+    await rec.call(client, "POST /auth/register", "POST", "/api/v1/auth/register",
+                   json={"email": email, "password": PASSWORD, "first_name": "App", "last_name": str(n),
+                         "role": "applicant"})
+    session = await _login(rec, client, email)
+    headers, user_id = session["headers"], session["id"]
+    await rec.call(client, "PUT /applicant/profile/me", "PUT", "/api/v1/applicant/profile/me", headers=headers,
+                   json={"student_id": f"S{n:06d}", "netid": f"app{n}", "citizenship": "US",
+                         "degree_major": "Software Engineering", "gpa": round(rng.uniform(2.0, 4.0), 2)})
+    for _ in range(iterations):
+        await rec.call(client, "GET /scholarships/", "GET", "/api/v1/scholarships/")
+        await rec.call(client, "GET /scholarships/search", "GET", "/api/v1/scholarships/search",
+                       params={"keyword": rng.choice(SEARCH_TERMS)})
+        # 400 = not eligible (GPA/major), a normal outcome for a random pick.
+        await rec.call(client, "POST /applications/", "POST", "/api/v1/applications/", headers=headers,
+                       expected=(201, 400), json={"user_id": user_id, "scholarship_id": rng.choice(scholarship_ids),
+                             "essay_text": "I would like to be considered. " * 20})
+        await rec.call(client, "GET /applications/by-user/{user_id}", "GET",
+                       f"/api/v1/applications/by-user/{user_id}", headers=headers)
+        await rec.call(client, "GET /notifications/user/{user_id}/unread-count", "GET",
+                       f"/api/v1/notifications/user/{user_id}/unread-count")
+        await rec.call(client, "GET /notifications/user/{user_id}", "GET", f"/api/v1/notifications/user/{user_id}")
+
+
+async def reviewer_flow(rec: Recorder, client, n: int, iterations: int, rng) -> None:
+    session = await _login(rec, client, f"reviewer{n}@load.example.com")
+    headers, user_id = session["headers"], session["id"]
+    reviewed = set()
+    for _ in range(iterations):
+        assigned = await rec.call(client, "GET /applications/assigned/{reviewer_id}", "GET",
+                                  f"/api/v1/applications/assigned/{user_id}", headers=headers)
+        for app in [a for a in assigned.json() if a["id"] not in reviewed][:3]:
+            await rec.call(client, "POST /applications/{application_id}/reviews", "POST",
+                           f"/api/v1/applications/{app['id']}/reviews", headers=headers,
+                           json={"reviewer_id": user_id, "score": rng.randrange(50, 100),
+                                 "comment": "Solid application.", "status": "in_review"})
+            reviewed.add(app["id"])
+        await rec.call(client, "GET /notifications/user/{user_id}/unread-count", "GET",
+                       f"/api/v1/notifications/user/{user_id}/unread-count")
+        await rec.call(client, "POST /notifications/user/{user_id}/mark-all-read", "POST",
+                       f"/api/v1/notifications/user/{user_id}/mark-all-read")
+        await asyncio.sleep(0)
+
+
+async def admin_flow(rec: Recorder, client, n: int, iterations: int, reviewer_ids: List[int], rng) -> None:
+    session = await _login(rec, client, f"admin{n}@load.example.com")
+    headers = session["headers"]
+    for _ in range(iterations):
+        await rec.call(client, "GET /admin/users", "GET", "/api/v1/admin/users", headers=headers,
+                       params={"limit": 50})
+        apps = await rec.call(client, "GET /applications/", "GET", "/api/v1/applications/", headers=headers)
+        for app in [a for a in apps.json() if a["reviewer_id"] is None][:5]:
+            await rec.call(client, "POST /applications/{application_id}/assign-reviewer/{reviewer_id}", "POST",
+                           f"/api/v1/applications/{app['id']}/assign-reviewer/{rng.choice(reviewer_ids)}",
+                           headers=headers)
+        await rec.call(client, "GET /admin/summary", "GET", "/api/v1/admin/summary", headers=headers)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_load(args) -> dict:
+    import httpx
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session, sessionmaker
+
+    from app.database import get_db
+    from app.main import app
+    from app.models import Scholarship, User
+    from app.models.user import UserRole
+
+    db_path = Path(tempfile.mkdtemp()) / "load.db"
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False, "timeout": 30})
+    _seed(engine, args.scholarships, args.reviewers, args.admins)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with Session(engine) as db:
+        scholarship_ids = list(db.scalars(select(Scholarship.id)))
+        reviewer_ids = list(db.scalars(select(User.id).where(User.role == UserRole.REVIEWER)))
+
+    server = thread = None
+    if args.transport == "uvicorn":
+        import uvicorn
+
+        port = _free_port()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            await asyncio.sleep(0.05)
+        client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60)
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load.test", timeout=60)
+
+    rec = Recorder()
+    rng = random.Random(args.seed)
+    try:
+        async with client:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *[applicant_flow(rec, client, i, args.iterations, scholarship_ids, random.Random(rng.random()))
+                  for i in range(args.applicants)],
+                *[reviewer_flow(rec, client, i, args.iterations, random.Random(rng.random()))
+                  for i in range(args.reviewers)],
+                *[admin_flow(rec, client, i, args.iterations, reviewer_ids, random.Random(rng.random()))
+                  for i in range(args.admins)],
+            )
+            wall = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join(10)
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+    summary = rec.summary(wall)
+    summary["error_examples"] = rec.error_examples
+    return summary
+
+
+def print_report(summary: dict) -> None:
+    print(f"{'route':<62} {'n':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    for route, r in summary["routes"].items():
+        print(f"{route:<62} {r['count']:>5} {r['errors']:>4} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} "
+              f"{r['p99_ms']:>9.2f} {r['rps']:>8.1f}")
+    print(f"\n{summary['requests']} requests in {summary['wall_seconds']:.2f}s "
+          f"= {summary['total_rps']:.1f} req/s, {summary['errors']} errors")
+    for example in summary.get("error_examples", []):
+        print(f"  error: {example}")
+
+
+def compare(summary: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> List[str]:
+    """Regressions against `baseline`; small absolute changes are ignored as noise."""
+    problems = []
+    for route, base in baseline.get("routes", {}).items():
+        current = summary["routes"].get(route)
+        if current is None:
+            continue
+        limit = base["p95_ms"] * (1 + tolerance)
+        if current["p95_ms"] > limit and current["p95_ms"] - base["p95_ms"] > min_delta_ms:
+            problems.append(f"{route}: p95 {current['p95_ms']:.2f} ms > {base['p95_ms']:.2f} ms baseline (+{tolerance:.0%})")
+    base_rps = baseline.get("total_rps")
+    if base_rps and summary["total_rps"] < base_rps * (1 - tolerance):
+        problems.append(f"throughput {summary['total_rps']:.1f} req/s < {base_rps:.1f} req/s baseline (-{tolerance:.0%})")
+    if summary["errors"]:
+        problems.append(f"{summary['errors']} requests failed")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end load test with a regression gate.")
+    parser.add_argument("--applicants", type=int, default=20)
+    parser.add_argument("--reviewers", type=int, default=4)
+    parser.add_argument("--admins", type=int, default=1)
+    parser.add_argument("--scholarships", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=5, help="workflow loops per simulated user")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4,
+                        help="cost for register/login (raise to production cost to include hashing)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative regression (0.5 = 50%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="ignore p95 changes smaller than this")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    _configure_env(args.bcrypt_rounds)
+    summary = asyncio.run(run_load(args))
+    summary["config"] = {k: getattr(args, k) for k in
+                         ("applicants", "reviewers", "admins", "scholarships", "iterations", "transport",
+                          "bcrypt_rounds", "seed")}
+    print_report(summary)
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({k: v for k, v in summary.items() if k != "error_examples"}, indent=2)
+                                 + "\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"\nno baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("config") != summary["config"]:
+        print("\nwarning: baseline was recorded with a different configuration")
+    problems = compare(summary, baseline, args.tolerance, args.min_delta_ms)
+    if problems:
+        print("\nREGRESSIONS:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Overhead of MetricsMiddleware.
+
+Calls a bare FastAPI app in-process (raw ASGI, no HTTP client in the way)
+with a trivial route under an include_router prefix, with and without the
+middleware, and reports the per-request difference.
+
+    cd backend
+    python -m benchmarks.bench_metrics --requests 20000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import APIRouter, FastAPI
+
+from app.core.metrics import MetricsMiddleware, MetricsRegistry
+
+
+def _build_app(with_metrics: bool) -> FastAPI:
+    router = APIRouter(prefix="/items")
+
+    @router.get("/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware, registry=MetricsRegistry())
+    return app
+
+
+async def _drive(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/api/v1/items/{i}",
+            "raw_path": f"/api/v1/items/{i}".encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 1234),
+            "server": ("bench", 80),
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for label, with_metrics in (("baseline", False), ("metrics", True)):
+        app = _build_app(with_metrics)
+        asyncio.run(_drive(app, 500))  # warm up routing and the middleware stack
+        best = min(asyncio.run(_drive(app, args.requests)) for _ in range(args.rounds))
+        results[label] = best / args.requests * 1e6
+        print(f"{label:<9} {results[label]:8.2f} us/request  ({args.requests / best:9.0f} req/s)")
+
+    overhead = results["metrics"] - results["baseline"]
+    print(f"overhead  {overhead:8.2f} us/request  ({overhead / results['baseline'] * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+List serialization cost per row.
+
+Fills an in-memory database with the synthetic dataset generator and times
+turning N applications / scholarships into a JSON body, query included:
+
+  orm+response_model    ORM rows validated from attributes, then dump_json
+                        (what a response_model list route did before)
+  orm+orjson_default    same, but as with default_response_class=ORJSONResponse:
+                        dump to Python, then orjson.dumps
+  core+typeadapter      Core row tuples -> cached TypedDict TypeAdapter dump_json
+  core+orjson           Core row tuples -> orjson.dumps (used when installed)
+  core query only       the Core select by itself, for reference
+
+and finally GET /api/v1/applications/ through the app, which uses the row path.
+
+    cd backend
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --rows 1000,10000,50000
+"""
+import argparse
+import os
+import time
+from datetime import date
+from typing import Callable, List
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("NOTIFICATION_RETENTION_INTERVAL_SECONDS", "0")
+os.environ.setdefault("NOTIFICATION_DIGEST_TICK_SECONDS", "0")
+os.environ.setdefault("DEADLINE_REMINDER_INTERVAL_SECONDS", "0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.cli.generate_dataset import DatasetSpec, generate_dataset  # noqa: E402
+from app.core import serialization  # noqa: E402
+from app.core.serialization import row_adapter, schema_columns, schema_fields  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Application, Scholarship  # noqa: E402
+from app.schemas import ApplicationRead, ScholarshipRead  # noqa: E402
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def cases(Session, model, schema, limit: int):
+    adapter = TypeAdapter(List[schema])
+    fields = schema_fields(schema)
+    core = select(*schema_columns(schema, model)).limit(limit)
+
+    def orm_rows(db):
+        return db.query(model).limit(limit).all()
+
+    def orm_response_model():
+        with Session() as db:
+            return adapter.dump_json(adapter.validate_python(orm_rows(db), from_attributes=True))
+
+    def orm_orjson_default():
+        with Session() as db:
+            data = adapter.dump_python(adapter.validate_python(orm_rows(db), from_attributes=True), mode="json")
+            return serialization.orjson.dumps(data)
+
+    def core_rows():
+        with Session() as db:
+            return db.execute(core).all()
+
+    def core_typeadapter():
+        return row_adapter(schema).dump_json([dict(zip(fields, row)) for row in core_rows()])
+
+    def core_orjson():
+        return serialization.orjson.dumps([dict(zip(fields, row)) for row in core_rows()])
+
+    result = {"orm+response_model": orm_response_model}
+    if serialization.orjson is not None:
+        result["orm+orjson_default"] = orm_orjson_default
+    result["core+typeadapter"] = core_typeadapter
+    if serialization.orjson is not None:
+        result["core+orjson"] = core_orjson
+    result["core query only"] = core_rows
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Per-row cost of list serialization paths.")
+    parser.add_argument("--rows", default="1000,10000", help="comma-separated list sizes")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+    sizes = [int(n) for n in args.rows.split(",")]
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    generate_dataset(engine, DatasetSpec(
+        users=max(200, max(sizes) // 10),
+        scholarships=max(sizes),
+        applications=max(sizes),
+        notifications=0,
+        anchor_date=date(2030, 1, 1),
+    ))
+    Session = sessionmaker(bind=engine, autoflush=False)
+    print(f"orjson: {'installed' if serialization.orjson is not None else 'not installed'}")
+
+    for model, schema in ((Application, ApplicationRead), (Scholarship, ScholarshipRead)):
+        for n in sizes:
+            print(f"\n{schema.__name__} x {n:,}")
+            for name, fn in cases(Session, model, schema, n).items():
+                seconds = best_of(fn, args.repeat)
+                print(f"  {name:<22} {seconds * 1000:9.2f} ms  {seconds / n * 1e6:7.2f} us/row")
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        seconds = best_of(lambda: client.get("/api/v1/applications/"), args.repeat)
+    app.dependency_overrides.clear()
+    n = max(sizes)
+    print(f"\nGET /api/v1/applications/ ({n:,} rows)  {seconds * 1000:9.2f} ms  {seconds / n * 1e6:7.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Service-layer micro-benchmarks at several data sizes.
+
+For each size a throwaway SQLite file is filled by the synthetic dataset
+generator (`app.cli.generate_dataset`; size = number of applications, with
+users, scholarships and notifications scaled from it), then each hot
+function is called repeatedly with a fresh Session per call, as a request
+would:
+
+  suitability        evaluate_application_suitability for a random application
+  search             search_scholarships("merit")
+  upsert_review      upsert_review by the assigned reviewer (insert or update)
+  create_application create_application on an open, unrestricted scholarship
+  profile_exists     applicant_profile_exists for a random applicant
+  current_user       bearer token -> get_current_principal -> get_current_user
+  serialize_apps     ApplicationRead list for the busiest reviewer, to JSON
+  serialize_catalog  ScholarshipRead list for the whole catalog, to JSON
+
+The serialization cases load their rows once and time only the Pydantic
+work (validate from attributes, dump, encode, as a response_model does), so they scale with list length; the others should stay roughly flat
+as the tables grow (an index or query regression shows up as a growing
+"x smallest" column).
+
+Results (p50/p95/mean in microseconds, per function and size) are compared
+with `benchmarks/baselines/services.json`; the script exits 1 when a p50
+exceeds its threshold by more than --tolerance (ignoring changes smaller
+than --min-delta-us).
+
+    cd backend
+    python -m benchmarks.bench_services
+    python -m benchmarks.bench_services --sizes 1000,10000 --json results.json
+    python -m benchmarks.bench_services --update-baseline
+
+As with bench_load, thresholds are machine-specific: re-record them on the
+machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "services.json"
+DEFAULT_SIZES = "1000,10000,100000"
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.auth.principal_cache import principal_cache  # noqa: E402
+from app.auth.service import get_current_principal, get_current_user  # noqa: E402
+from app.cli.generate_dataset import DatasetSpec, generate_dataset  # noqa: E402
+from app.core import security  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import ApplicantProfile, Application, Scholarship, User  # noqa: E402
+from app.schemas.application import ApplicationCreate, ApplicationRead  # noqa: E402
+from app.schemas.review import ReviewCreate  # noqa: E402
+from app.schemas.scholarship import ScholarshipRead  # noqa: E402
+from app.services import (  # noqa: E402
+    applicant_profile_exists,
+    create_application,
+    evaluate_application_suitability,
+    list_applications_for_reviewer,
+    list_scholarships,
+    search_scholarships,
+    upsert_review,
+)
+
+
+def spec_for(size: int) -> DatasetSpec:
+    return DatasetSpec(
+        users=max(200, size // 10),
+        scholarships=max(50, size // 100),
+        applications=size,
+        notifications=size // 2,
+        seed=1,
+        anchor_date=date.today(),
+    )
+
+
+def build_cases(Session, rng: random.Random) -> Dict[str, Callable[[], object]]:
+    with Session() as db:
+        app_ids = db.scalars(select(Application.id).order_by(func.random()).limit(500)).all()
+        assigned = db.execute(
+            select(Application.id, Application.reviewer_id)
+            .where(Application.reviewer_id.is_not(None))
+            .limit(500)
+        ).all()
+        applicant_ids = db.scalars(
+            select(ApplicantProfile.user_id).order_by(func.random()).limit(500)
+        ).all()
+        open_scholarship = db.scalar(
+            select(Scholarship.id)
+            .where(
+                Scholarship.deadline >= date.today(),
+                Scholarship.min_gpa.is_(None),
+                Scholarship.required_major.is_(None),
+                Scholarship.required_citizenship.is_(None),
+            )
+            .limit(1)
+        )
+        busiest_reviewer = db.scalar(
+            select(Application.reviewer_id)
+            .where(Application.reviewer_id.is_not(None))
+            .group_by(Application.reviewer_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+        user = db.get(User, applicant_ids[0])
+        token = security.create_access_token(user.id, role=user.role.value)
+        reviewer_apps = list_applications_for_reviewer(db, busiest_reviewer)
+        catalog = list_scholarships(db)
+        db.expunge_all()
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def suitability():
+        with Session() as db:
+            return evaluate_application_suitability(db, rng.choice(app_ids))
+
+    def search():
+        with Session() as db:
+            return search_scholarships(db, "merit")
+
+    def review():
+        application_id, reviewer_id = rng.choice(assigned)
+        with Session() as db:
+            return upsert_review(
+                db, application_id,
+                ReviewCreate(reviewer_id=reviewer_id, score=rng.randrange(100), status="in_review"),
+            )
+
+    def apply():
+        with Session() as db:
+            return create_application(
+                db, ApplicationCreate(user_id=rng.choice(applicant_ids), scholarship_id=open_scholarship)
+            )
+
+    def profile_exists():
+        with Session() as db:
+            return applicant_profile_exists(db, rng.choice(applicant_ids))
+
+    def current_user():
+        with Session() as db:
+            return get_current_user(get_current_principal(credentials, db), db)
+
+    def serialize_apps():
+        return json.dumps([ApplicationRead.model_validate(a, from_attributes=True).model_dump(mode="json") for a in reviewer_apps])
+
+    def serialize_catalog():
+        return json.dumps([ScholarshipRead.model_validate(s, from_attributes=True).model_dump(mode="json") for s in catalog])
+
+    cases = {
+        "suitability": suitability,
+        "search": search,
+        "upsert_review": review,
+        "create_application": apply,
+        "profile_exists": profile_exists,
+        "current_user": current_user,
+        "serialize_apps": serialize_apps,
+        "serialize_catalog": serialize_catalog,
+    }
+    if open_scholarship is None:
+        del cases["create_application"]
+    return cases
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "p50_us": round(samples[len(samples) // 2], 1),
+        "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+        "mean_us": round(sum(samples) / len(samples), 1),
+    }
+
+
+def run_size(size: int, iterations: int, warmup: int, only: Optional[Set[str]] = None) -> Dict[str, dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench_services.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        generate_dataset(engine, spec_for(size))
+        print(f"size {size:,}: dataset generated in {time.perf_counter() - started:.1f}s", flush=True)
+
+        principal_cache.clear()
+        Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        results = {}
+        for name, fn in build_cases(Session, random.Random(size)).items():
+            if only is None or name in only:
+                results[name] = measure(fn, iterations, warmup)
+        engine.dispose()
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, dict]], sizes: List[int]) -> None:
+    smallest = str(sizes[0])
+    print(f"\n{'function':<20} {'size':>9} {'p50 us':>10} {'p95 us':>10} {'mean us':>10} {'x smallest':>11}")
+    for name, by_size in results.items():
+        base = by_size.get(smallest, {}).get("p50_us")
+        for size in sizes:
+            r = by_size.get(str(size))
+            if r is None:
+                continue
+            growth = f"{r['p50_us'] / base:.2f}" if base else "-"
+            print(f"{name:<20} {size:>9,} {r['p50_us']:>10.1f} {r['p95_us']:>10.1f} {r['mean_us']:>10.1f} {growth:>11}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_us: float) -> List[str]:
+    """p50 regressions against `baseline`; small absolute changes are ignored as noise."""
+    problems = []
+    for name, by_size in baseline.get("results", {}).items():
+        for size, base in by_size.items():
+            current = results.get(name, {}).get(size)
+            if current is None:
+                continue
+            if current["p50_us"] > base["p50_us"] * (1 + tolerance) and current["p50_us"] - base["p50_us"] > min_delta_us:
+                problems.append(
+                    f"{name} @ {int(size):,}: p50 {current['p50_us']:.1f} us > {base['p50_us']:.1f} us "
+                    f"threshold (+{tolerance:.0%})"
+                )
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Service-layer micro-benchmarks with regression thresholds.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated application counts")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", help="comma-separated function names to run")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative regression (0.5 = 50%%)")
+    parser.add_argument("--min-delta-us", type=float, default=50.0, help="ignore p50 changes smaller than this")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    only = set(args.only.split(",")) if args.only else None
+    results: Dict[str, Dict[str, dict]] = {}
+    for size in sizes:
+        for name, r in run_size(size, args.iterations, args.warmup, only).items():
+            results.setdefault(name, {})[str(size)] = r
+
+    print_report(results, sizes)
+    summary = {
+        "config": {"sizes": sizes, "iterations": args.iterations, "bcrypt_rounds": security.BCRYPT_ROUNDS},
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(summary, indent=2) + "\n")
+        print(f"\nthresholds written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"\nno thresholds at {args.baseline}; run with --update-baseline to record them")
+        return 0
+
+    problems = compare(results, json.loads(args.baseline.read_text()), args.tolerance, args.min_delta_us)
+    if problems:
+        print("\nREGRESSIONS:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print("\nno regressions against thresholds")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Throughput benchmark for bulk user import.
+
+Compares the one-at-a-time registration path (lookup + hash + commit per user)
+with `bulk_import_users` at different worker counts, on a throwaway SQLite file.
+
+    cd backend
+    python -m benchmarks.bench_user_import --rows 200 --workers 1 4 8
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.auth import service as auth_service
+from app.auth.schemas import UserCreate
+from app.database import Base
+import app.models  # noqa: F401
+from app.services.user_import_service import bulk_import_users
+
+
+def _rows(n: int, tag: str) -> list[dict]:
+    return [
+        {
+            "email": f"{tag}{i}@bench.example.com",
+            "password": "StrongP@ss1",
+            "first_name": "Bench",
+            "last_name": str(i),
+            "role": "reviewer" if i % 10 == 0 else "applicant",
+        }
+        for i in range(n)
+    ]
+
+
+def _fresh_session(path: str):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+
+        db = _fresh_session(path)
+        start = time.perf_counter()
+        for row in _rows(args.rows, "serial"):
+            asyncio.run(auth_service.create_user(db, UserCreate(**row)))
+        elapsed = time.perf_counter() - start
+        db.close()
+        print(f"register-one-by-one   rows={args.rows:<6} {args.rows / elapsed:8.1f} users/s  ({elapsed:.2f}s)")
+
+        for workers in args.workers:
+            db = _fresh_session(path)
+            start = time.perf_counter()
+            report = bulk_import_users(db, _rows(args.rows, f"w{workers}-"), max_workers=workers)
+            elapsed = time.perf_counter() - start
+            db.close()
+            assert report.created == args.rows, report
+            print(f"bulk-import workers={workers:<3} rows={args.rows:<6} {args.rows / elapsed:8.1f} users/s  ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import sessionmaker
+
+# Ensure app package is importable when running pytest from backend/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Minimum bcrypt cost keeps the suite fast; must be set before app import.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# `with TestClient(app)` runs the lifespan; keep background jobs off the dev database.
+os.environ.setdefault("NOTIFICATION_RETENTION_INTERVAL_SECONDS", "0")
+os.environ.setdefault("NOTIFICATION_DIGEST_TICK_SECONDS", "0")
+os.environ.setdefault("DEADLINE_REMINDER_INTERVAL_SECONDS", "0")
+
+from app.auth.principal_cache import principal_cache  # noqa: E402
+from app.auth.rate_limit import rate_limiter  # noqa: E402
+from app.database import Base, get_db  # noqa: E402
+from app.notifications.hub import notification_hub  # noqa: E402
+from app.notifications.unread_counter import unread_counter  # noqa: E402
+from app.services.catalog_cache import scholarship_catalog  # noqa: E402
+from app.core.metrics import registry as metrics_registry  # noqa: E402
+from app.core.query_stats import add_request_listener, remove_request_listener  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+# Shared in-memory SQLite DB for tests that don't set up their own
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_process_state():
+    # Test databases are recreated per test, so user ids get reused, and every
+    # TestClient request comes from the same address.
+    principal_cache.clear()
+    rate_limiter.reset()
+    notification_hub.reset()
+    unread_counter.invalidate()
+    scholarship_catalog.invalidate()
+    metrics_registry.reset()
+    yield
+    principal_cache.clear()
+    rate_limiter.reset()
+    notification_hub.reset()
+    unread_counter.invalidate()
+    scholarship_catalog.invalidate()
+    metrics_registry.reset()
+
+
+@pytest.fixture
+def db_session():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def register_and_login(client, email, role="applicant", password="StrongP@ss1", first="Test", last="User"):
+    """Register a user with the given role and return an Authorization header."""
+    resp = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": password,
+            "first_name": first,
+            "last_name": last,
+            "role": role,
+        },
+    )
+    assert resp.status_code == 201, resp.text
+    login = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    assert login.status_code == 200, login.text
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def token_headers(user_id, role="applicant"):
+    """An Authorization header for a user created directly in the database."""
+    from app.core.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token(user_id, role=role)}"}
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail if any request made inside the block runs more than `max_queries`
+    SQL statements:
+
+        with query_budget(2):
+            client.get("/api/v1/notifications/user/1/unread-count")
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        seen = []
+
+        def listener(method, route, stats):
+            seen.append((method, route, stats))
+
+        add_request_listener(listener)
+        try:
+            yield seen
+        finally:
+            remove_request_listener(listener)
+        over = [
+            f"{method} {route}: {stats.count} queries (budget {max_queries})\n"
+            + "\n".join(f"  {n} x {shape}" for shape, n in stats.shapes.most_common())
+            for method, route, stats in seen
+            if stats.count > max_queries
+        ]
+        assert not over, "\n".join(over)
+
+    return budget
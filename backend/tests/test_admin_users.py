@@ -0,0 +1,143 @@
+from conftest import register_and_login
+
+
+def _seed(client):
+    admin = register_and_login(client, "admin@example.com", role="engr_admin", first="Ada", last="Admin")
+    for i in range(5):
+        client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": f"rev{i}@example.com",
+                "password": "StrongP@ss1",
+                "first_name": "Rita" if i % 2 else "Ravi",
+                "last_name": f"Reviewer{i}",
+                "role": "reviewer",
+            },
+        )
+    return admin
+
+
+def test_list_users_is_slim_and_paginated(client):
+    headers = _seed(client)
+
+    first = client.get("/api/v1/admin/users", params={"limit": 4}, headers=headers)
+    assert first.status_code == 200, first.text
+    page = first.json()
+    assert len(page["items"]) == 4
+    assert "hashed_password" not in page["items"][0]
+    assert page["next_cursor"] == page["items"][-1]["id"]
+
+    second = client.get(
+        "/api/v1/admin/users",
+        params={"limit": 4, "after_id": page["next_cursor"]},
+        headers=headers,
+    )
+    rest = second.json()
+    assert len(rest["items"]) == 2
+    assert rest["next_cursor"] is None
+    ids = [u["id"] for u in page["items"] + rest["items"]]
+    assert ids == sorted(set(ids))
+
+
+def test_list_users_filters(client):
+    headers = _seed(client)
+
+    by_role = client.get("/api/v1/admin/users", params={"role": "reviewer"}, headers=headers).json()
+    assert len(by_role["items"]) == 5
+
+    by_prefix = client.get("/api/v1/admin/users", params={"email_prefix": "REV1"}, headers=headers).json()
+    assert [u["email"] for u in by_prefix["items"]] == ["rev1@example.com"]
+
+    by_name = client.get("/api/v1/admin/users", params={"q": "rita"}, headers=headers).json()
+    assert {u["email"] for u in by_name["items"]} == {"rev1@example.com", "rev3@example.com"}
+
+    # LIKE wildcards in the search term match literally.
+    for term in ("_", "%", "r_ta"):
+        assert client.get("/api/v1/admin/users", params={"q": term}, headers=headers).json()["items"] == []
+
+    inactive = client.get("/api/v1/admin/users", params={"is_active": False}, headers=headers).json()
+    assert inactive["items"] == []
+
+
+def test_list_users_requires_admin(client):
+    headers = register_and_login(client, "applicant@example.com")
+    resp = client.get("/api/v1/admin/users", headers=headers)
+    assert resp.status_code == 403
+
+
+def test_import_users_csv_reports_per_row_errors(client):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    body = "\n".join(
+        [
+            "email,password,first_name,last_name,role",
+            "new1@example.com,StrongP@ss1,New,One,reviewer",
+            "NEW1@example.com,StrongP@ss1,Dup,InFile,applicant",
+            "admin@example.com,StrongP@ss1,Already,There,applicant",
+            "not-an-email,StrongP@ss1,Bad,Email,applicant",
+            "new2@example.com,weak,Weak,Password,applicant",
+            "new3@example.com,StrongP@ss1,,,",
+        ]
+    )
+    resp = client.post(
+        "/api/v1/admin/users/import",
+        params={"format": "csv"},
+        content=body,
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200, resp.text
+    report = resp.json()
+    assert report["total_rows"] == 6
+    assert report["created"] == 2
+    assert report["skipped_existing"] == 1
+    assert report["failed"] == 3
+    assert [e["row"] for e in report["errors"]] == [2, 3, 4, 5]
+
+    users = client.get("/api/v1/admin/users", params={"email_prefix": "new"}, headers=headers).json()
+    assert {(u["email"], u["role"]) for u in users["items"]} == {
+        ("new1@example.com", "reviewer"),
+        ("new3@example.com", "applicant"),
+    }
+    login = client.post("/api/v1/auth/login", json={"email": "new3@example.com", "password": "StrongP@ss1"})
+    assert login.status_code == 200
+
+
+def test_import_users_ndjson_uses_process_pool(db_session):
+    from app.services.user_import_service import bulk_import_users, parse_user_rows, shutdown_hash_pools
+
+    rows = parse_user_rows(
+        '{"email": "a@example.com", "password": "StrongP@ss1"}\n'
+        "not json\n"
+        '{"email": "b@example.com", "password": "StrongP@ss1", "role": "steward"}\n'
+        '{"email": 5, "password": "StrongP@ss1"}\n',
+        "ndjson",
+    )
+    try:
+        report = bulk_import_users(db_session, rows, max_workers=2, min_pool_batch=0)
+    finally:
+        shutdown_hash_pools()
+    assert report.created == 2
+    assert [(e.row, e.email) for e in report.errors] == [(2, None), (4, None)]
+
+
+def test_import_conflict_fails_only_its_own_row(db_session, monkeypatch):
+    from app.models import User
+    from app.services import user_import_service
+    from app.services.user_import_service import bulk_import_users, parse_user_rows
+
+    original = user_import_service.hash_passwords
+
+    def register_during_hashing(*args, **kwargs):
+        # A registration commits after the existing-email check but before the insert.
+        db_session.add(User(email="b@example.com", hashed_password="x"))
+        db_session.commit()
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(user_import_service, "hash_passwords", register_during_hashing)
+    rows = parse_user_rows(
+        "".join(f'{{"email": "{e}@example.com", "password": "StrongP@ss1"}}\n' for e in "abc"), "ndjson"
+    )
+    report = bulk_import_users(db_session, rows)
+
+    assert (report.created, report.skipped_existing, report.failed) == (2, 1, 0)
+    assert [(e.row, e.email, e.error) for e in report.errors] == [(2, "b@example.com", "Email already registered")]
+    assert {email for (email,) in db_session.query(User.email)} == {"a@example.com", "b@example.com", "c@example.com"}
@@ -0,0 +1,121 @@
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from conftest import engine
+from app.core.coherence import MAX_ENTRIES_PER_WRITE, CacheCoherence, CacheCoherenceMiddleware, cache_coherence
+from app.models import ChangeLogEntry, Notification, User
+from app.models.user import UserRole
+from app.schemas import ScholarshipCreate
+from app.schemas.notification import NotificationBroadcast
+from app.services import broadcast_notification, create_scholarship, mark_notifications_read
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    """The app's own coherence singleton, switched on, as the writing worker."""
+    monkeypatch.setattr(cache_coherence, "enabled", True)
+    monkeypatch.setattr(cache_coherence, "origin", "worker-a")
+    return cache_coherence
+
+
+@pytest.fixture
+def reader():
+    """Another worker: records which invalidations it was asked to run."""
+    readers = []
+
+    def make(origin="worker-b"):
+        seen = []
+        coherence = CacheCoherence(enabled=True, interval_seconds=0, retention_seconds=3600, origin=origin)
+        for entity in ("scholarship", "user", "notification"):
+            coherence.register(entity, lambda entity_id, entity=entity: seen.append((entity, entity_id)))
+        coherence.check(engine)  # first check: start from the current end of the log
+        seen.clear()
+        readers.append(coherence)
+        return coherence, seen
+
+    yield make
+    for coherence in readers:
+        coherence.close()
+
+
+def test_other_workers_apply_committed_changes(writer, reader, db_session):
+    other, seen = reader()
+    own, own_seen = reader(origin="worker-a")
+
+    create_scholarship(db_session, ScholarshipCreate(name="Fund", description="d", amount=1, deadline=date(2030, 1, 1)))
+    db_session.add(User(id=7, email="u@example.com", hashed_password="x", role=UserRole.APPLICANT))
+    db_session.add(Notification(user_id=7, message="hi"))
+    db_session.commit()
+    mark_notifications_read(db_session, 7)
+
+    assert other.check(engine) == 2
+    assert seen == [("scholarship", None), ("notification", 7)]
+    # The writing worker updated its caches directly and skips its own entries.
+    assert own.check(engine) == 0
+    assert own_seen == []
+    assert other.check(engine) == 0
+
+
+def test_nothing_is_logged_when_disabled(db_session):
+    assert not cache_coherence.enabled
+    create_scholarship(db_session, ScholarshipCreate(name="Fund", description="d", amount=1, deadline=date(2030, 1, 1)))
+    assert db_session.query(ChangeLogEntry).count() == 0
+
+
+def test_large_fan_out_is_one_entry(writer, reader, db_session):
+    other, seen = reader()
+    user_ids = list(range(1, MAX_ENTRIES_PER_WRITE + 2))
+    db_session.add_all([User(id=i, email=f"u{i}@example.com", hashed_password="x") for i in user_ids])
+    db_session.commit()
+    broadcast_notification(db_session, NotificationBroadcast(target="users", user_ids=user_ids, message="hi"))
+
+    assert db_session.query(ChangeLogEntry).count() == 1
+    other.check(engine)
+    assert seen == [("notification", None)]
+
+
+def test_rolled_back_writes_are_not_seen(writer, reader, db_session):
+    other, seen = reader()
+    writer.record(db_session, "scholarship", 1)
+    db_session.rollback()
+    assert other.check(engine) == 0
+
+
+def test_stale_worker_drops_everything_and_log_is_pruned(reader, db_session):
+    other, seen = reader()
+    db_session.add(ChangeLogEntry(entity="user", entity_id=1, origin="worker-c",
+                                  created_at=datetime.utcnow() - timedelta(hours=2)))
+    db_session.commit()
+
+    # Not checked for longer than the retention: entries may be gone, so flush all.
+    other._last_check -= other.retention + 1
+    other.check(engine)
+    assert sorted(seen) == [("notification", None), ("scholarship", None), ("user", None)]
+
+    # Checking never writes; pruning (on the lifespan's thread) deletes the old entry.
+    assert db_session.query(ChangeLogEntry).count() == 1
+    assert other.prune(engine) == 1
+    assert db_session.query(ChangeLogEntry).count() == 0
+
+
+def test_middleware_checks_off_the_event_loop(monkeypatch):
+    coherence = CacheCoherence(enabled=True, interval_seconds=0, retention_seconds=3600)
+    threads = {}
+    monkeypatch.setattr(coherence, "check", lambda engine: threads.setdefault("check", threading.get_ident()))
+
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        threads["loop"] = threading.get_ident()
+        return {}
+
+    app.add_middleware(CacheCoherenceMiddleware, coherence=coherence, engine=engine)
+    with TestClient(app) as client:
+        client.get("/")
+    assert threads["check"] != threads["loop"]
+    coherence.close()
@@ -0,0 +1,149 @@
+import gzip
+import json
+import zlib
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate
+from app.models import Scholarship
+from app.services.catalog_cache import scholarship_catalog
+
+
+def _raw_get(client, url, encoding="gzip", **kwargs):
+    """GET without httpx's transparent decoding, so the wire bytes can be checked."""
+    with client.stream("GET", url, headers={"Accept-Encoding": encoding, **kwargs.pop("headers", {})}, **kwargs) as resp:
+        return resp, b"".join(resp.iter_raw())
+
+
+def _seed_catalog(db, count=20):
+    db.add_all(
+        Scholarship(
+            name=f"Fund {i}",
+            description="Long description of eligibility and award terms. " * 10,
+            amount=1000 + i,
+            deadline=date(2030, 1, 1),
+        )
+        for i in range(count)
+    )
+    db.commit()
+
+
+def test_negotiate_honours_q_values():
+    assert negotiate("gzip, deflate", ["zstd", "br", "gzip"]) == "gzip"
+    assert negotiate("br;q=0.5, gzip;q=0.8", ["zstd", "br", "gzip"]) == "gzip"
+    assert negotiate("br, gzip", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("*", ["zstd", "br", "gzip"]) == "zstd"
+    assert negotiate("gzip;q=0, *;q=0.1", ["gzip"]) is None
+    assert negotiate("identity", ["gzip"]) is None
+    assert negotiate(None) is None
+
+
+def test_small_and_uncompressible_responses_pass_through():
+    mini = FastAPI()
+
+    @mini.get("/small")
+    def small():
+        return PlainTextResponse("x" * 100)
+
+    @mini.get("/large")
+    def large():
+        return PlainTextResponse("x" * 5000)
+
+    @mini.get("/binary")
+    def binary():
+        return PlainTextResponse("x" * 5000, media_type="application/octet-stream")
+
+    client = TestClient(CompressionMiddleware(mini, minimum_size=1024))
+    resp, body = _raw_get(client, "/small")
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert body == b"x" * 100
+
+    resp, body = _raw_get(client, "/large")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert int(resp.headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == b"x" * 5000
+
+    resp, body = _raw_get(client, "/binary")
+    assert "content-encoding" not in resp.headers
+
+    resp, body = _raw_get(client, "/large", encoding="identity")
+    assert "content-encoding" not in resp.headers
+
+
+def test_streaming_response_is_flushed_per_chunk():
+    mini = FastAPI()
+
+    def rows():
+        for i in range(3):
+            yield f"row {i}\n"
+
+    @mini.get("/stream")
+    def stream():
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    sent = []
+
+    async def app(scope, receive, send):
+        async def record(message):
+            sent.append(message)
+            await send(message)
+
+        await CompressionMiddleware(mini)(scope, receive, record)
+
+    resp, body = _raw_get(TestClient(app), "/stream")
+
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "content-length" not in resp.headers
+    assert gzip.decompress(body) == b"row 0\nrow 1\nrow 2\n"
+    # Each chunk ends at a sync flush point, so it can be decoded as soon as it arrives.
+    chunks = [m["body"] for m in sent if m["type"] == "http.response.body" and m.get("more_body")]
+    decoder = zlib.decompressobj(31)
+    assert [decoder.decompress(c) for c in chunks] == [b"row 0\n", b"row 1\n", b"row 2\n"]
+
+
+def test_catalog_is_served_precompressed_once(client, db_session, monkeypatch):
+    _seed_catalog(db_session)
+    calls = []
+    real = compression.compress_bytes
+
+    def counting(data, encoding):
+        calls.append(encoding)
+        return real(data, encoding)
+
+    monkeypatch.setattr("app.services.catalog_cache.compress_bytes", counting)
+
+    first, body = _raw_get(client, "/api/v1/scholarships/")
+    second, again = _raw_get(client, "/api/v1/scholarships/")
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert body == again
+    assert calls == ["gzip"]
+    catalog = json.loads(gzip.decompress(body))
+    assert [s["name"] for s in catalog] == [f"Fund {i}" for i in range(20)]
+    assert client.get("/api/v1/scholarships/", headers={"Accept-Encoding": "identity"}).json() == catalog
+
+
+def test_catalog_write_invalidates_cache(client, db_session):
+    _seed_catalog(db_session, count=2)
+    assert len(client.get("/api/v1/scholarships/").json()) == 2
+
+    created = client.post(
+        "/api/v1/scholarships/",
+        json={"name": "New Fund", "description": "d", "amount": 5, "deadline": "2030-01-01"},
+    ).json()
+    assert [s["name"] for s in client.get("/api/v1/scholarships/").json()][-1] == "New Fund"
+
+    client.delete(f"/api/v1/scholarships/{created['id']}")
+    assert len(client.get("/api/v1/scholarships/").json()) == 2
+    assert len(json.loads(scholarship_catalog.get(lambda: (b"[]", "")).body)) == 2
+
+
+def test_app_compresses_large_json(client):
+    resp, body = _raw_get(client, "/openapi.json")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body))["info"]["title"] == "UMSAMS Backend"
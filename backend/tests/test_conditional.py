@@ -0,0 +1,176 @@
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, inspect, text
+
+from conftest import register_and_login, token_headers
+from app.core.conditional import http_date, weak_etag, _etag_matches
+from app.database import upgrade_schema
+from app.models import Application, Notification, Scholarship, User
+from app.models.user import UserRole
+from app.notifications.retention import archive_notifications
+
+
+def _seed(db):
+    user = User(email="stu@example.com", hashed_password="x", role=UserRole.APPLICANT)
+    db.add(user)
+    db.add_all([
+        Scholarship(name="Merit Award", description="For merit", amount=1000, deadline=date(2030, 5, 1)),
+        Scholarship(name="Need", description="Need-based", amount=500, deadline=date(2030, 6, 1)),
+    ])
+    db.flush()
+    app_obj = Application(user_id=user.id, scholarship_id=1)
+    db.add(app_obj)
+    db.add_all([Notification(user_id=user.id, message=f"n{i}") for i in range(3)])
+    db.commit()
+    return user.id, app_obj.id
+
+
+def test_etag_comparison_is_weak():
+    tag = weak_etag(3, None)
+    assert tag.startswith('W/"')
+    assert _etag_matches(tag, tag)
+    assert _etag_matches(tag[2:], tag)
+    assert _etag_matches(f'W/"other", {tag}', tag)
+    assert _etag_matches("*", tag)
+    assert not _etag_matches(weak_etag(4, None), tag)
+
+
+def test_catalog_revalidates_without_queries(client, db_session, query_budget):
+    _seed(db_session)
+    first = client.get("/api/v1/scholarships/")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    with query_budget(0):
+        resp = client.get("/api/v1/scholarships/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    client.put("/api/v1/scholarships/1", json={"amount": 2000})
+    changed = client.get("/api/v1/scholarships/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()[0]["amount"] == 2000
+
+
+def test_search_answers_304_from_version_query_only(client, db_session, query_budget):
+    _seed(db_session)
+    etag = client.get("/api/v1/scholarships/search", params={"keyword": "merit"}).headers["etag"]
+
+    with query_budget(1):
+        resp = client.get("/api/v1/scholarships/search", params={"keyword": "merit"}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    # A different filter is a different collection.
+    other = client.get("/api/v1/scholarships/search", params={"keyword": "need"}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+    client.delete("/api/v1/scholarships/1")
+    resp = client.get("/api/v1/scholarships/search", params={"keyword": "merit"}, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+
+def test_application_list_and_row_validators(client, db_session):
+    user_id, app_id = _seed(db_session)
+    listing = client.get(f"/api/v1/applications/by-user/{user_id}")
+    one = client.get(f"/api/v1/applications/{app_id}")
+    list_etag, row_etag = listing.headers["etag"], one.headers["etag"]
+    last_modified = one.headers["last-modified"]
+
+    assert client.get(f"/api/v1/applications/by-user/{user_id}", headers={"If-None-Match": list_etag}).status_code == 304
+    assert client.get(f"/api/v1/applications/{app_id}", headers={"If-None-Match": row_etag}).status_code == 304
+    assert client.get(f"/api/v1/applications/{app_id}", headers={"If-Modified-Since": last_modified}).status_code == 304
+    # If-None-Match wins over If-Modified-Since.
+    resp = client.get(
+        f"/api/v1/applications/{app_id}",
+        headers={"If-None-Match": '"stale"', "If-Modified-Since": last_modified},
+    )
+    assert resp.status_code == 200
+
+    client.patch(f"/api/v1/applications/{app_id}/status", json={"status": "accepted"})
+    assert client.get(f"/api/v1/applications/by-user/{user_id}", headers={"If-None-Match": list_etag}).status_code == 200
+    resp = client.get(f"/api/v1/applications/{app_id}", headers={"If-None-Match": row_etag})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "accepted"
+
+
+def test_reviews_list_changes_with_upsert(client, db_session):
+    user_id, app_id = _seed(db_session)
+    review = {"reviewer_id": user_id, "score": 70, "status": "in_review"}
+    client.post(f"/api/v1/applications/{app_id}/reviews", json=review)
+    etag = client.get(f"/api/v1/applications/{app_id}/reviews").headers["etag"]
+    assert client.get(f"/api/v1/applications/{app_id}/reviews", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(f"/api/v1/applications/{app_id}/reviews", json={**review, "score": 90})
+    resp = client.get(f"/api/v1/applications/{app_id}/reviews", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()[0]["score"] == 90
+
+
+def test_notification_page_etag_tracks_reads(client, db_session, query_budget):
+    user_id, _ = _seed(db_session)
+    url = f"/api/v1/notifications/user/{user_id}"
+    first = client.get(url, params={"limit": 2})
+    etag = first.headers["etag"]
+    assert [n["message"] for n in first.json()] == ["n2", "n1"]
+
+    with query_budget(1):
+        assert client.get(url, params={"limit": 2}, headers={"If-None-Match": etag}).status_code == 304
+
+    # Marking a notification read (even one off this page) changes the version.
+    client.post(f"{url}/mark-read", params={"ids": [1]}, headers=token_headers(user_id))
+    resp = client.get(url, params={"limit": 2}, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+
+    # So does retention archiving that read notification.
+    archive_notifications(db_session, [1])
+    assert client.get(url, params={"limit": 2}, headers={"If-None-Match": resp.headers["etag"]}).status_code == 200
+
+
+def test_profile_etag_changes_within_the_same_second(client):
+    headers = register_and_login(client, "applicant@example.com")
+    profile = {"student_id": "s123", "netid": "net1", "degree_major": "SFWE", "gpa": 3.5}
+    client.put("/api/v1/applicant/profile/me", json=profile, headers=headers)
+    etag = client.get("/api/v1/applicant/profile/me", headers=headers).headers["etag"]
+    assert client.get("/api/v1/applicant/profile/me", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.put("/api/v1/applicant/profile/me", json={**profile, "gpa": 3.9}, headers=headers)
+    resp = client.get("/api/v1/applicant/profile/me", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["gpa"] == 3.9
+
+
+def test_http_date_is_utc():
+    assert http_date(datetime(2030, 1, 2, 3, 4, 5, 678901)) == "Wed, 02 Jan 2030 03:04:05 GMT"
+
+
+def test_upgrade_schema_adds_scholarship_updated_at(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE scholarships (id INTEGER PRIMARY KEY, name VARCHAR)"))
+        conn.execute(text("INSERT INTO scholarships (name) VALUES ('Old')"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # idempotent
+
+    assert "updated_at" in {c["name"] for c in inspect(engine).get_columns("scholarships")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT updated_at FROM scholarships")).scalar() is not None
+
+
+def test_upgrade_schema_adds_indexes_to_existing_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE notifications (id INTEGER PRIMARY KEY, user_id INTEGER, is_read BOOLEAN)"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # idempotent
+
+    names = {ix["name"] for ix in inspect(engine).get_indexes("notifications")}
+    assert {"ix_notifications_user_read", "ix_notifications_user_id_id"} <= names
+    with engine.connect() as conn:
+        plan = conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT id FROM notifications WHERE user_id = 1 ORDER BY id DESC LIMIT 50")
+        ).all()
+    assert "ix_notifications_user_id_id" in str(plan)
@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+
+from app.models import ApplicantProfile, Application, DeadlineReminder, Notification, Scholarship, User
+from app.models.user import UserRole
+from app.notifications.reminders import send_deadline_reminders
+
+TODAY = date(2030, 3, 1)
+
+
+def _applicant(db, email, gpa=3.5, citizenship="US", major="SFWE", role=UserRole.APPLICANT, active=True):
+    user = User(email=email, hashed_password="x", role=role, is_active=active)
+    db.add(user)
+    db.flush()
+    db.add(
+        ApplicantProfile(
+            user_id=user.id,
+            student_id=email,
+            netid=email,
+            gpa=gpa,
+            citizenship=citizenship,
+            degree_major=major,
+        )
+    )
+    return user.id
+
+
+def _scholarship(db, name, days_left, **requirements):
+    sch = Scholarship(name=name, description="d", amount=1, deadline=TODAY + timedelta(days=days_left), **requirements)
+    db.add(sch)
+    db.flush()
+    return sch.id
+
+
+def test_reminds_only_eligible_non_applicants(db_session):
+    eligible = _applicant(db_session, "ok@example.com")
+    applied = _applicant(db_session, "applied@example.com")
+    low_gpa = _applicant(db_session, "lowgpa@example.com", gpa=2.0)
+    wrong_major = _applicant(db_session, "major@example.com", major="ECE")
+    _applicant(db_session, "inactive@example.com", active=False)
+    _applicant(db_session, "reviewer@example.com", role=UserRole.REVIEWER)
+
+    soon = _scholarship(db_session, "Soon", 3, min_gpa=3.0, required_citizenship="us", required_major="sfwe")
+    _scholarship(db_session, "Later", 10)
+    _scholarship(db_session, "Closed", -1)
+    db_session.add(Application(user_id=applied, scholarship_id=soon))
+    db_session.commit()
+
+    assert send_deadline_reminders(db_session, today=TODAY, lead_days=3) == 1
+
+    notif = db_session.query(Notification).one()
+    assert notif.user_id == eligible
+    assert "Soon" in notif.message and str(TODAY + timedelta(days=3)) in notif.message
+    reminded = {r.user_id for r in db_session.query(DeadlineReminder)}
+    assert reminded == {eligible}
+    assert low_gpa not in reminded and wrong_major not in reminded
+
+
+def test_rerun_is_idempotent(db_session):
+    _applicant(db_session, "a@example.com")
+    _applicant(db_session, "b@example.com", gpa=None)
+    _scholarship(db_session, "Open", 2)
+    db_session.commit()
+
+    assert send_deadline_reminders(db_session, today=TODAY) == 2
+    assert send_deadline_reminders(db_session, today=TODAY) == 0
+    assert send_deadline_reminders(db_session, today=TODAY + timedelta(days=1)) == 0
+    assert db_session.query(Notification).count() == 2
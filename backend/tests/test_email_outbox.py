@@ -0,0 +1,89 @@
+import time
+from datetime import datetime, timedelta
+
+from conftest import TestingSessionLocal, register_and_login
+
+from app.models import EmailOutbox
+from app.notifications.emailer import EmailSender
+from app.notifications.outbox import PRIORITY_HIGH, PRIORITY_BULK, enqueue_email
+from app.notifications.worker import EmailOutboxWorker
+from app.notifications.smtp_standin import SMTPStandIn
+
+
+def test_forgot_password_only_enqueues(client, db_session):
+    register_and_login(client, "reset@example.com")
+    resp = client.post("/api/v1/auth/forgot-password", json={"email": "reset@example.com"})
+    assert resp.status_code == 202
+
+    rows = db_session.query(EmailOutbox).all()
+    assert len(rows) == 1
+    assert rows[0].to_email == "reset@example.com"
+    assert rows[0].priority == PRIORITY_HIGH
+    assert rows[0].status == "pending"
+
+
+def test_worker_sends_priority_first_over_one_connection(db_session):
+    enqueue_email(db_session, "bulk@example.com", "Digest", "...", priority=PRIORITY_BULK)
+    enqueue_email(db_session, "reset@example.com", "Reset", "...", priority=PRIORITY_HIGH)
+
+    with SMTPStandIn() as server:
+        worker = EmailOutboxWorker(
+            TestingSessionLocal,
+            lambda: EmailSender(host="127.0.0.1", port=server.port, use_tls=False, default_sender="a@example.com"),
+        )
+        assert worker.drain() == 2
+        assert server.connections == 1
+        assert b"To: reset@example.com" in server.messages[0]
+
+    db_session.expire_all()
+    assert {row.status for row in db_session.query(EmailOutbox)} == {"sent"}
+
+
+def test_failed_send_is_retried_with_backoff(db_session):
+    enqueue_email(db_session, "x@example.com", "Hi", "...")
+    worker = EmailOutboxWorker(
+        TestingSessionLocal,
+        # Nothing listens on port 9; every send fails to connect.
+        lambda: EmailSender(host="127.0.0.1", port=9, use_tls=False, default_sender="a@example.com"),
+        max_attempts=2,
+        backoff_seconds=60,
+    )
+    worker.drain()
+    row = db_session.query(EmailOutbox).one()
+    assert row.status == "pending" and row.attempts == 1
+    assert row.next_attempt_at > datetime.utcnow()
+    assert row.last_error
+
+    # Make it due again; the second failure exhausts max_attempts.
+    row.next_attempt_at = datetime.utcnow()
+    db_session.commit()
+    worker.drain()
+    db_session.expire_all()
+    assert db_session.query(EmailOutbox).one().status == "failed"
+
+
+def test_running_worker_requeues_stale_claims(db_session):
+    with SMTPStandIn() as server:
+        worker = EmailOutboxWorker(
+            TestingSessionLocal,
+            lambda: EmailSender(host="127.0.0.1", port=server.port, use_tls=False, default_sender="a@example.com"),
+            workers=1,
+            poll_interval=0.01,
+            claim_timeout=0.5,
+        )
+        worker.start()
+        try:
+            # A batch that died part-way in this process left its row in `sending`.
+            entry = enqueue_email(db_session, "stuck@example.com", "Hi", "...", commit=False)
+            entry.status, entry.claimed_by = "sending", "dead-batch"
+            entry.claimed_at = datetime.utcnow() - timedelta(minutes=10)
+            db_session.commit()
+            deadline = time.monotonic() + 5
+            while not server.messages and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            worker.stop()
+        assert b"To: stuck@example.com" in server.messages[0]
+
+    db_session.expire_all()
+    assert db_session.query(EmailOutbox).one().status == "sent"
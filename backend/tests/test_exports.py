@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from datetime import date
+
+from conftest import register_and_login
+
+from app.models import ApplicantProfile, Application, Review, Scholarship, User
+from app.models.user import UserRole
+
+
+def _seed(db):
+    applicant = User(email="stu@example.com", hashed_password="x", role=UserRole.APPLICANT, first_name="Stu")
+    reviewer = User(email="rev@example.com", hashed_password="x", role=UserRole.REVIEWER)
+    sch = Scholarship(name="Engineering Fund", description="d", amount=1000, deadline=date(2030, 1, 1))
+    other = Scholarship(name="Other", description="d", amount=10, deadline=date(2030, 1, 1))
+    db.add_all([applicant, reviewer, sch, other])
+    db.flush()
+    db.add(ApplicantProfile(user_id=applicant.id, student_id="s1", netid="n1", degree_major="CS", gpa=3.5))
+    app_a = Application(user_id=applicant.id, scholarship_id=sch.id, reviewer_id=reviewer.id)
+    app_b = Application(user_id=applicant.id, scholarship_id=other.id)
+    db.add_all([app_a, app_b])
+    db.flush()
+    db.add_all(
+        [
+            Review(application_id=app_a.id, reviewer_id=reviewer.id, score=80),
+            Review(application_id=app_a.id, reviewer_id=applicant.id, score=90),
+        ]
+    )
+    db.commit()
+    return sch.id
+
+
+def test_export_applications_csv(client, db_session):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    scholarship_id = _seed(db_session)
+
+    resp = client.get(
+        "/api/v1/exports/applications",
+        params={"scholarship_id": scholarship_id},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 1
+    assert rows[0]["scholarship_name"] == "Engineering Fund"
+    assert rows[0]["email"] == "stu@example.com"
+    assert rows[0]["degree_major"] == "CS"
+    assert rows[0]["review_count"] == "2"
+    assert float(rows[0]["avg_score"]) == 85.0
+
+
+def test_export_ndjson_and_empty_csv(client, db_session):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    _seed(db_session)
+
+    resp = client.get("/api/v1/exports/reviews", params={"format": "ndjson"}, headers=headers)
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["score"] for line in lines] == [80, 90]
+
+    users = client.get("/api/v1/exports/users", params={"format": "ndjson"}, headers=headers)
+    assert all("hashed_password" not in json.loads(line) for line in users.text.splitlines())
+
+    empty = client.get("/api/v1/exports/applications", params={"scholarship_id": 999}, headers=headers)
+    assert empty.text.strip().startswith("application_id,status")
+
+
+def test_export_requires_admin(client):
+    headers = register_and_login(client, "stu@example.com")
+    assert client.get("/api/v1/exports/users", headers=headers).status_code == 403
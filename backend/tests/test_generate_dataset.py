@@ -0,0 +1,58 @@
+from datetime import date
+
+from sqlalchemy import create_engine, func, select
+
+from app.cli.generate_dataset import DatasetSpec, SYNTHETIC_PASSWORD, generate_dataset
+from app.core.security import verify_password
+from app.database import Base
+from app.models import ApplicantProfile, Application, Notification, Review, User
+from app.models.user import UserRole
+
+SPEC = DatasetSpec(users=300, scholarships=20, applications=2000, notifications=1000, seed=7,
+                   anchor_date=date(2030, 1, 1))
+
+
+def _build():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    counts = generate_dataset(engine, SPEC)
+    return engine, counts
+
+
+def _dump(engine):
+    with engine.connect() as conn:
+        return [
+            conn.execute(select(model).order_by(model.id)).all()
+            for model in (User, ApplicantProfile, Application, Review, Notification)
+        ]
+
+
+def test_generates_requested_counts_with_valid_references():
+    engine, counts = _build()
+    assert counts["applications"] == 2000
+    assert counts["notifications"] == 1000
+    with engine.connect() as conn:
+        roles = dict(conn.execute(select(User.role, func.count()).group_by(User.role)).all())
+        assert set(roles) == set(UserRole)
+        assert roles[UserRole.APPLICANT] == conn.scalar(select(func.count()).select_from(ApplicantProfile))
+        # Every application belongs to an applicant and every review to the assigned reviewer.
+        orphans = conn.scalar(
+            select(func.count()).select_from(Application)
+            .join(User, User.id == Application.user_id)
+            .where(User.role != UserRole.APPLICANT)
+        )
+        assert orphans == 0
+        mismatched = conn.scalar(
+            select(func.count()).select_from(Review)
+            .join(Application, Application.id == Review.application_id)
+            .where(Application.reviewer_id != Review.reviewer_id)
+        )
+        assert mismatched == 0
+        hashed = conn.scalar(select(User.hashed_password).limit(1))
+    assert verify_password(SYNTHETIC_PASSWORD, hashed)
+
+
+def test_same_seed_same_rows():
+    first, _ = _build()
+    second, _ = _build()
+    assert _dump(first) == _dump(second)
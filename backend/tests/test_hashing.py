@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.hashing import HashingBusyError, PasswordHashExecutor
+
+
+def test_executor_runs_and_records_latency():
+    pool = PasswordHashExecutor(max_workers=2, max_queue=0)
+    assert pool.run(lambda a, b: a + b, 2, 3) == 5
+    stats = pool.stats()
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
+    pool.shutdown()
+
+
+def test_executor_rejects_when_full_and_sheds_stale_jobs():
+    pool = PasswordHashExecutor(max_workers=1, max_queue=1, queue_timeout=0.2)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    results = {}
+    first = threading.Thread(target=lambda: results.setdefault("first", pool.run(slow)))
+    first.start()
+    started.wait(5)
+
+    def queued():
+        try:
+            pool.run(lambda: "late")
+        except HashingBusyError as exc:
+            results["second"] = exc
+            results["second_at"] = time.monotonic()
+
+    second = threading.Thread(target=queued)
+    second.start()
+    # Wait until the second job is sitting in the queue, then overflow it.
+    for _ in range(100):
+        if pool.stats()["queue_depth"] == 1:
+            break
+        threading.Event().wait(0.01)
+    with pytest.raises(HashingBusyError):
+        pool.run(lambda: "overflow")
+
+    # The queued caller gives up after queue_timeout, without waiting for the slow job.
+    second.join(5)
+    released_at = time.monotonic()
+    release.set()
+    first.join(5)
+    assert results["second_at"] < released_at
+
+    assert results["first"] == "slow"
+    assert isinstance(results["second"], HashingBusyError)
+    stats = pool.stats()
+    assert stats["rejected"] == 1 and stats["timed_out"] == 1
+    pool.shutdown()
+
+
+def test_async_waiters_hold_no_thread_and_time_out_in_queue():
+    pool = PasswordHashExecutor(max_workers=1, max_queue=2, queue_timeout=0.1)
+    release = threading.Event()
+
+    async def main():
+        blocker = asyncio.ensure_future(pool.run_async(lambda: release.wait(5) and "slow"))
+        await asyncio.sleep(0.01)
+        waiting = [asyncio.ensure_future(pool.run_async(lambda: "late")) for _ in range(2)]
+        results = await asyncio.gather(*waiting, return_exceptions=True)
+        release.set()
+        return await blocker, results
+
+    slow, results = asyncio.run(main())
+    assert slow == "slow"
+    assert all(isinstance(r, HashingBusyError) for r in results)
+    stats = pool.stats()
+    assert stats["timed_out"] == 2 and stats["queue_depth"] == 0
+    # Cancelled jobs gave their slots back.
+    assert asyncio.run(pool.run_async(lambda a: a * 2, 21)) == 42
+    pool.shutdown()
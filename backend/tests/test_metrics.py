@@ -0,0 +1,36 @@
+from conftest import register_and_login
+from app.core.metrics import registry
+
+
+def _samples(text, name):
+    return {
+        line.split(" ")[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith(name + "{")
+    }
+
+
+def test_metrics_are_labelled_by_route_template(client):
+    admin = register_and_login(client, "admin@example.com", role="engr_admin")
+    for user_id in (1, 2, 3):
+        client.get(f"/api/v1/notifications/user/{user_id}/unread-count", headers=admin)
+    client.get("/api/v1/does-not-exist")
+
+    text = client.get("/metrics").text
+
+    route = 'route="/api/v1/notifications/user/{user_id}/unread-count"'
+    totals = _samples(text, "http_requests_total")
+    assert totals[f'http_requests_total{{method="GET",{route},status="200"}}'] == 3
+    assert totals['http_requests_total{method="GET",route="<unmatched>",status="404"}'] == 1
+    assert not any("/user/1/" in key for key in totals)
+
+    buckets = _samples(text, "http_request_duration_seconds_bucket")
+    assert buckets[f'http_request_duration_seconds_bucket{{method="GET",{route},le="+Inf"}}'] == 3
+    sizes = _samples(text, "http_response_size_bytes_sum")
+    assert sizes[f'http_response_size_bytes_sum{{method="GET",{route}}}'] == 3 * len('{"unread":0}')
+
+
+def test_in_flight_returns_to_zero(client):
+    client.get("/api/v1/notifications/user/1")
+    assert registry.in_flight == 0
+    assert all(stats.in_flight == 0 for stats in registry.routes.values())
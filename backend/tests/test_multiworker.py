@@ -0,0 +1,121 @@
+"""
+Cache coherence across real worker processes.
+
+Starts two uvicorn servers on one SQLite file (what `--workers 2` would run,
+but addressable one at a time), warms worker B's caches, writes through
+worker A, and reads back from B. Cache TTLs are an hour, so B only sees
+the writes if change_log coherence invalidates its caches; with coherence
+off the same script observes stale reads, which shows the harness can tell.
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_worker(workdir: Path, coherence: str) -> tuple:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(BACKEND),
+        "CACHE_COHERENCE": coherence,
+        "BCRYPT_ROUNDS": "4",
+        "PRINCIPAL_CACHE_TTL_SECONDS": "3600",
+        "UNREAD_COUNT_TTL_SECONDS": "3600",
+        "SCHOLARSHIP_CATALOG_TTL_SECONDS": "3600",
+        "NOTIFICATION_RETENTION_INTERVAL_SECONDS": "0",
+        "NOTIFICATION_DIGEST_TICK_SECONDS": "0",
+        "DEADLINE_REMINDER_INTERVAL_SECONDS": "0",
+        "SLOW_QUERY_LOG_FILE": "",
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=workdir,  # the app opens ./eduaid.db
+        env=env,
+    )
+    client = httpx.Client(base_url=f"http://127.0.0.1:{port}/api/v1", timeout=10)
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            if client.get("/scholarships/").status_code == 200:
+                return proc, client
+        except httpx.TransportError:
+            pass
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise RuntimeError(f"worker on port {port} did not start")
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def workers(tmp_path):
+    started = []
+
+    def start(coherence: str, count: int = 2):
+        # One at a time: each runs create_all on the shared file at startup.
+        for _ in range(count):
+            started.append(_start_worker(tmp_path, coherence))
+        return [client for _, client in started]
+
+    yield start
+    for proc, client in started:
+        client.close()
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _login(client, email, role):
+    password = "StrongP@ss1"
+    client.post(
+        "/auth/register",
+        json={"email": email, "password": password, "first_name": "T", "last_name": "U", "role": role},
+    ).raise_for_status()
+    login = client.post("/auth/login", json={"email": email, "password": password})
+    login.raise_for_status()
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+@pytest.mark.parametrize("coherence, coherent", [("change_log", True), ("off", False)])
+def test_writes_on_one_worker_reach_the_others(workers, coherence, coherent):
+    a, b = workers(coherence)
+    admin = _login(a, "admin@example.com", "engr_admin")
+    applicant = _login(a, "applicant@example.com", "applicant")
+    applicant_id = a.get("/auth/me", headers=applicant).json()["id"]
+
+    # Warm worker B: catalog, the applicant's principal, their unread count.
+    assert b.get("/scholarships/").json() == []
+    assert b.get("/auth/me", headers=applicant).status_code == 200
+    assert b.get(f"/notifications/user/{applicant_id}/unread-count", headers=admin).json() == {"unread": 0}
+
+    # Write through worker A.
+    a.post(
+        "/scholarships/",
+        json={"name": "New Fund", "description": "d", "amount": 5, "deadline": "2030-01-01"},
+    ).raise_for_status()
+    a.post("/notifications/", json={"user_id": applicant_id, "message": "hello"}).raise_for_status()
+    a.patch(f"/admin/users/{applicant_id}", json={"is_active": False}, headers=admin).raise_for_status()
+
+    catalog = b.get("/scholarships/").json()
+    me = b.get("/auth/me", headers=applicant)
+    unread = b.get(f"/notifications/user/{applicant_id}/unread-count", headers=admin).json()["unread"]
+    if coherent:
+        assert [s["name"] for s in catalog] == ["New Fund"]
+        assert me.status_code == 403
+        assert unread == 1
+    else:
+        assert catalog == []
+        assert me.status_code == 200
+        assert unread == 0
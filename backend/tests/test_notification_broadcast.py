@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from conftest import register_and_login
+
+from app.models import Application, Notification, Scholarship, User
+from app.models.user import UserRole
+from app.notifications.unread_counter import unread_counter
+from app.schemas.notification import NotificationBroadcast
+from app.services import broadcast_notification
+
+
+def _seed(db):
+    applicants = [User(email=f"a{i}@example.com", hashed_password="x", role=UserRole.APPLICANT) for i in range(3)]
+    reviewers = [
+        User(email="r1@example.com", hashed_password="x", role=UserRole.REVIEWER),
+        User(email="r2@example.com", hashed_password="x", role=UserRole.REVIEWER, is_active=False),
+    ]
+    sch = Scholarship(name="S", description="d", amount=1, deadline=date(2030, 1, 1))
+    db.add_all(applicants + reviewers + [sch])
+    db.flush()
+    # a0 applied twice; a2 did not apply.
+    db.add_all(
+        [
+            Application(user_id=applicants[0].id, scholarship_id=sch.id),
+            Application(user_id=applicants[0].id, scholarship_id=sch.id),
+            Application(user_id=applicants[1].id, scholarship_id=sch.id),
+        ]
+    )
+    db.commit()
+    return sch.id, [a.id for a in applicants]
+
+
+def test_broadcast_targets(client, db_session):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    scholarship_id, applicant_ids = _seed(db_session)
+
+    resp = client.post(
+        "/api/v1/notifications/broadcast",
+        json={"message": "Deadline moved", "target": "scholarship_applicants", "scholarship_id": scholarship_id},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    assert resp.json() == {"count": 2}
+
+    resp = client.post(
+        "/api/v1/notifications/broadcast",
+        json={"message": "New cycle", "target": "reviewers"},
+        headers=headers,
+    )
+    assert resp.json() == {"count": 1}
+
+    resp = client.post(
+        "/api/v1/notifications/broadcast",
+        json={"message": "Hi", "target": "users", "user_ids": [applicant_ids[2], applicant_ids[2], 9999]},
+        headers=headers,
+    )
+    assert resp.json() == {"count": 1}  # duplicates and unknown ids are skipped
+
+    messages = {(n.user_id, n.message) for n in db_session.query(Notification)}
+    assert (applicant_ids[0], "Deadline moved") in messages
+    assert (applicant_ids[2], "Deadline moved") not in messages
+    assert len(messages) == 4
+
+
+def test_broadcast_validation_and_auth(client):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    bad = client.post("/api/v1/notifications/broadcast", json={"message": "x", "target": "role"}, headers=headers)
+    assert bad.status_code == 422
+
+    applicant = register_and_login(client, "stu@example.com")
+    denied = client.post(
+        "/api/v1/notifications/broadcast",
+        json={"message": "x", "target": "reviewers"},
+        headers=applicant,
+    )
+    assert denied.status_code == 403
+
+
+def test_failed_broadcast_leaves_unread_counts_alone(db_session, monkeypatch):
+    _, applicant_ids = _seed(db_session)
+    assert unread_counter.get(db_session, applicant_ids[0]) == 0
+
+    def fail():
+        raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(db_session, "commit", fail)
+    payload = NotificationBroadcast(target="users", user_ids=applicant_ids, message="Hi")
+    with pytest.raises(OperationalError):
+        broadcast_notification(db_session, payload)
+    db_session.rollback()
+
+    assert unread_counter.get(db_session, applicant_ids[0]) == 0
@@ -0,0 +1,103 @@
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import TestingSessionLocal
+from app.models import Application, EmailOutbox, Notification, NotificationDigestEvent, Scholarship, User
+from app.models.user import UserRole
+from app.notifications import digest
+from app.notifications.digest import DigestScheduler, flush_digests, queue_digest_event
+from app.services import notify_user
+
+
+def _seed(db, applications=5):
+    reviewer = User(email="rev@example.com", hashed_password="x", role=UserRole.REVIEWER, first_name="Rae")
+    applicant = User(email="app@example.com", hashed_password="x", role=UserRole.APPLICANT)
+    sch = Scholarship(name="S", description="d", amount=1, deadline=date(2030, 1, 1))
+    db.add_all([reviewer, applicant, sch])
+    db.flush()
+    apps = [Application(user_id=applicant.id, scholarship_id=sch.id) for _ in range(applications)]
+    db.add_all(apps)
+    db.commit()
+    return reviewer.id, [a.id for a in apps]
+
+
+@pytest.fixture
+def scheduler():
+    """A running digest scheduler whose timer never fires on its own."""
+    started = []
+
+    def start(window_seconds=300.0):
+        s = DigestScheduler(TestingSessionLocal, window_seconds=window_seconds, tick_seconds=3600, send_email=False)
+        s.start()
+        started.append(s)
+        return s
+
+    yield start
+    for s in started:
+        s.stop()
+
+
+def test_assignments_coalesce_into_one_digest(client, db_session, scheduler):
+    scheduler()
+    reviewer_id, app_ids = _seed(db_session)
+    for app_id in app_ids:
+        assert client.post(f"/api/v1/applications/{app_id}/assign-reviewer/{reviewer_id}").status_code == 200
+
+    assert db_session.query(Notification).count() == 0
+    assert db_session.query(NotificationDigestEvent).count() == 5
+
+    # Window not elapsed yet: nothing goes out.
+    assert flush_digests(db_session, window_seconds=300).users == 0
+
+    report = flush_digests(db_session, window_seconds=300, now=datetime.utcnow() + timedelta(seconds=301))
+    assert (report.users, report.events, report.emails) == (1, 5, 1)
+
+    notifs = db_session.query(Notification).all()
+    assert [n.message for n in notifs] == ["You have been assigned 5 applications to review."]
+    email = db_session.query(EmailOutbox).one()
+    assert email.to_email == "rev@example.com"
+    assert email.body.count("- You have been assigned to review application #") == 5
+
+    # Claimed events are never delivered twice.
+    later = datetime.utcnow() + timedelta(hours=1)
+    assert flush_digests(db_session, window_seconds=300, now=later).events == 0
+
+
+def test_single_event_keeps_its_message(db_session):
+    reviewer_id, _ = _seed(db_session, applications=0)
+    queue_digest_event(db_session, reviewer_id, "Your review is overdue.")
+
+    flush_digests(db_session, window_seconds=0, send_email=False)
+
+    assert [n.message for n in db_session.query(Notification)] == ["Your review is overdue."]
+    assert db_session.query(EmailOutbox).count() == 0
+
+
+def test_notify_user_without_a_running_scheduler(db_session, scheduler):
+    reviewer_id, _ = _seed(db_session, applications=0)
+    assert not digest.batching_active()
+    notify_user(db_session, reviewer_id, "Immediate")
+
+    # A scheduler with no window doesn't batch either.
+    scheduler(window_seconds=0)
+    notify_user(db_session, reviewer_id, "Also immediate")
+
+    assert [n.message for n in db_session.query(Notification)] == ["Immediate", "Also immediate"]
+    assert db_session.query(NotificationDigestEvent).count() == 0
+
+
+def test_queued_event_is_delivered_once_the_window_passes(db_session, scheduler):
+    reviewer_id, _ = _seed(db_session, applications=0)
+    running = scheduler(window_seconds=0.05)
+    notify_user(db_session, reviewer_id, "Batched")
+
+    assert running.flush().events == 0
+    assert db_session.query(Notification).count() == 0
+    time.sleep(0.06)
+    assert running.flush().events == 1
+    assert [n.message for n in db_session.query(Notification)] == ["Batched"]
+
+    running.stop()
+    assert not digest.batching_active()
@@ -0,0 +1,132 @@
+import asyncio
+
+from sqlalchemy import event
+
+from conftest import token_headers
+from app.models import Notification, User
+from app.models.user import UserRole
+from app.notifications.hub import notification_hub
+from app.notifications.unread_counter import unread_counter
+from app.services import mark_notifications_read
+
+
+def _seed(db, count=5):
+    user = User(email="inbox@example.com", hashed_password="x", role=UserRole.REVIEWER)
+    other = User(email="other@example.com", hashed_password="x", role=UserRole.REVIEWER)
+    db.add_all([user, other])
+    db.flush()
+    db.add_all([Notification(user_id=user.id, message=f"n{i}") for i in range(count)])
+    db.add(Notification(user_id=other.id, message="theirs"))
+    db.commit()
+    return user.id, other.id
+
+
+def test_inbox_keyset_pagination(client, db_session):
+    user_id, _ = _seed(db_session)
+
+    first = client.get(f"/api/v1/notifications/user/{user_id}", params={"limit": 2}).json()
+    assert [n["message"] for n in first] == ["n4", "n3"]
+
+    second = client.get(
+        f"/api/v1/notifications/user/{user_id}",
+        params={"limit": 2, "before_id": first[-1]["id"]},
+    ).json()
+    assert [n["message"] for n in second] == ["n2", "n1"]
+
+    last = client.get(
+        f"/api/v1/notifications/user/{user_id}",
+        params={"limit": 2, "before_id": second[-1]["id"]},
+    ).json()
+    assert [n["message"] for n in last] == ["n0"]
+
+
+def test_unread_count_tracks_inserts_and_reads(client, db_session):
+    user_id, other_id = _seed(db_session, count=3)
+    url = f"/api/v1/notifications/user/{user_id}/unread-count"
+    headers = token_headers(user_id, "reviewer")
+
+    assert client.get(url, headers=headers).json() == {"unread": 3}
+    client.post("/api/v1/notifications/", json={"user_id": user_id, "message": "new"})
+    assert client.get(url, headers=headers).json() == {"unread": 4}
+
+    notif_id = client.get(f"/api/v1/notifications/user/{user_id}").json()[0]["id"]
+    client.post(f"/api/v1/notifications/{notif_id}/read")
+    client.post(f"/api/v1/notifications/{notif_id}/read")  # already read: no double count
+    assert client.get(url, headers=headers).json() == {"unread": 3}
+
+    # Served from the cache, consistent with a fresh COUNT.
+    unread_counter.invalidate(user_id)
+    assert client.get(url, headers=headers).json() == {"unread": 3}
+    other_url = f"/api/v1/notifications/user/{other_id}/unread-count"
+    assert client.get(other_url, headers=token_headers(other_id, "reviewer")).json() == {"unread": 1}
+
+
+def test_mark_read_bulk(client, db_session):
+    user_id, other_id = _seed(db_session, count=4)
+    headers = token_headers(user_id, "reviewer")
+    ids = [n["id"] for n in client.get(f"/api/v1/notifications/user/{user_id}").json()]
+    other_notif = db_session.query(Notification).filter(Notification.user_id == other_id).one()
+
+    resp = client.post(
+        f"/api/v1/notifications/user/{user_id}/mark-read",
+        params={"ids": ids[:2] + [other_notif.id]},
+        headers=headers,
+    )
+    assert resp.json() == {"updated": 2}  # someone else's id is ignored
+    url = f"/api/v1/notifications/user/{user_id}/unread-count"
+    assert client.get(url, headers=headers).json() == {"unread": 2}
+
+    resp = client.post(f"/api/v1/notifications/user/{user_id}/mark-all-read", headers=headers)
+    assert resp.json() == {"updated": 2}
+    assert client.get(url, headers=headers).json() == {"unread": 0}
+    other_url = f"/api/v1/notifications/user/{other_id}/unread-count"
+    assert client.get(other_url, headers=token_headers(other_id, "reviewer")).json() == {"unread": 1}
+
+
+def test_inbox_writes_are_limited_to_the_owner_and_admins(client, db_session):
+    user_id, other_id = _seed(db_session, count=2)
+    url = f"/api/v1/notifications/user/{user_id}"
+    intruder = token_headers(other_id, "reviewer")
+
+    assert client.get(f"{url}/unread-count").status_code == 401
+    assert client.get(f"{url}/unread-count", headers=intruder).status_code == 403
+    assert client.post(f"{url}/mark-all-read", headers=intruder).status_code == 403
+    assert client.post(f"{url}/mark-read", params={"ids": [1]}, headers=intruder).status_code == 403
+
+    admin = User(email="admin@example.com", hashed_password="x", role=UserRole.ENGR_ADMIN)
+    db_session.add(admin)
+    db_session.commit()
+    resp = client.post(f"{url}/mark-all-read", headers=token_headers(admin.id, "engr_admin"))
+    assert resp.json() == {"updated": 2}
+
+
+def test_mark_all_read_keeps_a_count_that_lands_after_its_commit(db_session):
+    user_id, _ = _seed(db_session, count=3)
+    assert unread_counter.get(db_session, user_id) == 3
+
+    # Another request's notification commits and is counted right after ours.
+    event.listen(db_session, "after_commit", lambda session: unread_counter.adjust(user_id, 1), once=True)
+    assert mark_notifications_read(db_session, user_id) == 3
+
+    assert unread_counter.get(db_session, user_id) == 1
+
+
+def test_bulk_mark_read_is_pushed_to_streams(db_session):
+    user_id, _ = _seed(db_session, count=3)
+    ids = [n.id for n in db_session.query(Notification).filter(Notification.user_id == user_id)]
+
+    async def scenario():
+        sub = notification_hub.subscribe(user_id)
+        mark_notifications_read(db_session, user_id, ids[:2])
+        mark_notifications_read(db_session, user_id)
+        await asyncio.sleep(0)
+        events = []
+        while not sub.queue.empty():
+            events.append(sub.queue.get_nowait())
+        notification_hub.unsubscribe(sub)
+        return events
+
+    events = asyncio.run(scenario())
+    assert sorted(e.id for e in events[:2]) == ids[:2]
+    assert {e.event for e in events[:2]} == {"read"} and events[0].data["is_read"] is True
+    assert events[2].event == "read_all"
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from conftest import TestingSessionLocal
+from app.models import JobLease, Notification, NotificationArchive, User
+from app.models.user import UserRole
+from app.notifications.retention import (
+    NotificationRetentionJob,
+    archive_read_notifications,
+    cap_inboxes,
+    enable_incremental_vacuum,
+    incremental_vacuum,
+    load_archived_notifications,
+)
+from app.notifications.unread_counter import unread_counter
+
+
+def _user(db, email):
+    user = User(email=email, hashed_password="x", role=UserRole.REVIEWER)
+    db.add(user)
+    db.flush()
+    return user.id
+
+
+def test_archives_old_read_notifications_in_chunks(db_session):
+    user_id = _user(db_session, "old@example.com")
+    old = datetime.utcnow() - timedelta(days=120)
+    db_session.add_all(
+        [Notification(user_id=user_id, message=f"old{i}", is_read=True, created_at=old) for i in range(7)]
+        + [
+            Notification(user_id=user_id, message="old-unread", is_read=False, created_at=old),
+            Notification(user_id=user_id, message="recent", is_read=True),
+        ]
+    )
+    db_session.commit()
+
+    moved = archive_read_notifications(db_session, datetime.utcnow() - timedelta(days=90), chunk_size=3)
+
+    assert moved == 7
+    assert db_session.query(NotificationArchive).count() == 3  # 3 + 3 + 1
+    remaining = {n.message for n in db_session.query(Notification)}
+    assert remaining == {"old-unread", "recent"}
+    archived = load_archived_notifications(db_session, user_id)
+    assert [n["message"] for n in archived] == [f"old{i}" for i in range(7)]
+
+
+def test_cap_keeps_newest_per_user_and_every_unread(db_session):
+    busy = _user(db_session, "busy@example.com")
+    quiet = _user(db_session, "quiet@example.com")
+    # b0 is the oldest but still unread, so the cap leaves it in the inbox.
+    db_session.add_all([Notification(user_id=busy, message=f"b{i}", is_read=i > 0) for i in range(6)])
+    db_session.add_all([Notification(user_id=quiet, message=f"q{i}", is_read=True) for i in range(2)])
+    db_session.commit()
+    unread_counter.get(db_session, busy)
+
+    assert cap_inboxes(db_session, max_per_user=4, chunk_size=1) == 1
+
+    kept = [n.message for n in db_session.query(Notification).filter(Notification.user_id == busy)]
+    assert sorted(kept) == ["b0", "b2", "b3", "b4", "b5"]
+    assert db_session.query(Notification).filter(Notification.user_id == quiet).count() == 2
+    assert unread_counter.get(db_session, busy) == 1
+
+
+def test_only_the_lease_holder_runs_the_job(db_session):
+    first = NotificationRetentionJob(TestingSessionLocal, inbox_max=0, vacuum_pages=0, pause_seconds=0)
+    second = NotificationRetentionJob(TestingSessionLocal, inbox_max=0, vacuum_pages=0, pause_seconds=0)
+
+    assert first.run_if_leased() is not None
+    assert second.run_if_leased() is None
+    assert first.run_if_leased() is not None  # the holder renews
+
+    first.stop()  # releases the lease
+    assert second.run_if_leased() is not None
+    assert first.run_if_leased() is None
+
+    # An expired lease is free for the taking.
+    db_session.query(JobLease).update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    db_session.commit()
+    assert first.run_if_leased() is not None
+
+
+def test_job_run_and_incremental_vacuum(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'retention.db'}")
+    Base.metadata.create_all(bind=engine)
+    assert incremental_vacuum(engine, 100) == 0  # not enabled yet
+    enable_incremental_vacuum(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        user_id = _user(db, "vac@example.com")
+        old = datetime.utcnow() - timedelta(days=200)
+        db.add_all(
+            [Notification(user_id=user_id, message="x" * 500, is_read=True, created_at=old) for _ in range(500)]
+        )
+        db.commit()
+
+    job = NotificationRetentionJob(session_factory, retention_days=90, inbox_max=0, pause_seconds=0)
+    report = job.run_once()
+
+    assert report.archived_aged == 500
+    assert report.vacuumed_pages > 0
+    engine.dispose()
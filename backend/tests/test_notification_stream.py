@@ -0,0 +1,111 @@
+import asyncio
+import threading
+
+from conftest import TestingSessionLocal
+
+from app.models import Notification, User
+from app.notifications.hub import (
+    NotificationEvent,
+    NotificationHub,
+    format_sse,
+    load_backlog,
+    notification_hub,
+    stream_events,
+)
+from app.schemas.notification import NotificationCreate
+from app.services import create_notification
+
+
+def _user(db, email="u@example.com"):
+    user = User(email=email, hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def test_create_notification_is_pushed_to_subscriber(db_session):
+    user_id = _user(db_session)
+
+    async def scenario():
+        sub = notification_hub.subscribe(user_id)
+        frames = stream_events(sub, [], is_disconnected=_never, heartbeat=0.05)
+        assert await frames.__anext__() == "retry: 3000\n\n"
+        # Services run in the threadpool; publish from another thread.
+        writer = threading.Thread(
+            target=create_notification,
+            args=(db_session, NotificationCreate(user_id=user_id, message="Assigned")),
+        )
+        writer.start()
+        frame = await frames.__anext__()
+        while frame.startswith(":"):
+            frame = await frames.__anext__()
+        writer.join()
+        await frames.aclose()
+        return frame
+
+    frame = asyncio.run(scenario())
+    assert frame.startswith("id: ")
+    assert "event: notification" in frame and '"message": "Assigned"' in frame
+    assert notification_hub.subscriber_count() == 0
+
+
+def test_read_events_do_not_move_the_resume_cursor():
+    data = {"id": 3, "user_id": 1, "message": "m", "is_read": True, "created_at": None}
+    read = format_sse(NotificationEvent(id=3, user_id=1, event="read", data=data))
+    assert read.startswith("event: read\n")
+    assert "id:" not in read.split("data:")[0]
+    assert format_sse(NotificationEvent(id=9, user_id=1, event="notification", data=data)).startswith("id: 9\n")
+
+
+def test_heartbeat_and_backlog_resume(db_session):
+    user_id = _user(db_session)
+    for i in range(3):
+        db_session.add(Notification(user_id=user_id, message=f"n{i}"))
+    db_session.commit()
+    first_id = db_session.query(Notification).order_by(Notification.id).first().id
+
+    async def scenario():
+        sub = notification_hub.subscribe(user_id)
+        backlog = load_backlog(db_session, user_id, first_id)
+        frames = stream_events(sub, backlog, is_disconnected=_never, heartbeat=0.01)
+        out = [await frames.__anext__() for _ in range(4)]
+        await frames.aclose()
+        return out
+
+    retry, second, third, ping = asyncio.run(scenario())
+    assert "n1" in second and "n2" in third
+    assert ping == ": ping\n\n"
+
+
+def test_high_water_mark_poll_picks_up_foreign_writes(db_session):
+    user_id = _user(db_session)
+    other_id = _user(db_session, "other@example.com")
+    hub = NotificationHub(poll_seconds=0)
+
+    async def scenario():
+        sub = hub.subscribe(user_id)
+        hub._session_factory = TestingSessionLocal
+        with TestingSessionLocal() as db:
+            hub.prime(db)
+        # Rows written by "another worker" without publishing.
+        db_session.add_all(
+            [Notification(user_id=user_id, message="elsewhere"), Notification(user_id=other_id, message="not mine")]
+        )
+        db_session.commit()
+        assert hub.poll_once() == 1
+        assert hub.poll_once() == 0
+        event = await asyncio.wait_for(sub.queue.get(), 1)
+        hub.unsubscribe(sub)
+        return event
+
+    event = asyncio.run(scenario())
+    assert event.data["message"] == "elsewhere"
+
+
+def test_stream_requires_auth(client):
+    assert client.get("/api/v1/notifications/stream").status_code == 401
+    assert client.get("/api/v1/notifications/stream", params={"access_token": "junk"}).status_code == 401
+
+
+async def _never():
+    return False
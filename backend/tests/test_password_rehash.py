@@ -0,0 +1,50 @@
+import asyncio
+
+from passlib.context import CryptContext
+
+from conftest import register_and_login
+from app.auth import service as auth_service
+from app.core import security
+from app.models import User
+
+
+def test_login_upgrades_outdated_hash(client, db_session, monkeypatch):
+    legacy_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("StrongP@ss1")
+    db_session.add(User(email="old@example.com", hashed_password=legacy_hash))
+    db_session.commit()
+
+    stronger = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5, bcrypt__min_rounds=5)
+    monkeypatch.setattr(security, "pwd_context", stronger)
+
+    resp = client.post("/api/v1/auth/login", json={"email": "old@example.com", "password": "StrongP@ss1"})
+    assert resp.status_code == 200
+
+    db_session.expire_all()
+    upgraded = db_session.query(User).filter(User.email == "old@example.com").one().hashed_password
+    assert upgraded != legacy_hash
+    assert upgraded.startswith("$2b$05$")
+    assert not security.password_needs_rehash(upgraded)
+    assert asyncio.run(auth_service.authenticate_user(db_session, "old@example.com", "StrongP@ss1"))
+
+
+def test_calibration_stays_in_bounds():
+    assert security.calibrate_bcrypt_rounds(0) == security.BCRYPT_MIN_ROUNDS
+    assert security.calibrate_bcrypt_rounds(10**9) == security.BCRYPT_MAX_ROUNDS
+
+
+def test_change_password_round_trip(client):
+    headers = register_and_login(client, "changer@example.com")
+    wrong = client.post(
+        "/api/v1/auth/change-password",
+        json={"current_password": "WrongPass1!", "new_password": "NewStr0ng!"},
+        headers=headers,
+    )
+    assert wrong.status_code == 400
+    resp = client.post(
+        "/api/v1/auth/change-password",
+        json={"current_password": "StrongP@ss1", "new_password": "NewStr0ng!"},
+        headers=headers,
+    )
+    assert resp.status_code == 204, resp.text
+    login = client.post("/api/v1/auth/login", json={"email": "changer@example.com", "password": "NewStr0ng!"})
+    assert login.status_code == 200
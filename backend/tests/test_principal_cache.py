@@ -0,0 +1,47 @@
+from sqlalchemy import event
+
+from conftest import engine, register_and_login
+
+from app.auth.principal_cache import principal_cache
+
+
+def test_role_guard_uses_cached_principal(client):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    assert client.get("/api/v1/auth/require-admin", headers=headers).status_code == 200
+
+    statements = []
+
+    def record(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        resp = client.get("/api/v1/auth/require-admin", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert resp.status_code == 200
+    assert not any("FROM users" in s for s in statements)
+    assert principal_cache.hits >= 1
+
+
+def test_admin_update_invalidates_principal(client):
+    admin = register_and_login(client, "admin@example.com", role="engr_admin")
+    other = register_and_login(client, "other@example.com", role="engr_admin")
+    assert client.get("/api/v1/auth/require-admin", headers=other).status_code == 200
+    other_id = client.get("/api/v1/auth/me", headers=other).json()["id"]
+
+    # Demotion: the cached admin principal is dropped and the old token's role no longer matches.
+    resp = client.patch(f"/api/v1/admin/users/{other_id}", json={"role": "reviewer"}, headers=admin)
+    assert resp.status_code == 200
+    assert "hashed_password" not in resp.json()
+    assert client.get("/api/v1/auth/require-admin", headers=other).status_code == 401
+
+    client.patch(f"/api/v1/admin/users/{other_id}", json={"role": "engr_admin", "is_active": False}, headers=admin)
+    assert client.get("/api/v1/auth/require-admin", headers=other).status_code == 403
+
+
+def test_update_me_refreshes_cached_name(client):
+    headers = register_and_login(client, "admin@example.com", role="engr_admin", first="Old")
+    assert "Old" in client.get("/api/v1/auth/require-admin", headers=headers).json()["message"]
+    client.patch("/api/v1/auth/me", json={"first_name": "New"}, headers=headers)
+    assert "New" in client.get("/api/v1/auth/require-admin", headers=headers).json()["message"]
@@ -0,0 +1,80 @@
+import json
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from conftest import TestingSessionLocal, register_and_login
+from app.core.profiling import ProfilingMiddleware, StackSampler, profile_store, render_collapsed, render_speedscope
+from app.main import app
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampler_renders_collapsed_and_speedscope():
+    sampler = StackSampler(threading.get_ident(), interval=0.001)
+    sampler.start()
+    _spin(0.1)
+    sampler.stop()
+
+    assert sampler.total_samples > 0
+    assert any("_spin (tests/test_profiling.py" in line for line in render_collapsed(sampler).splitlines())
+    doc = json.loads(render_speedscope(sampler, "spin"))
+    assert doc["profiles"][0]["type"] == "sampled"
+    assert any(frame["name"] == "_spin" for frame in doc["shared"]["frames"])
+
+
+def test_admin_header_profiles_request_and_lists_it(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_store, "directory", tmp_path)
+    admin = register_and_login(client, "admin@example.com", role="engr_admin")
+    applicant = register_and_login(client, "applicant@example.com")
+
+    middleware = ProfilingMiddleware(app, store=profile_store, sample_rate=0, session_factory=TestingSessionLocal)
+    with TestClient(middleware) as profiled:
+        plain = profiled.get("/api/v1/scholarships/", headers=admin)
+        ignored = profiled.get("/api/v1/scholarships/", headers={**applicant, "X-Profile": "1"})
+        resp = profiled.get("/api/v1/scholarships/", headers={**admin, "X-Profile": "1"})
+
+    assert "x-profile-id" not in plain.headers
+    assert "x-profile-id" not in ignored.headers
+    profile_id = resp.headers["x-profile-id"]
+
+    listed = client.get("/api/v1/admin/profiles", headers=admin).json()
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["route"] == "/api/v1/scholarships/"
+    assert listed[0]["trigger"] == "header"
+    assert client.get(f"/api/v1/admin/profiles/{profile_id}", headers=admin).status_code == 200
+    assert client.get("/api/v1/admin/profiles/..%2Fsecret", headers=admin).status_code == 404
+    assert client.get("/api/v1/admin/profiles", headers=applicant).status_code == 403
+
+
+def test_demoted_admin_token_no_longer_profiles(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_store, "directory", tmp_path)
+    admin = register_and_login(client, "admin@example.com", role="engr_admin")
+    other = register_and_login(client, "other@example.com", role="engr_admin")
+    admin_id = client.get("/api/v1/auth/me", headers=admin).json()["id"]
+
+    middleware = ProfilingMiddleware(app, store=profile_store, sample_rate=0, session_factory=TestingSessionLocal)
+    with TestClient(middleware) as profiled:
+        client.patch(f"/api/v1/admin/users/{admin_id}", json={"role": "applicant"}, headers=other).raise_for_status()
+        # Still a valid JWT with the engr_admin claim, but the principal says otherwise.
+        resp = profiled.get("/api/v1/scholarships/", headers={**admin, "X-Profile": "1"})
+
+    assert resp.status_code == 200
+    assert "x-profile-id" not in resp.headers
+    assert profile_store.list() == []
+
+
+def test_retention_keeps_newest_profiles(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_store, "directory", tmp_path)
+    monkeypatch.setattr(profile_store, "max_files", 2)
+
+    with TestClient(ProfilingMiddleware(app, store=profile_store, sample_rate=1.0)) as profiled:
+        ids = [profiled.get("/api/v1/scholarships/").headers["x-profile-id"] for _ in range(4)]
+
+    assert [p["id"] for p in profile_store.list()] == sorted(ids, reverse=True)[:2]
+    assert len(list(tmp_path.iterdir())) == 4  # profile + sidecar each
@@ -0,0 +1,79 @@
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from conftest import override_get_db, register_and_login
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.metrics import MetricsRegistry
+from app.core.query_stats import QueryStatsMiddleware, statement_shape
+from app.database import get_db
+from app.models import Notification, User
+from app.models.user import UserRole
+
+
+def test_statement_shape_folds_in_lists():
+    assert statement_shape("SELECT *\n  FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?...)"
+    assert statement_shape("SELECT * FROM t WHERE id IN (?)") == statement_shape("SELECT * FROM t WHERE id IN (?,?)")
+
+
+def _admin(client):
+    """An admin whose principal is already cached, so it costs no queries."""
+    headers = register_and_login(client, "admin@example.com", role="engr_admin")
+    client.get("/api/v1/auth/me", headers=headers)
+    return headers
+
+
+def test_server_timing_header_and_metrics(client, db_session):
+    admin = _admin(client)
+    resp = client.get("/api/v1/notifications/user/1/unread-count", headers=admin)
+    timing = resp.headers["server-timing"]
+    assert timing.startswith("db;dur=") and timing.endswith('desc="1 queries"')
+
+    # Served from the unread counter cache the second time.
+    resp = client.get("/api/v1/notifications/user/1/unread-count", headers=admin)
+    assert resp.headers["server-timing"].endswith('desc="0 queries"')
+
+    metrics = client.get("/metrics").text
+    assert (
+        'http_request_db_queries_total{method="GET",route="/api/v1/notifications/user/{user_id}/unread-count"} 1'
+        in metrics
+    )
+
+
+def test_repeated_statement_flagged_as_n_plus_one(db_session, caplog):
+    users = [User(email=f"u{i}@example.com", hashed_password="x", role=UserRole.REVIEWER) for i in range(6)]
+    db_session.add_all(users)
+    db_session.commit()
+    ids = [u.id for u in users]
+
+    app = FastAPI()
+    registry = MetricsRegistry()
+    app.add_middleware(QueryStatsMiddleware, registry=registry, n_plus_one_threshold=5)
+
+    @app.get("/loop")
+    def loop(db: Session = Depends(get_db)):
+        return [db.scalar(select(User.email).where(User.id == user_id)) for user_id in ids]
+
+    app.dependency_overrides[get_db] = override_get_db
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        TestClient(app).get("/loop")
+
+    assert "Suspected N+1 on GET /loop: 6 x SELECT users.email" in caplog.text
+    assert registry.routes[("GET", "/loop")].n_plus_one == 1
+    assert registry.routes[("GET", "/loop")].db_queries == 6
+
+
+def test_query_budget_fixture(client, db_session, query_budget):
+    db_session.add(Notification(user_id=1, message="hi"))
+    db_session.commit()
+
+    admin = _admin(client)
+    with query_budget(1):
+        client.get("/api/v1/notifications/user/1/unread-count", headers=admin)
+
+    with pytest.raises(AssertionError, match="budget 0"):
+        with query_budget(0):
+            client.get("/api/v1/notifications/user/2/unread-count", headers=admin)
@@ -0,0 +1,58 @@
+from conftest import TestingSessionLocal
+
+from app.auth import service as auth_service
+from app.auth.rate_limit import SlidingWindowCounter, SQLiteWindowCounter
+
+
+def test_sliding_window_counter_blocks_and_recovers():
+    counter = SlidingWindowCounter(limit=3, window_seconds=60)
+    assert [counter.hit("k", now=600.0 + i) for i in range(3)] == [0.0, 0.0, 0.0]
+    retry = counter.hit("k", now=610.0)
+    assert 50 <= retry <= 60 + 60
+    # Other keys are independent.
+    assert counter.hit("other", now=610.0) == 0.0
+    # Two windows later everything has slid out, and the sweep drops stale keys.
+    assert counter.hit("k", now=780.0) == 0.0
+    assert len(counter) == 1
+
+
+def test_sqlite_counter_shares_state_between_instances():
+    a = SQLiteWindowCounter("login_email", 2, 60, TestingSessionLocal)
+    b = SQLiteWindowCounter("login_email", 2, 60, TestingSessionLocal)
+    assert a.hit("x@example.com", now=600.0) == 0.0
+    assert b.hit("x@example.com", now=601.0) == 0.0
+    assert a.hit("x@example.com", now=602.0) > 0
+    b.reset("x@example.com")
+    assert a.hit("x@example.com", now=603.0) == 0.0
+
+
+def test_login_flood_rejected_before_password_check(client, monkeypatch):
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "victim@example.com", "password": "StrongP@ss1", "role": "applicant"},
+    )
+    calls = []
+    original = auth_service.authenticate_user
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(auth_service, "authenticate_user", counting)
+
+    bad = {"email": "victim@example.com", "password": "WrongPass1!"}
+    statuses = [client.post("/api/v1/auth/login", json=bad).status_code for _ in range(6)]
+    assert statuses == [401] * 5 + [429]
+    assert len(calls) == 5
+
+    blocked = client.post("/api/v1/auth/login", json={**bad, "password": "StrongP@ss1"})
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) >= 1
+
+
+def test_forgot_password_rate_limited(client):
+    statuses = [
+        client.post("/api/v1/auth/forgot-password", json={"email": "nobody@example.com"}).status_code
+        for _ in range(4)
+    ]
+    assert statuses == [202, 202, 202, 429]
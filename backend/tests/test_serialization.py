@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.core import serialization
+from app.core.serialization import encode_rows
+from app.models import Application, Scholarship, User
+from app.models.user import UserRole
+from app.schemas import ApplicationRead, ScholarshipRead
+from app.services import list_application_rows, list_scholarship_rows
+
+
+def _seed(db):
+    user = User(email="a@example.com", hashed_password="x", role=UserRole.APPLICANT)
+    db.add(user)
+    db.add_all([
+        Scholarship(name="Merit Award", description="For merit", amount=1000, deadline=date(2030, 5, 1),
+                    min_gpa=3.25, required_major="SFWE", requires_essay=True),
+        Scholarship(name="Need", description="Need-based", amount=500, deadline=date(2030, 6, 1)),
+    ])
+    db.flush()
+    db.add_all([
+        Application(user_id=user.id, scholarship_id=1, essay_text='Quotes " and\nnewlines',
+                    created_at=datetime(2030, 1, 2, 3, 4, 5, 678901)),
+        Application(user_id=user.id, scholarship_id=2, status="in_review", reviewer_id=user.id,
+                    created_at=datetime(2030, 1, 3)),
+    ])
+    db.commit()
+
+
+def _response_model_json(schema, objects):
+    adapter = TypeAdapter(List[schema])
+    return adapter.dump_json(adapter.validate_python(objects, from_attributes=True))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_row_encoding_matches_response_model(db_session, monkeypatch, use_orjson):
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    _seed(db_session)
+
+    scholarships = db_session.query(Scholarship).all()
+    assert encode_rows(ScholarshipRead, list_scholarship_rows(db_session)) == _response_model_json(
+        ScholarshipRead, scholarships
+    )
+    applications = db_session.query(Application).order_by(Application.created_at.desc()).all()
+    assert encode_rows(ApplicationRead, list_application_rows(db_session)) == _response_model_json(
+        ApplicationRead, applications
+    )
+
+
+def test_list_routes_use_row_path(client, db_session):
+    _seed(db_session)
+
+    resp = client.get("/api/v1/scholarships/search", params={"keyword": "MERIT"})
+    assert resp.headers["content-type"] == "application/json"
+    assert [s["name"] for s in resp.json()] == ["Merit Award"]
+    assert len(client.get("/api/v1/scholarships/").json()) == 2
+
+    by_reviewer = client.get("/api/v1/applications/assigned/1").json()
+    assert [a["scholarship_id"] for a in by_reviewer] == [2]
+    assert [a["created_at"] for a in client.get("/api/v1/applications/by-user/1").json()] == [
+        "2030-01-03T00:00:00",
+        "2030-01-02T03:04:05.678901",
+    ]
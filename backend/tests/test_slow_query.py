@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from conftest import engine, register_and_login
+from app.core.slow_query import SlowQueryLog, parameter_shape, slow_query_log
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    """The global log on the test engine, logging every statement (threshold 0)."""
+    log = SlowQueryLog(threshold_ms=0, buffer_size=5, log_file=str(tmp_path / "slow.log"))
+    for attr in ("threshold", "recent", "totals", "_file_logger"):
+        monkeypatch.setattr(slow_query_log, attr, getattr(log, attr))
+    slow_query_log.install(engine)
+    yield tmp_path / "slow.log"
+    slow_query_log.uninstall(engine)
+
+
+def test_parameter_shape_hides_values():
+    assert parameter_shape((1, "secret", None)) == "(int, str, NoneType)"
+    assert parameter_shape([(1,), (2,)], executemany=True) == "2 x (int)"
+    assert parameter_shape({"email": "a@example.com"}) == "{email: str}"
+
+
+def test_slow_statements_logged_with_route_and_one_plan_per_shape(client, installed):
+    admin = register_and_login(client, "admin@example.com", role="engr_admin")
+    for user_id in (1, 2, 3):
+        client.get(f"/api/v1/notifications/user/{user_id}/unread-count", headers=admin)
+
+    entries = slow_query_log.recent_entries(50)
+    assert len(entries) == 5  # ring buffer bound
+    count_entries = [e for e in entries if "count(" in e["statement"].lower()]
+    assert count_entries[0]["route"] == "GET /api/v1/notifications/user/{user_id}/unread-count"
+    assert count_entries[0]["parameters"].startswith("(int")
+
+    lines = [json.loads(line) for line in installed.read_text().splitlines()]
+    count_lines = [line for line in lines if line["statement"] == count_entries[0]["statement"]]
+    assert len(count_lines) == 3
+    assert sum("plan" in line for line in count_lines) == 1
+    assert "ix_notifications_user_read" in count_lines[0]["plan"]
+
+    top = client.get("/api/v1/admin/slow-queries/top?limit=50", headers=admin).json()
+    row = next(t for t in top if t["statement"] == count_entries[0]["statement"])
+    assert row["calls"] == 3 and row["slow_calls"] == 3
+    assert client.get("/api/v1/admin/slow-queries/top?order_by=bogus", headers=admin).status_code == 400
+
+
+def test_plan_failure_does_not_break_the_statement(installed):
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    top = slow_query_log.top(5)
+    assert top[0]["plan"]  # captured (or "unavailable: ...") without raising
@@ -51,9 +51,27 @@ export async function fetchQualifiedByScholarship(
   return res.data as any[];
 }
 
-export async function listUsers(accessToken: string): Promise<AdminUser[]> {
-  const res = await api.get<AdminUser[]>("/admin/users", {
+export type AdminUserPage = {
+  items: AdminUser[];
+  next_cursor: number | null;
+};
+
+export type AdminUserFilters = {
+  limit?: number;
+  after_id?: number;
+  role?: string;
+  is_active?: boolean;
+  email_prefix?: string;
+  q?: string;
+};
+
+export async function listUsers(
+  accessToken: string,
+  filters: AdminUserFilters = {},
+): Promise<AdminUserPage> {
+  const res = await api.get<AdminUserPage>("/admin/users", {
     headers: { Authorization: `Bearer ${accessToken}` },
+    params: filters,
   });
   return res.data;
 }
@@ -1,8 +1,70 @@
-import axios from "axios";
+import axios, { AxiosHeaders } from "axios";
+import type { AxiosResponse, InternalAxiosRequestConfig } from "axios";
 
 // Base API client. Auth header is attached per-request by consumers.
 const api = axios.create({
   baseURL: "http://127.0.0.1:8000/api/v1",
+  // 304 is a successful revalidation; the response interceptor swaps in the cached body.
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+});
+
+// Conditional GET: remember the last 200 body and validators per URL (with its
+// query string and Authorization header) and send them back as If-None-Match /
+// If-Modified-Since, so unchanged lists come back as an empty 304.
+interface CachedResponse {
+  etag?: string;
+  lastModified?: string;
+  data: unknown;
+}
+
+const MAX_CACHED_RESPONSES = 200;
+const conditionalCache = new Map<string, CachedResponse>();
+
+function cacheKey(config: InternalAxiosRequestConfig): string {
+  const auth = AxiosHeaders.from(config.headers).get("Authorization") ?? "";
+  return `${api.getUri(config)} ${String(auth)}`;
+}
+
+function isGet(config: InternalAxiosRequestConfig): boolean {
+  return (config.method ?? "get").toLowerCase() === "get";
+}
+
+api.interceptors.request.use((config) => {
+  if (!isGet(config)) return config;
+  const cached = conditionalCache.get(cacheKey(config));
+  if (cached?.etag) {
+    config.headers.set("If-None-Match", cached.etag);
+  } else if (cached?.lastModified) {
+    config.headers.set("If-Modified-Since", cached.lastModified);
+  }
+  return config;
+});
+
+api.interceptors.response.use((response: AxiosResponse) => {
+  const config = response.config;
+  if (!isGet(config)) return response;
+  const key = cacheKey(config);
+
+  if (response.status === 304) {
+    const cached = conditionalCache.get(key);
+    if (cached) {
+      response.data = cached.data;
+      response.status = 200;
+    }
+    return response;
+  }
+
+  const etag = response.headers["etag"] as string | undefined;
+  const lastModified = response.headers["last-modified"] as string | undefined;
+  conditionalCache.delete(key);
+  if (etag || lastModified) {
+    conditionalCache.set(key, { etag, lastModified, data: response.data });
+    // Map keeps insertion order, so the first key is the least recently stored.
+    if (conditionalCache.size > MAX_CACHED_RESPONSES) {
+      conditionalCache.delete(conditionalCache.keys().next().value as string);
+    }
+  }
+  return response;
 });
 
 export default api;
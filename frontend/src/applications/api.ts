@@ -127,11 +127,34 @@ export interface Notification {
 
 export async function listNotificationsForUser(
   userId: number,
+  options: { limit?: number; beforeId?: number } = {},
 ): Promise<Notification[]> {
-  const res = await api.get(`/notifications/user/${userId}`);
+  const res = await api.get(`/notifications/user/${userId}`, {
+    params: { limit: options.limit ?? 20, before_id: options.beforeId },
+  });
   return res.data as Notification[];
 }
 
+export async function getUnreadNotificationCount(
+  userId: number,
+  accessToken: string,
+): Promise<number> {
+  const res = await api.get(`/notifications/user/${userId}/unread-count`, {
+    headers: { Authorization: `Bearer ${accessToken}` },
+  });
+  return (res.data as { unread: number }).unread;
+}
+
+export async function markAllNotificationsRead(
+  userId: number,
+  accessToken: string,
+): Promise<number> {
+  const res = await api.post(`/notifications/user/${userId}/mark-all-read`, null, {
+    headers: { Authorization: `Bearer ${accessToken}` },
+  });
+  return (res.data as { updated: number }).updated;
+}
+
 export async function markNotificationRead(
   notificationId: number,
 ): Promise<Notification> {
@@ -139,6 +162,27 @@ export async function markNotificationRead(
   return res.data as Notification;
 }
 
+/**
+ * Open a server-sent events stream of the current user's notifications.
+ * EventSource can't send headers, so the access token goes in the query;
+ * the browser resends Last-Event-ID on reconnect. Returns a close function.
+ */
+export function subscribeToNotifications(
+  accessToken: string,
+  onNotification: (n: Notification) => void,
+  lastEventId?: number,
+): () => void {
+  const params = new URLSearchParams({ access_token: accessToken });
+  if (lastEventId !== undefined) params.set("last_event_id", String(lastEventId));
+  const source = new EventSource(
+    `${api.defaults.baseURL}/notifications/stream?${params.toString()}`,
+  );
+  source.addEventListener("notification", (e) => {
+    onNotification(JSON.parse((e as MessageEvent).data) as Notification);
+  });
+  return () => source.close();
+}
+
 // Applicant profile (for reviewer/admin)
 export interface ApplicantProfile {
   id: number;
@@ -5,8 +5,10 @@ import { fetchMe } from "../auth/api";
 import { loadTokens, clearTokens } from "../auth/session";
 import type { User, Tokens } from "../auth/types";
 import {
+  getUnreadNotificationCount,
   listNotificationsForUser,
-  markNotificationRead,
+  markAllNotificationsRead,
+  subscribeToNotifications,
   type Notification,
 } from "../applications/api";
 
@@ -109,14 +111,17 @@ export default function Navbar() {
   // Load reviewer notifications count
   useEffect(() => {
     const loadNotifs = async () => {
-      if (!user || user.role !== "reviewer") {
+      if (!user || user.role !== "reviewer" || !tokens) {
         setNotificationCount(0);
         return;
       }
       try {
-        const data = await listNotificationsForUser(user.id);
+        const [data, unread] = await Promise.all([
+          listNotificationsForUser(user.id),
+          getUnreadNotificationCount(user.id, tokens.accessToken),
+        ]);
         setNotifications(data);
-        setNotificationCount(data.filter((n) => !n.is_read).length);
+        setNotificationCount(unread);
       } catch (err) {
         console.error("Failed to load notifications", err);
         setNotifications([]);
@@ -124,7 +129,26 @@ export default function Navbar() {
       }
     };
     void loadNotifs();
-  }, [user]);
+  }, [user, tokens]);
+
+  // Push new notifications instead of polling
+  useEffect(() => {
+    if (!user || user.role !== "reviewer" || !tokens) return;
+    const lastId = notifications.reduce((max, n) => Math.max(max, n.id), 0);
+    const close = subscribeToNotifications(
+      tokens.accessToken,
+      (incoming) => {
+        setNotifications((prev) =>
+          prev.some((n) => n.id === incoming.id) ? prev : [incoming, ...prev],
+        );
+        if (!incoming.is_read) setNotificationCount((c) => c + 1);
+      },
+      lastId || undefined,
+    );
+    return close;
+    // Re-subscribe only when the session changes; Last-Event-ID covers reconnects.
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [user, tokens]);
 
   return (
     <header className="app-navbar">
@@ -156,12 +180,9 @@ export default function Navbar() {
                     // Mark unread as read when opening
                     if (!showNotifPanel) {
                       void (async () => {
-                        const unread = notifications.filter((n) => !n.is_read);
-                        if (unread.length) {
+                        if (notificationCount > 0 && user && tokens) {
                           try {
-                            await Promise.all(
-                              unread.map((n) => markNotificationRead(n.id)),
-                            );
+                            await markAllNotificationsRead(user.id, tokens.accessToken);
                             setNotifications((prev) =>
                               prev.map((n) => ({ ...n, is_read: true })),
                             );
@@ -16,6 +16,10 @@ export default function AdminUsersPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [editing, setEditing] = useState<Record<number, AdminUser>>({});
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [search, setSearch] = useState("");
+  // The term behind the loaded pages; "Load more" keeps paging it even if the box was edited since.
+  const [committedSearch, setCommittedSearch] = useState("");
 
   useEffect(() => {
     let cancelled = false;
@@ -31,9 +35,10 @@ export default function AdminUsersPage() {
         const me = await fetchMe(tokens.accessToken);
         if (cancelled) return;
         setUser(me);
-        const data = await listUsers(tokens.accessToken);
+        const page = await listUsers(tokens.accessToken);
         if (cancelled) return;
-        setUsers(data);
+        setUsers(page.items);
+        setNextCursor(page.next_cursor);
       } catch (err) {
         if (!cancelled) {
           setError("Failed to load users.");
@@ -49,6 +54,26 @@ export default function AdminUsersPage() {
     };
   }, []);
 
+  const runSearch = async (afterId?: number) => {
+    const tokens = loadTokens();
+    if (!tokens) {
+      setError("Missing session.");
+      return;
+    }
+    const term = afterId ? committedSearch : search.trim();
+    const filters = term.includes("@") || term.includes(".")
+      ? { email_prefix: term }
+      : { q: term || undefined };
+    try {
+      const page = await listUsers(tokens.accessToken, { ...filters, after_id: afterId });
+      setUsers((prev) => (afterId ? [...prev, ...page.items] : page.items));
+      setNextCursor(page.next_cursor);
+      setCommittedSearch(term);
+    } catch (err) {
+      setError("Failed to load users.");
+    }
+  };
+
   const handleField = (id: number, field: keyof AdminUser, value: string | boolean) => {
     setEditing((prev) => ({
       ...prev,
@@ -161,6 +186,24 @@ export default function AdminUsersPage() {
         </div>
         {error && <p className="dashboard-error">{error}</p>}
 
+        <form
+          className="admin-users-search"
+          onSubmit={(e) => {
+            e.preventDefault();
+            void runSearch();
+          }}
+        >
+          <input
+            type="search"
+            placeholder="Search by name or email prefix"
+            value={search}
+            onChange={(e) => setSearch(e.target.value)}
+          />
+          <button type="submit" className="dashboard-button small">
+            Search
+          </button>
+        </form>
+
         {users.length === 0 ? (
           <p>No users found.</p>
         ) : (
@@ -278,6 +321,15 @@ export default function AdminUsersPage() {
             })}
           </ul>
         )}
+        {nextCursor !== null && (
+          <button
+            type="button"
+            className="dashboard-button small"
+            onClick={() => runSearch(nextCursor)}
+          >
+            Load more
+          </button>
+        )}
       </div>
     </div>
   );